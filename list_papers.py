@@ -15,17 +15,16 @@ from src.paper_processor import PaperProcessor
 
 def main():
     """Main function."""
-    processor = PaperProcessor()
-    
-    if len(sys.argv) > 1:
-        try:
-            paper_id = int(sys.argv[1])
-            processor.get_paper_details(paper_id)
-        except ValueError:
-            print("Error: Paper ID must be a number")
-            sys.exit(1)
-    else:
-        processor.list_papers()
+    with PaperProcessor() as processor:
+        if len(sys.argv) > 1:
+            try:
+                paper_id = int(sys.argv[1])
+                processor.get_paper_details(paper_id)
+            except ValueError:
+                print("Error: Paper ID must be a number")
+                sys.exit(1)
+        else:
+            processor.list_papers()
 
 
 if __name__ == "__main__":
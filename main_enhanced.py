@@ -7,6 +7,7 @@ This script provides a command-li            else:
 including full processing, image-only processing, and other selective options.
 """
 
+import logging
 import sys
 import os
 from pathlib import Path
@@ -16,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 # Import the processor with absolute imports
 from src.paper_processor import PaperProcessor
+from src.utils import configure_logging
 
 
 def show_menu():
@@ -55,6 +57,9 @@ def get_paper_file_path():
 
 def main():
     """Main function with enhanced menu system."""
+    # Show extraction progress on the console; raise the level to silence it
+    configure_logging(logging.INFO)
+    
     print("📄 Enhanced Paper Processing System")
     
     while True:
@@ -73,45 +78,45 @@ def main():
                 
                 print(f"📄 Processing paper: {paper_file_path}")
                 
-                # Create processor
-                processor = PaperProcessor()
-                success = False
-                
-                try:
-                    if choice == "1":
-                        # Full processing
-                        print("\n🔄 Starting full paper processing...")
-                        success = processor.process_paper(paper_file_path)
+                # Create processor; its connection is released when the block ends
+                with PaperProcessor() as processor:
+                    success = False
+                    
+                    try:
+                        if choice == "1":
+                            # Full processing
+                            print("\n🔄 Starting full paper processing...")
+                            success = processor.process_paper(paper_file_path)
                         
-                    elif choice == "2":
-                        # Images only
-                        print("\n🖼️  Starting image-only processing...")
-                        success = processor.process_images_only(paper_file_path)
+                        elif choice == "2":
+                            # Images only
+                            print("\n🖼️  Starting image-only processing...")
+                            success = processor.process_images_only(paper_file_path)
                         
-                    elif choice == "3":
-                        # Text sections only (would need implementation)
-                        print("\n📝 Text-only processing not yet implemented.")
-                        print("Please use option 1 (full processing) and select text sections when prompted.")
-                        continue
+                        elif choice == "3":
+                            # Text sections only (would need implementation)
+                            print("\n📝 Text-only processing not yet implemented.")
+                            print("Please use option 1 (full processing) and select text sections when prompted.")
+                            continue
                         
-                    elif choice == "4":
-                        # Tables only (would need implementation)
-                        print("\n📊 Table-only processing not yet implemented.")
-                        print("Please use option 1 (full processing) and select tables when prompted.")
-                        continue
+                        elif choice == "4":
+                            # Tables only (would need implementation)
+                            print("\n📊 Table-only processing not yet implemented.")
+                            print("Please use option 1 (full processing) and select tables when prompted.")
+                            continue
                         
-                    elif choice == "5":
-                        # References only
-                        print("\n📚 Starting references-only processing...")
-                        success = processor.process_references_only(paper_file_path)
+                        elif choice == "5":
+                            # References only
+                            print("\n📚 Starting references-only processing...")
+                            success = processor.process_references_only(paper_file_path)
                     
-                    if success:
-                        print("\n✅ Processing completed successfully!")
-                    else:
-                        print("\n❌ Processing failed!")
+                        if success:
+                            print("\n✅ Processing completed successfully!")
+                        else:
+                            print("\n❌ Processing failed!")
                         
-                except Exception as e:
-                    print(f"\n✗ Fatal error: {e}")
+                    except Exception as e:
+                        print(f"\n✗ Fatal error: {e}")
                 
                 # Ask if user wants to continue
                 continue_choice = input("\nDo you want to process another paper? (y/N): ").strip().lower()
@@ -6,6 +6,7 @@ This script provides a command-line interface to the refactored
 paper processing pipeline.
 """
 
+import logging
 import sys
 import os
 from pathlib import Path
@@ -14,10 +15,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from paper_processor import PaperProcessor
+from utils import configure_logging
 
 
 def main():
     """Main function to run the paper processor."""
+    # Show extraction progress on the console; raise the level to silence it
+    configure_logging(logging.INFO)
+    
     # Default paper file path
     default_paper_path = "/home/gusmmm/Desktop/pgsql_train/docs/zanella_2025-with-images.md"
     
@@ -36,8 +41,8 @@ def main():
     
     try:
         # Create and run processor
-        processor = PaperProcessor()
-        success = processor.process_paper(paper_file_path)
+        with PaperProcessor() as processor:
+            success = processor.process_paper(paper_file_path)
         
         if success:
             sys.exit(0)
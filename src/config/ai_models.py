@@ -25,7 +25,7 @@ Usage:
     all_models = AI_MODELS.get_all_models()
 """
 
-from typing import Dict, Any
+from typing import Dict
 from dataclasses import dataclass, asdict
 
 
@@ -4,15 +4,80 @@ Database connection management using OOP approach.
 This refactors the existing database/dbmanager.py into a cleaner OOP structure.
 """
 
+import atexit
 import os
-import sys
+import re
+import threading
 import time
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 import psycopg2
 from psycopg2 import OperationalError
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from dotenv import load_dotenv
 
+from ..utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Connection pools shared by every DatabaseConnection in the process, keyed by
+# connection parameters. Pools are created on first connect() rather than at
+# import time so importing the package never needs a reachable database.
+_POOLS: Dict[Tuple[str, int, str, str, str], ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Names of the statements already PREPAREd on each connection. Prepared statements
+# live as long as the server session, so this follows the pooled connection
+# rather than the DatabaseConnection that happens to hold it.
+_PREPARED: 'weakref.WeakKeyDictionary[psycopg2.extensions.connection, Set[str]]' = weakref.WeakKeyDictionary()
+
+_PLACEHOLDER_RE = re.compile(r'%\((\w+)\)s|%s')
+
+
+def _close_pools() -> None:
+    """Close every pooled connection; registered to run at interpreter exit."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            if not pool.closed:
+                pool.closeall()
+        _POOLS.clear()
+
+
+atexit.register(_close_pools)
+
+
+@lru_cache(maxsize=128)
+def _to_server_placeholders(sql: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Rewrite psycopg2 placeholders (%s or %(name)s) as PREPARE parameters ($1, $2, ...).
+    
+    Args:
+        sql: Statement using psycopg2 placeholders
+        
+    Returns:
+        Tuple of (statement using $n parameters, parameter names in $n order;
+        empty for positional placeholders)
+    """
+    names: List[str] = []
+    position = 0
+    
+    def replace(match: 're.Match[str]') -> str:
+        nonlocal position
+        name = match.group(1)
+        if name is None:
+            position += 1
+            return f"${position}"
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+    
+    return _PLACEHOLDER_RE.sub(replace, sql), tuple(names)
+
 
 class DatabaseConnection:
     """
@@ -55,6 +120,7 @@ class DatabaseConnection:
         self.password = password or os.getenv("POSTGRES_PASSWORD", "thepassword")
         self.max_retries = int(max_retries or os.getenv("POSTGRES_MAX_RETRIES", 5))
         self.retry_delay = int(retry_delay or os.getenv("POSTGRES_RETRY_DELAY", 2))
+        self.pool_size = int(os.getenv("PG_POOL_SIZE", 8))
         
         self.connection: Optional[psycopg2.extensions.connection] = None
     
@@ -66,9 +132,38 @@ class DatabaseConnection:
         env_path = project_root / '.env'
         load_dotenv(dotenv_path=env_path)
     
+    def _pool_key(self) -> Tuple[str, int, str, str, str]:
+        """Return the key of the shared pool for these connection parameters."""
+        return (self.host, self.port, self.dbname, self.user, self.password)
+    
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """
+        Get the shared connection pool for these connection parameters, creating it if needed.
+        
+        Returns:
+            Thread-safe psycopg2 connection pool
+            
+        Raises:
+            OperationalError: If the pool's first connection cannot be opened
+        """
+        key = self._pool_key()
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None or pool.closed:
+                pool = ThreadedConnectionPool(
+                    1, self.pool_size,
+                    host=self.host,
+                    port=self.port,
+                    dbname=self.dbname,
+                    user=self.user,
+                    password=self.password
+                )
+                _POOLS[key] = pool
+            return pool
+    
     def connect(self) -> psycopg2.extensions.connection:
         """
-        Connect to the PostgreSQL database with retry mechanism.
+        Borrow a connection from the shared pool with retry mechanism.
         
         Returns:
             Database connection object
@@ -80,37 +175,117 @@ class DatabaseConnection:
         
         while retry_count < self.max_retries:
             try:
-                print(f"Attempting to connect to PostgreSQL (Attempt {retry_count + 1}/{self.max_retries})...")
-                self.connection = psycopg2.connect(
-                    host=self.host,
-                    port=self.port,
-                    dbname=self.dbname,
-                    user=self.user,
-                    password=self.password
-                )
-                print("Connection established successfully!")
+                logger.info("Attempting to connect to PostgreSQL (Attempt %s/%s)...", retry_count + 1, self.max_retries)
+                self.connection = self._get_pool().getconn()
+                logger.info("Connection established successfully!")
                 return self.connection
                 
             except OperationalError as e:
                 retry_count += 1
                 if retry_count < self.max_retries:
-                    print(f"Connection failed: {e}")
-                    print(f"Retrying in {self.retry_delay} seconds...")
+                    logger.warning("Connection failed: %s", e)
+                    logger.warning("Retrying in %s seconds...", self.retry_delay)
                     time.sleep(self.retry_delay)
                 else:
-                    print(f"Failed to connect after {self.max_retries} attempts.")
-                    print(f"Error details: {e}")
+                    logger.error("Failed to connect after %s attempts.", self.max_retries)
+                    logger.error("Error details: %s", e)
                     raise Exception("Database connection failed") from e
         
         # This should never be reached, but added for type safety
         raise Exception("Unexpected error in connection retry loop")
     
     def disconnect(self) -> None:
-        """Close the database connection."""
+        """
+        Return the database connection to the shared pool.
+        
+        If the pool is gone, for example because it was closed at interpreter
+        exit, the connection is closed instead; no new pool is created for it.
+        """
         if self.connection:
-            self.connection.close()
+            with _POOLS_LOCK:
+                pool = _POOLS.get(self._pool_key())
+            
+            returned = False
+            if pool is not None and not pool.closed:
+                try:
+                    # The pool rolls back any open transaction and discards broken connections
+                    pool.putconn(self.connection, close=bool(self.connection.closed))
+                    returned = True
+                except PoolError:
+                    # Borrowed from an earlier pool that has since been replaced
+                    pass
+            
+            if returned:
+                logger.info("Database connection returned to pool.")
+            else:
+                if not self.connection.closed:
+                    self.connection.close()
+                logger.info("Database connection closed.")
             self.connection = None
-            print("Database connection closed.")
+    
+    def execute_prepared(self, cursor, name: str, sql: str,
+                         params: Union[Tuple[Any, ...], Dict[str, Any]] = ()) -> None:
+        """
+        Execute a statement through a server-side prepared statement.
+        
+        The statement is PREPAREd the first time it runs on the current connection
+        and then only EXECUTEd, so the server parses and plans it once per session.
+        
+        Args:
+            cursor: Cursor of the current connection
+            name: Prepared statement name, unique per distinct SQL text
+            sql: Statement using psycopg2 placeholders (%s or %(name)s)
+            params: Parameter values, a tuple or a dict matching the placeholders
+        """
+        prepared_sql, names = _to_server_placeholders(sql)
+        if names:
+            params = tuple(params[key] for key in names)
+        
+        prepared = _PREPARED.setdefault(self.connection, set())
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {prepared_sql}")
+            prepared.add(name)
+        
+        if params:
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+    
+    @contextmanager
+    def transaction(self, synchronous_commit: bool = True) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Run a block of statements as one transaction.
+        
+        Commits when the block finishes and rolls back if it raises. Deferrable
+        constraints are checked at commit instead of after every statement.
+        
+        Args:
+            synchronous_commit: Set to False to commit without waiting for the WAL
+                flush (only for this transaction, so pooled connections are unaffected)
+            
+        Yields:
+            The open database connection
+            
+        Raises:
+            Exception: If there is no open connection
+        """
+        if not self.connection:
+            raise Exception("No database connection available")
+        
+        try:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+                if not synchronous_commit:
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
+            finally:
+                cursor.close()
+            
+            yield self.connection
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
     
     def test_connection(self) -> bool:
         """
@@ -5,12 +5,74 @@ This module provides repository pattern implementation for database operations
 related to the currently implemented paper metadata functionality.
 """
 
-from typing import List, Optional, Dict, Any
+import csv
+import io
+import operator
+from typing import Callable, Iterator, List, Optional, Dict, Any, Set
 from datetime import datetime
 import psycopg2
 import psycopg2.extras
 from .connection import DatabaseConnection
 from ..models import PaperMetadata, TextSection, TableData, ImageData, ReferencesData
+from ..utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Text section batches at least this large are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 200
+
+# Image batches at least this large are loaded with COPY instead of INSERT
+IMAGE_COPY_THRESHOLD = 8
+
+
+def _to_pg_array(values: List[str]) -> str:
+    """
+    Format a list of strings as a PostgreSQL TEXT[] literal for COPY input.
+    
+    Args:
+        values: Strings to include in the array
+        
+    Returns:
+        Array literal such as {"a","b"}
+    """
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"') for value in values)
+    return '{' + ','.join(f'"{value}"' for value in escaped) + '}'
+
+
+def _column_names(columns: str) -> List[str]:
+    """
+    Split a comma-separated column list into column names.
+    
+    Args:
+        columns: Column list as used in INSERT and COPY statements
+        
+    Returns:
+        Column names in order
+    """
+    return [column.strip() for column in columns.split(',')]
+
+
+def _replace_column(row: tuple, index: int, value: Any) -> tuple:
+    """Return a copy of a row tuple with the value at one column index replaced."""
+    return row[:index] + (value,) + row[index + 1:]
+
+
+def _row_getter(columns: str) -> Callable[[Any], tuple]:
+    """
+    Build a function that reads a model's values for a column list in one call.
+    
+    The returned operator.attrgetter collects every attribute in C, so batch
+    row assembly does not pay a Python attribute lookup per column per row.
+    
+    Args:
+        columns: Comma-separated column names, matching the model's field names
+        
+    Returns:
+        Function mapping a model instance to a tuple in column order
+    """
+    return operator.attrgetter(*_column_names(columns))
 
 
 class PaperMetadataRepository:
@@ -48,7 +110,7 @@ class PaperMetadataRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_exists_by_doi", f"""
                 SELECT EXISTS(
                     SELECT 1 FROM {self.schema_name}.{self.table_name} 
                     WHERE doi = %s
@@ -74,7 +136,7 @@ class PaperMetadataRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_exists_by_title", f"""
                 SELECT EXISTS(
                     SELECT 1 FROM {self.schema_name}.{self.table_name} 
                     WHERE title = %s
@@ -100,7 +162,7 @@ class PaperMetadataRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_find_by_doi", f"""
                 SELECT id, title, doi FROM {self.schema_name}.{self.table_name} 
                 WHERE doi = %s
             """, (doi,))
@@ -130,7 +192,7 @@ class PaperMetadataRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_find_by_title", f"""
                 SELECT id, title, doi FROM {self.schema_name}.{self.table_name} 
                 WHERE title = %s
             """, (title,))
@@ -145,9 +207,79 @@ class PaperMetadataRepository:
         finally:
             cursor.close()
     
+    def find_by_doi_or_title(self, doi: str, title: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a paper by DOI or by exact title in a single query.
+        
+        Equivalent to find_by_doi followed by find_by_title, but in one round
+        trip: a DOI match is preferred over a title match.
+        
+        Args:
+            doi: Digital Object Identifier
+            title: Paper title
+            
+        Returns:
+            Paper data as dictionary or None if not found
+        """
+        if not self.db_connection.connection:
+            raise Exception("No database connection available")
+            
+        cursor = self.db_connection.connection.cursor()
+        try:
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_find_by_doi_or_title", f"""
+                SELECT id, title, doi FROM {self.schema_name}.{self.table_name} 
+                WHERE doi = %(doi)s OR title = %(title)s
+                ORDER BY (doi = %(doi)s) DESC NULLS LAST
+                LIMIT 1
+            """, {'doi': doi, 'title': title})
+            result = cursor.fetchone()
+            if result:
+                return {
+                    'id': result[0],
+                    'title': result[1],
+                    'doi': result[2] or 'No DOI'
+                }
+            return None
+        finally:
+            cursor.close()
+    
+    def find_existing(self, dois: Set[str], titles: Set[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Find stored papers matching any of several DOIs or exact titles in one query.
+        
+        Args:
+            dois: DOIs to look up
+            titles: Exact titles to look up
+            
+        Returns:
+            Dictionary with 'doi' and 'title' keys, each mapping a matched DOI or
+            title to paper data in the same shape as find_by_doi/find_by_title
+        """
+        if not self.db_connection.connection:
+            raise Exception("No database connection available")
+        
+        existing: Dict[str, Dict[str, Dict[str, Any]]] = {'doi': {}, 'title': {}}
+        if not dois and not titles:
+            return existing
+            
+        cursor = self.db_connection.connection.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT id, title, doi FROM {self.schema_name}.{self.table_name} 
+                WHERE doi = ANY(%s) OR title = ANY(%s)
+            """, (list(dois), list(titles)))
+            for paper_id, title, doi in cursor.fetchall():
+                if doi in dois:
+                    existing['doi'].setdefault(doi, {'id': paper_id, 'title': title, 'doi': doi})
+                if title in titles:
+                    existing['title'].setdefault(title, {'id': paper_id, 'title': title, 'doi': doi or 'No DOI'})
+            return existing
+        finally:
+            cursor.close()
+    
     def save(self, paper_metadata: PaperMetadata) -> bool:
         """
-        Save paper metadata to the database.
+        Save paper metadata to the database, replacing the stored record with the same ID.
         
         Args:
             paper_metadata: PaperMetadata instance to save
@@ -160,7 +292,7 @@ class PaperMetadataRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            # Prepare the INSERT statement
+            # Insert, or overwrite the existing record in the same statement
             insert_sql = f"""
                 INSERT INTO {self.schema_name}.{self.table_name} (
                     id, title, authors, journal, publication_date, doi, volume, issue, pages, 
@@ -174,6 +306,26 @@ class PaperMetadataRepository:
                     %(data_availability)s, %(ethics_approval)s, %(registration_number)s, 
                     %(supplemental_materials)s
                 )
+                ON CONFLICT (id) DO UPDATE SET
+                    title = EXCLUDED.title,
+                    authors = EXCLUDED.authors,
+                    journal = EXCLUDED.journal,
+                    publication_date = EXCLUDED.publication_date,
+                    doi = EXCLUDED.doi,
+                    volume = EXCLUDED.volume,
+                    issue = EXCLUDED.issue,
+                    pages = EXCLUDED.pages,
+                    abstract = EXCLUDED.abstract,
+                    keywords = EXCLUDED.keywords,
+                    source_file = EXCLUDED.source_file,
+                    extracted_at = EXCLUDED.extracted_at,
+                    funding_sources = EXCLUDED.funding_sources,
+                    conflict_of_interest = EXCLUDED.conflict_of_interest,
+                    data_availability = EXCLUDED.data_availability,
+                    ethics_approval = EXCLUDED.ethics_approval,
+                    registration_number = EXCLUDED.registration_number,
+                    supplemental_materials = EXCLUDED.supplemental_materials,
+                    updated_at = CURRENT_TIMESTAMP
             """
             
             # Parse the extracted_at timestamp if it's a string
@@ -226,166 +378,70 @@ class PaperMetadataRepository:
             }
             
             # Execute the insert
-            cursor.execute(insert_sql, data)
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_save", insert_sql, data)
             
-            print(f"✓ Successfully inserted paper metadata into database.")
-            print(f"   Paper ID: {data['id']}")
-            print(f"   Title: {data['title']}")
-            print(f"   DOI: {data['doi'] or 'No DOI'}")
+            logger.info("✓ Successfully saved paper metadata to database.")
+            logger.info("   Paper ID: %s", data['id'])
+            logger.info("   Title: %s", data['title'])
+            logger.info("   DOI: %s", data['doi'] or 'No DOI')
             
             return True
             
         except Exception as e:
-            print(f"✗ Error inserting paper metadata: {e}")
+            logger.error("✗ Error saving paper metadata: %s", e)
             raise
         finally:
             cursor.close()
     
-    def update(self, paper_metadata: PaperMetadata) -> bool:
+    def iter_all_summary(self, page_size: int = 500) -> Iterator[Dict[str, Any]]:
         """
-        Update existing paper metadata in the database.
+        Iterate over all papers in the database, with only the columns shown in a listing.
+        
+        Rows are streamed through a server-side cursor, page_size at a time, so
+        memory use does not grow with the number of papers. Large columns such
+        as the abstract and keywords are not fetched.
         
         Args:
-            paper_metadata: PaperMetadata instance to update
+            page_size: Number of rows fetched from the server per round trip
             
-        Returns:
-            True if successful, False otherwise
+        Yields:
+            Paper summary dictionaries, most recently extracted first
         """
         if not self.db_connection.connection:
             raise Exception("No database connection available")
-            
-        cursor = self.db_connection.connection.cursor()
-        try:
-            # Prepare the UPDATE statement
-            update_sql = f"""
-                UPDATE {self.schema_name}.{self.table_name} SET
-                    title = %(title)s,
-                    authors = %(authors)s,
-                    journal = %(journal)s,
-                    publication_date = %(publication_date)s,
-                    doi = %(doi)s,
-                    volume = %(volume)s,
-                    issue = %(issue)s,
-                    pages = %(pages)s,
-                    abstract = %(abstract)s,
-                    keywords = %(keywords)s,
-                    source_file = %(source_file)s,
-                    extracted_at = %(extracted_at)s,
-                    funding_sources = %(funding_sources)s,
-                    conflict_of_interest = %(conflict_of_interest)s,
-                    data_availability = %(data_availability)s,
-                    ethics_approval = %(ethics_approval)s,
-                    registration_number = %(registration_number)s,
-                    supplemental_materials = %(supplemental_materials)s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = %(id)s
-            """
-            
-            # Parse the extracted_at timestamp if it's a string
-            extracted_at = paper_metadata.extracted_at
-            if isinstance(extracted_at, str):
-                try:
-                    extracted_at_str = str(extracted_at)
-                    extracted_at = datetime.fromisoformat(extracted_at_str.replace('Z', '+00:00'))
-                except:
-                    extracted_at = datetime.now()
-            
-            # Parse publication_date if it's a string
-            publication_date = paper_metadata.publication_date
-            if isinstance(publication_date, str) and publication_date:
-                try:
-                    for fmt in ['%Y-%m-%d', '%Y-%m', '%Y', '%d/%m/%Y', '%m/%d/%Y']:
-                        try:
-                            publication_date = datetime.strptime(publication_date, fmt).date()
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        publication_date = None
-                except:
-                    publication_date = None
-            
-            # Prepare the data for update
-            data = {
-                'id': paper_metadata.id,
-                'title': paper_metadata.title,
-                'authors': paper_metadata.authors,
-                'journal': paper_metadata.journal,
-                'publication_date': publication_date,
-                'doi': paper_metadata.doi,
-                'volume': paper_metadata.volume,
-                'issue': paper_metadata.issue,
-                'pages': paper_metadata.pages,
-                'abstract': paper_metadata.abstract,
-                'keywords': paper_metadata.keywords,
-                'source_file': paper_metadata.source_file,
-                'extracted_at': extracted_at,
-                'funding_sources': paper_metadata.funding_sources,
-                'conflict_of_interest': paper_metadata.conflict_of_interest,
-                'data_availability': paper_metadata.data_availability,
-                'ethics_approval': paper_metadata.ethics_approval,
-                'registration_number': paper_metadata.registration_number,
-                'supplemental_materials': paper_metadata.supplemental_materials
-            }
-            
-            # Execute the update
-            cursor.execute(update_sql, data)
-            
-            if cursor.rowcount > 0:
-                print(f"✓ Paper metadata updated successfully (ID: {paper_metadata.id})")
-                return True
-            else:
-                print(f"✗ No paper found with ID {paper_metadata.id} to update")
-                return False
-                
-        except Exception as e:
-            print(f"✗ Error updating paper metadata: {e}")
-            return False
-        finally:
-            cursor.close()
-
-    def find_all(self) -> List[Dict[str, Any]]:
-        """
-        Find all papers in the database.
         
-        Returns:
-            List of paper data dictionaries
-        """
-        if not self.db_connection.connection:
-            raise Exception("No database connection available")
-            
-        cursor = self.db_connection.connection.cursor()
+        connection = self.db_connection.connection
         try:
-            cursor.execute(f"""
-                SELECT 
-                    id, 
-                    title, 
-                    authors[1:3] as first_authors,  -- Show first 3 authors
-                    journal, 
-                    publication_date, 
-                    doi,
-                    array_length(authors, 1) as total_authors,
-                    extracted_at
-                FROM {self.schema_name}.{self.table_name} 
-                ORDER BY extracted_at DESC
-            """)
-            
-            papers = cursor.fetchall()
-            return [
-                {
-                    'id': paper[0],
-                    'title': paper[1],
-                    'first_authors': paper[2],
-                    'journal': paper[3],
-                    'publication_date': paper[4],
-                    'doi': paper[5],
-                    'total_authors': paper[6],
-                    'extracted_at': paper[7]
-                }
-                for paper in papers
-            ]
+            with connection.cursor(name=f"{self.schema_name}_{self.table_name}_iter_all") as cursor:
+                cursor.itersize = page_size
+                cursor.execute(f"""
+                    SELECT 
+                        id, 
+                        title, 
+                        authors[1:3] as first_authors,  -- Show first 3 authors
+                        journal, 
+                        publication_date, 
+                        doi,
+                        array_length(authors, 1) as total_authors,
+                        extracted_at
+                    FROM {self.schema_name}.{self.table_name} 
+                    ORDER BY extracted_at DESC
+                """)
+                
+                for paper in cursor:
+                    yield {
+                        'id': paper[0],
+                        'title': paper[1],
+                        'first_authors': paper[2],
+                        'journal': paper[3],
+                        'publication_date': paper[4],
+                        'doi': paper[5],
+                        'total_authors': paper[6],
+                        'extracted_at': paper[7]
+                    }
         finally:
-            cursor.close()
+            # A server-side cursor lives in a transaction; end it so the pooled connection is idle
+            connection.rollback()
     
     def find_by_id(self, paper_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -402,7 +458,7 @@ class PaperMetadataRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_find_by_id", f"""
                 SELECT 
                     id, title, authors, journal, publication_date, doi, volume, issue, pages,
                     abstract, keywords, source_file, extracted_at, funding_sources,
@@ -449,19 +505,58 @@ class PaperMetadataRepository:
             source_file: Source file path
             
         Returns:
-            Paper data as dictionary or None if not found
+            Paper identification ({'id', 'title', 'doi'}) or None if not found
         """
         if not self.db_connection.connection:
             raise Exception("No database connection available")
             
-        cursor = self.db_connection.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
-                SELECT * FROM {self.schema_name}.{self.table_name} 
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_find_by_source_file", f"""
+                SELECT id, title, doi FROM {self.schema_name}.{self.table_name} 
                 WHERE source_file = %s
             """, (source_file,))
             result = cursor.fetchone()
-            return dict(result) if result else None
+            if result:
+                return {
+                    'id': result[0],
+                    'title': result[1],
+                    'doi': result[2]
+                }
+            return None
+        finally:
+            cursor.close()
+    
+    def get_existing_data_summary(self, paper_id: int) -> Dict[str, int]:
+        """
+        Count the data stored for a paper in one query.
+        
+        Args:
+            paper_id: Paper ID
+            
+        Returns:
+            Dictionary with 'text_sections', 'tables' and 'images' counts and
+            'references' (1 if a references list is stored, 0 otherwise)
+        """
+        if not self.db_connection.connection:
+            raise Exception("No database connection available")
+            
+        cursor = self.db_connection.connection.cursor()
+        try:
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_data_summary", f"""
+                SELECT
+                    (SELECT count(*) FROM {self.schema_name}.text_sections WHERE paper_id = %(paper_id)s),
+                    (SELECT count(*) FROM {self.schema_name}.table_data WHERE paper_id = %(paper_id)s),
+                    (SELECT count(*) FROM {self.schema_name}.paper_images WHERE paper_id = %(paper_id)s),
+                    EXISTS(SELECT 1 FROM {self.schema_name}.paper_references WHERE paper_id = %(paper_id)s)
+            """, {'paper_id': paper_id})
+            text_sections, tables, images, references = cursor.fetchone()
+            return {
+                'text_sections': text_sections,
+                'tables': tables,
+                'images': images,
+                'references': int(references)
+            }
         finally:
             cursor.close()
 
@@ -474,6 +569,27 @@ class TextSectionsRepository:
     following the repository pattern for clean separation of concerns.
     """
     
+    # Column list and upsert clause shared by the batch save paths
+    _COLUMNS = (
+        "id, paper_id, title, section_number, level, word_count, "
+        "content, summary, keywords, extracted_at"
+    )
+    _ON_CONFLICT = """
+                ON CONFLICT (id) DO UPDATE SET
+                    paper_id = EXCLUDED.paper_id,
+                    title = EXCLUDED.title,
+                    section_number = EXCLUDED.section_number,
+                    level = EXCLUDED.level,
+                    word_count = EXCLUDED.word_count,
+                    content = EXCLUDED.content,
+                    summary = EXCLUDED.summary,
+                    keywords = EXCLUDED.keywords,
+                    extracted_at = EXCLUDED.extracted_at,
+                    updated_at = CURRENT_TIMESTAMP
+    """
+    _ROW = _row_getter(_COLUMNS)
+    _KEYWORDS_INDEX = _column_names(_COLUMNS).index('keywords')
+    
     def __init__(self, db_connection: DatabaseConnection, schema_name: str = 'papers'):
         """
         Initialize the repository.
@@ -530,22 +646,25 @@ class TextSectionsRepository:
                 text_section.word_count,
                 text_section.content,
                 text_section.summary,
-                text_section.keywords,
+                list(text_section.keywords),  # tuples would be adapted as records, not TEXT[]
                 text_section.extracted_at
             ))
             
-            print(f"✓ Text section '{text_section.title}' saved successfully")
+            logger.info("✓ Text section '%s' saved successfully", text_section.title)
             return True
             
         except Exception as e:
-            print(f"✗ Error saving text section '{text_section.title}': {e}")
+            logger.error("✗ Error saving text section '%s': %s", text_section.title, e)
             return False
         finally:
             cursor.close()
 
     def save_all(self, text_sections: List[TextSection]) -> bool:
         """
-        Save multiple text sections to the database.
+        Save multiple text sections to the database with a single multi-row upsert.
+        
+        Batches of COPY_THRESHOLD sections or more are loaded with COPY instead,
+        see copy_all.
         
         Args:
             text_sections: List of TextSection instances to save
@@ -553,26 +672,108 @@ class TextSectionsRepository:
         Returns:
             True if all successful, False otherwise
         """
+        if len(text_sections) >= COPY_THRESHOLD:
+            return self.copy_all(text_sections)
+        
         if not text_sections:
-            print("No text sections to save")
+            logger.info("No text sections to save")
             return True
+        
+        if not self.db_connection.connection:
+            raise Exception("No database connection available")
+        
+        cursor = self.db_connection.connection.cursor()
+        try:
+            insert_sql = f"""
+                INSERT INTO {self.schema_name}.{self.table_name} ({self._COLUMNS})
+                VALUES %s
+                {self._ON_CONFLICT}
+            """
+            
+            # One round-trip per 500 rows instead of one per section
+            psycopg2.extras.execute_values(cursor, insert_sql, self._section_rows(text_sections), page_size=500)
             
+            logger.info("✓ All %s text sections saved successfully", len(text_sections))
+            return True
+                
+        except Exception as e:
+            logger.error("✗ Error saving text sections: %s", e)
+            return False
+        finally:
+            cursor.close()
+
+    def copy_all(self, text_sections: List[TextSection]) -> bool:
+        """
+        Save multiple text sections to the database using COPY.
+        
+        The rows are streamed as CSV into a temporary staging table and then
+        upserted from there, since COPY itself cannot handle conflicts.
+        
+        Args:
+            text_sections: List of TextSection instances to save
+            
+        Returns:
+            True if all successful, False otherwise
+        """
+        if not text_sections:
+            logger.info("No text sections to save")
+            return True
+        
+        if not self.db_connection.connection:
+            raise Exception("No database connection available")
+        
+        cursor = self.db_connection.connection.cursor()
         try:
-            success_count = 0
-            for section in text_sections:
-                if self.save(section):
-                    success_count += 1
-            
-            if success_count == len(text_sections):
-                print(f"✓ All {len(text_sections)} text sections saved successfully")
-                return True
-            else:
-                print(f"✗ Only {success_count}/{len(text_sections)} text sections saved successfully")
-                return False
+            # Serialize the rows once; QUOTE_NOTNULL writes None unquoted, which COPY reads as NULL
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator='\n')
+            for row in self._section_rows(text_sections):
+                writer.writerow(_replace_column(row, self._KEYWORDS_INDEX, _to_pg_array(row[self._KEYWORDS_INDEX])))
+            buffer.seek(0)
+            
+            staging_table = f"{self.schema_name}_{self.table_name}_staging"
+            cursor.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {staging_table}
+                (LIKE {self.schema_name}.{self.table_name} INCLUDING DEFAULTS)
+                ON COMMIT DELETE ROWS
+            """)
+            cursor.execute(f"TRUNCATE {staging_table}")
+            cursor.copy_expert(
+                f"COPY {staging_table} ({self._COLUMNS}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+            
+            cursor.execute(f"""
+                INSERT INTO {self.schema_name}.{self.table_name} ({self._COLUMNS})
+                SELECT {self._COLUMNS} FROM {staging_table}
+                {self._ON_CONFLICT}
+            """)
+            
+            logger.info("✓ All %s text sections copied successfully", len(text_sections))
+            return True
                 
         except Exception as e:
-            print(f"✗ Error saving text sections: {e}")
+            logger.error("✗ Error copying text sections: %s", e)
             return False
+        finally:
+            cursor.close()
+
+    def _section_rows(self, text_sections: List[TextSection]) -> List[tuple]:
+        """
+        Build the column tuples for a batch of text sections.
+        
+        A single INSERT ... ON CONFLICT cannot update the same row twice, so only
+        the last section per ID is kept (as the row-by-row upsert did).
+        
+        Args:
+            text_sections: List of TextSection instances
+            
+        Returns:
+            Rows in _COLUMNS order
+        """
+        rows = {row[0]: row for row in map(self._ROW, text_sections)}
+        # Keywords are tuples, which would be adapted as records, not TEXT[]
+        return [_replace_column(row, self._KEYWORDS_INDEX, list(row[self._KEYWORDS_INDEX])) for row in rows.values()]
 
     def find_by_paper_id(self, paper_id: int) -> List[Dict[str, Any]]:
         """
@@ -616,7 +817,7 @@ class TextSectionsRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_exists_by_paper_id", f"""
                 SELECT EXISTS(
                     SELECT 1 FROM {self.schema_name}.{self.table_name}
                     WHERE paper_id = %s
@@ -644,49 +845,21 @@ class TextSectionsRepository:
             
         cursor = self.db_connection.connection.cursor()
         try:
-            cursor.execute(f"""
+            self.db_connection.execute_prepared(cursor, f"{self.schema_name}_{self.table_name}_delete_by_paper_id", f"""
                 DELETE FROM {self.schema_name}.{self.table_name}
                 WHERE paper_id = %s;
             """, (paper_id,))
             
             deleted_count = cursor.rowcount
-            print(f"✓ Deleted {deleted_count} text sections for paper ID {paper_id}")
+            logger.info("✓ Deleted %s text sections for paper ID %s", deleted_count, paper_id)
             return True
             
         except Exception as e:
-            print(f"✗ Error deleting text sections for paper ID {paper_id}: {e}")
+            logger.error("✗ Error deleting text sections for paper ID %s: %s", paper_id, e)
             return False
         finally:
             cursor.close()
 
-    def count_sections_by_paper_id(self, paper_id: int) -> int:
-        """
-        Count text sections associated with a paper.
-        
-        Args:
-            paper_id: The paper ID to count sections for
-            
-        Returns:
-            Number of text sections for the paper
-        """
-        if not self.db_connection.connection:
-            print("✗ No database connection available")
-            return 0
-        
-        try:
-            cursor = self.db_connection.connection.cursor()
-            
-            count_sql = f"SELECT COUNT(*) FROM {self.schema_name}.{self.table_name} WHERE paper_id = %s"
-            cursor.execute(count_sql, (paper_id,))
-            result = cursor.fetchone()
-            cursor.close()
-            
-            return result[0] if result else 0
-            
-        except Exception as e:
-            print(f"✗ Error counting text sections: {e}")
-            return 0
-
 
 class TableDataRepository:
     """
@@ -697,6 +870,14 @@ class TableDataRepository:
     error handling and transaction management.
     """
     
+    # Column list of the batch save path
+    _COLUMNS = (
+        "id, paper_id, table_number, title, raw_content, summary, context_analysis, "
+        "statistical_findings, keywords, column_count, row_count, extracted_at"
+    )
+    _ROW = _row_getter(_COLUMNS)
+    _KEYWORDS_INDEX = _column_names(_COLUMNS).index('keywords')
+    
     def __init__(self, db_connection: DatabaseConnection, schema_name: str = 'papers'):
         """
         Initialize the table data repository.
@@ -719,7 +900,7 @@ class TableDataRepository:
             Boolean indicating success
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return False
         
         try:
@@ -742,7 +923,7 @@ class TableDataRepository:
                 table_data.summary,
                 table_data.context_analysis,
                 table_data.statistical_findings,
-                table_data.keywords,
+                list(table_data.keywords),  # tuples would be adapted as records, not TEXT[]
                 table_data.column_count,
                 table_data.row_count,
                 table_data.extracted_at
@@ -752,68 +933,78 @@ class TableDataRepository:
             return True
             
         except Exception as e:
-            print(f"✗ Error saving table data: {e}")
+            logger.error("✗ Error saving table data: %s", e)
             return False
     
-    def delete_tables_by_paper_id(self, paper_id: int) -> bool:
+    def save_tables(self, tables: List['TableData']) -> bool:
         """
-        Delete all tables associated with a paper.
+        Save multiple tables to the database with a single multi-row INSERT.
         
         Args:
-            paper_id: The paper ID whose tables should be deleted
+            tables: List of TableData instances to save
             
         Returns:
             Boolean indicating success
         """
+        if not tables:
+            return True
+        
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return False
         
         try:
             cursor = self.db_connection.connection.cursor()
             
-            delete_sql = f"DELETE FROM {self.schema_name}.table_data WHERE paper_id = %s"
-            cursor.execute(delete_sql, (paper_id,))
-            deleted_count = cursor.rowcount
+            insert_sql = f"""
+            INSERT INTO {self.schema_name}.table_data ({self._COLUMNS}) VALUES %s
+            """
             
-            cursor.close()
+            # Keywords are tuples, which would be adapted as records, not TEXT[]
+            rows = [_replace_column(row, self._KEYWORDS_INDEX, list(row[self._KEYWORDS_INDEX]))
+                    for row in map(self._ROW, tables)]
             
-            if deleted_count > 0:
-                print(f"✓ Deleted {deleted_count} tables for paper ID {paper_id}")
+            # One round-trip per 500 rows instead of one per table
+            psycopg2.extras.execute_values(cursor, insert_sql, rows, page_size=500)
             
+            cursor.close()
             return True
             
         except Exception as e:
-            print(f"✗ Error deleting tables: {e}")
+            logger.error("✗ Error saving tables: %s", e)
             return False
     
-    def count_tables_by_paper_id(self, paper_id: int) -> int:
+    def delete_tables_by_paper_id(self, paper_id: int) -> bool:
         """
-        Count tables associated with a paper.
+        Delete all tables associated with a paper.
         
         Args:
-            paper_id: The paper ID to count tables for
+            paper_id: The paper ID whose tables should be deleted
             
         Returns:
-            Number of tables for the paper
+            Boolean indicating success
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
-            return 0
+            logger.error("✗ No database connection available")
+            return False
         
         try:
             cursor = self.db_connection.connection.cursor()
             
-            count_sql = f"SELECT COUNT(*) FROM {self.schema_name}.table_data WHERE paper_id = %s"
-            cursor.execute(count_sql, (paper_id,))
-            result = cursor.fetchone()
+            delete_sql = f"DELETE FROM {self.schema_name}.table_data WHERE paper_id = %s"
+            cursor.execute(delete_sql, (paper_id,))
+            deleted_count = cursor.rowcount
+            
             cursor.close()
             
-            return result[0] if result else 0
+            if deleted_count > 0:
+                logger.info("✓ Deleted %s tables for paper ID %s", deleted_count, paper_id)
+            
+            return True
             
         except Exception as e:
-            print(f"✗ Error counting tables: {e}")
-            return 0
+            logger.error("✗ Error deleting tables: %s", e)
+            return False
     
     def find_tables_by_paper_id(self, paper_id: int) -> List['TableData']:
         """
@@ -826,7 +1017,7 @@ class TableDataRepository:
             List of TableData objects
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return []
         
         try:
@@ -847,18 +1038,19 @@ class TableDataRepository:
             rows = cursor.fetchall()
             cursor.close()
             
+            # Rows were validated on insert, so skip re-validation when rebuilding models
             tables = []
             for row in rows:
-                table_data = TableData(
+                table_data = TableData.for_paper(
+                    row[1],
                     id=row[0],
-                    paper_id=row[1],
                     table_number=row[2],
                     title=row[3],
                     raw_content=row[4],
                     summary=row[5],
                     context_analysis=row[6],
                     statistical_findings=row[7],
-                    keywords=row[8] or [],
+                    keywords=tuple(row[8] or ()),
                     column_count=row[9],
                     row_count=row[10],
                     extracted_at=row[11]
@@ -868,7 +1060,7 @@ class TableDataRepository:
             return tables
             
         except Exception as e:
-            print(f"✗ Error finding tables: {e}")
+            logger.error("✗ Error finding tables: %s", e)
             return []
 
 
@@ -880,6 +1072,14 @@ class ImageRepository:
     following the repository pattern for clean separation of concerns.
     """
     
+    # Column list shared by the batch save paths
+    _COLUMNS = (
+        "id, paper_id, image_number, alt_text, image_format, image_data, summary, "
+        "graphic_analysis, statistical_analysis, contextual_relevance, keywords, extracted_at"
+    )
+    _ROW = _row_getter(_COLUMNS)
+    _KEYWORDS_INDEX = _column_names(_COLUMNS).index('keywords')
+    
     def __init__(self, db_connection: DatabaseConnection, schema_name: str = 'papers'):
         """
         Initialize the repository.
@@ -903,7 +1103,7 @@ class ImageRepository:
             True if successful, False otherwise
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return False
         
         try:
@@ -935,16 +1135,18 @@ class ImageRepository:
             ))
             
             cursor.close()
-            print(f"✓ Image {image_data.image_number} saved to database")
+            logger.info("✓ Image %s saved to database", image_data.image_number)
             return True
             
         except Exception as e:
-            print(f"✗ Error saving image {image_data.image_number}: {e}")
+            logger.error("✗ Error saving image %s: %s", image_data.image_number, e)
             return False
     
     def save_images(self, images: List) -> bool:
         """
-        Save multiple images to the database in a batch operation.
+        Save multiple images to the database with a single multi-row INSERT.
+        
+        Batches of IMAGE_COPY_THRESHOLD images or more are loaded with COPY instead.
         
         Args:
             images: List of ImageData objects to save
@@ -953,122 +1155,127 @@ class ImageRepository:
             True if all successful, False if any failed
         """
         if not images:
-            print("✓ No images to save")
+            logger.info("✓ No images to save")
             return True
         
+        if len(images) >= IMAGE_COPY_THRESHOLD:
+            return self.copy_images(images)
+        
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return False
         
         try:
             cursor = self.db_connection.connection.cursor()
             
             insert_sql = f"""
-            INSERT INTO {self.schema_name}.{self.table_name} (
-                id, paper_id, image_number, alt_text, image_format,
-                image_data, summary, graphic_analysis, statistical_analysis,
-                contextual_relevance, keywords, extracted_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
+            INSERT INTO {self.schema_name}.{self.table_name} ({self._COLUMNS}) VALUES %s
             """
             
-            # Prepare data for batch insert
-            batch_data = []
-            for image in images:
-                batch_data.append((
-                    image.id,
-                    image.paper_id,
-                    image.image_number,
-                    image.alt_text,
-                    image.image_format,
-                    image.image_data,
-                    image.summary,
-                    image.graphic_analysis,
-                    image.statistical_analysis,
-                    image.contextual_relevance,
-                    image.keywords,
-                    image.extracted_at
-                ))
-            
-            # Execute batch insert
-            cursor.executemany(insert_sql, batch_data)
+            # executemany sends one INSERT per image; execute_values sends a page of
+            # rows per statement, kept small because rows carry the encoded image
+            psycopg2.extras.execute_values(cursor, insert_sql, self._image_rows(images), page_size=50)
             cursor.close()
             
-            print(f"✓ Successfully saved {len(images)} images to database")
+            logger.info("✓ Successfully saved %s images to database", len(images))
             return True
             
         except Exception as e:
-            print(f"✗ Error saving images: {e}")
+            logger.error("✗ Error saving images: %s", e)
             return False
     
-    def delete_by_paper_id(self, paper_id: int) -> bool:
+    def copy_images(self, images: List) -> bool:
         """
-        Delete all images for a specific paper.
+        Save multiple images to the database using COPY.
+        
+        The base64 image data makes rows large, so streaming them as CSV avoids
+        building and parsing multi-row INSERT statements.
         
         Args:
-            paper_id: Paper ID to delete images for
+            images: List of ImageData objects to save
             
         Returns:
-            True if successful, False otherwise
+            True if all successful, False otherwise
         """
+        if not images:
+            logger.info("✓ No images to save")
+            return True
+        
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return False
         
         try:
             cursor = self.db_connection.connection.cursor()
             
-            delete_sql = f"""
-            DELETE FROM {self.schema_name}.{self.table_name} 
-            WHERE paper_id = %s
-            """
+            # QUOTE_NOTNULL writes None unquoted, which COPY reads as NULL
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator='\n')
+            for row in self._image_rows(images):
+                writer.writerow(_replace_column(row, self._KEYWORDS_INDEX, _to_pg_array(row[self._KEYWORDS_INDEX])))
+            buffer.seek(0)
             
-            cursor.execute(delete_sql, (paper_id,))
-            deleted_count = cursor.rowcount
+            cursor.copy_expert(
+                f"COPY {self.schema_name}.{self.table_name} ({self._COLUMNS}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
             cursor.close()
             
-            if deleted_count > 0:
-                print(f"✓ Deleted {deleted_count} existing images for paper {paper_id}")
-            else:
-                print(f"✓ No existing images found for paper {paper_id}")
-            
+            logger.info("✓ Successfully copied %s images to database", len(images))
             return True
             
         except Exception as e:
-            print(f"✗ Error deleting images for paper {paper_id}: {e}")
+            logger.error("✗ Error copying images: %s", e)
             return False
     
-    def exists_for_paper(self, paper_id: int) -> bool:
+    @classmethod
+    def _image_rows(cls, images: List) -> List[tuple]:
         """
-        Check if any images exist for a paper.
+        Build the column tuples for a batch of images.
         
         Args:
-            paper_id: Paper ID to check
+            images: List of ImageData objects
+            
+        Returns:
+            Rows in _COLUMNS order
+        """
+        return list(map(cls._ROW, images))
+    
+    def delete_by_paper_id(self, paper_id: int) -> bool:
+        """
+        Delete all images for a specific paper.
+        
+        Args:
+            paper_id: Paper ID to delete images for
             
         Returns:
-            True if images exist, False otherwise
+            True if successful, False otherwise
         """
         if not self.db_connection.connection:
+            logger.error("✗ No database connection available")
             return False
         
         try:
             cursor = self.db_connection.connection.cursor()
             
-            cursor.execute(f"""
-                SELECT EXISTS(
-                    SELECT 1 FROM {self.schema_name}.{self.table_name} 
-                    WHERE paper_id = %s
-                )
-            """, (paper_id,))
+            delete_sql = f"""
+            DELETE FROM {self.schema_name}.{self.table_name} 
+            WHERE paper_id = %s
+            """
             
-            result = cursor.fetchone()
+            cursor.execute(delete_sql, (paper_id,))
+            deleted_count = cursor.rowcount
             cursor.close()
             
-            return result[0] if result else False
+            if deleted_count > 0:
+                logger.info("✓ Deleted %s existing images for paper %s", deleted_count, paper_id)
+            else:
+                logger.info("✓ No existing images found for paper %s", paper_id)
+            
+            return True
             
         except Exception as e:
-            print(f"✗ Error checking for existing images: {e}")
+            logger.error("✗ Error deleting images for paper %s: %s", paper_id, e)
             return False
     
     def find_by_paper_id(self, paper_id: int) -> List:
@@ -1082,7 +1289,7 @@ class ImageRepository:
             List of ImageData objects
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return []
         
         try:
@@ -1101,11 +1308,12 @@ class ImageRepository:
             rows = cursor.fetchall()
             cursor.close()
             
+            # Rows were validated on insert, so skip re-validation when rebuilding models
             images = []
             for row in rows:
-                image_data = ImageData(
+                image_data = ImageData.for_paper(
+                    row[1],
                     id=row[0],
-                    paper_id=row[1],
                     image_number=row[2],
                     alt_text=row[3],
                     image_format=row[4],
@@ -1122,7 +1330,7 @@ class ImageRepository:
             return images
             
         except Exception as e:
-            print(f"✗ Error finding images: {e}")
+            logger.error("✗ Error finding images: %s", e)
             return []
 
 
@@ -1157,7 +1365,7 @@ class ReferencesRepository:
             True if successful, False otherwise
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return False
         
         try:
@@ -1174,17 +1382,17 @@ class ReferencesRepository:
             cursor.execute(insert_sql, (
                 references_data.id,
                 references_data.paper_id,
-                references_data.references,
+                list(references_data.references),  # tuples would be adapted as records, not TEXT[]
                 references_data.reference_count,
                 references_data.extracted_at
             ))
             
             cursor.close()
-            print(f"✓ References saved to database ({references_data.reference_count} references)")
+            logger.info("✓ References saved to database (%s references)", references_data.reference_count)
             return True
             
         except Exception as e:
-            print(f"✗ Error saving references: {e}")
+            logger.error("✗ Error saving references: %s", e)
             return False
     
     def delete_by_paper_id(self, paper_id: int) -> bool:
@@ -1198,7 +1406,7 @@ class ReferencesRepository:
             True if successful, False otherwise
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return False
         
         try:
@@ -1214,46 +1422,14 @@ class ReferencesRepository:
             cursor.close()
             
             if deleted_count > 0:
-                print(f"✓ Deleted existing references for paper {paper_id}")
+                logger.info("✓ Deleted existing references for paper %s", paper_id)
             else:
-                print(f"✓ No existing references found for paper {paper_id}")
+                logger.info("✓ No existing references found for paper %s", paper_id)
             
             return True
             
         except Exception as e:
-            print(f"✗ Error deleting references for paper {paper_id}: {e}")
-            return False
-    
-    def exists_for_paper(self, paper_id: int) -> bool:
-        """
-        Check if references exist for a paper.
-        
-        Args:
-            paper_id: Paper ID to check
-            
-        Returns:
-            True if references exist, False otherwise
-        """
-        if not self.db_connection.connection:
-            return False
-        
-        try:
-            cursor = self.db_connection.connection.cursor()
-            
-            cursor.execute(f"""
-                SELECT EXISTS(
-                    SELECT 1 FROM {self.schema_name}.{self.table_name} 
-                    WHERE paper_id = %s
-                )
-            """, (paper_id,))
-            
-            result = cursor.fetchone()
-            cursor.close()
-            
-            return result[0] if result else False
-            
-        except Exception as e:
-            print(f"✗ Error checking for existing references: {e}")
+            logger.error("✗ Error deleting references for paper %s: %s", paper_id, e)
             return False
     
     def find_by_paper_id(self, paper_id: int):
@@ -1267,14 +1443,14 @@ class ReferencesRepository:
             ReferencesData object or None if not found
         """
         if not self.db_connection.connection:
-            print("✗ No database connection available")
+            logger.error("✗ No database connection available")
             return None
         
         try:
             cursor = self.db_connection.connection.cursor()
             
             select_sql = f"""
-            SELECT id, paper_id, references, reference_count, extracted_at
+            SELECT id, paper_id, reference_list, reference_count, extracted_at
             FROM {self.schema_name}.{self.table_name} 
             WHERE paper_id = %s
             """
@@ -1284,11 +1460,11 @@ class ReferencesRepository:
             cursor.close()
             
             if row:
-                from ..models import ReferencesData
-                return ReferencesData(
+                # Row was validated on insert, so skip re-validation
+                return ReferencesData.for_paper(
+                    row[1],
                     id=row[0],
-                    paper_id=row[1],
-                    references=row[2] or [],
+                    references=tuple(row[2] or ()),
                     reference_count=row[3],
                     extracted_at=row[4]
                 )
@@ -1296,5 +1472,5 @@ class ReferencesRepository:
                 return None
             
         except Exception as e:
-            print(f"✗ Error finding references: {e}")
+            logger.error("✗ Error finding references: %s", e)
             return None
@@ -5,12 +5,15 @@ This module provides schema management functionality, refactored from
 the existing database/create_tables.py.
 """
 
-from typing import Optional
-import psycopg2
+from typing import Set, Tuple
 from psycopg2 import sql
 from .connection import DatabaseConnection
 
 
+# Tables created by setup_complete_schema
+SCHEMA_TABLES = ('paper_metadata', 'text_sections', 'table_data', 'paper_images', 'paper_references')
+
+
 class SchemaManager:
     """
     Manages database schema creation and validation for paper metadata system.
@@ -19,6 +22,10 @@ class SchemaManager:
     paper_metadata table and schema.
     """
     
+    # (host, port, database, schema) of every schema known to be fully set up
+    # in this process, shared by all instances
+    _ready_schemas: Set[Tuple[str, int, str, str]] = set()
+    
     def __init__(self, db_connection: DatabaseConnection):
         """
         Initialize schema manager with database connection.
@@ -589,19 +596,65 @@ class SchemaManager:
         finally:
             cursor.close()
 
+    def check_schema_complete(self, schema_name: str) -> bool:
+        """
+        Check in one query whether every table of the schema exists.
+        
+        Args:
+            schema_name: Name of the schema to check
+            
+        Returns:
+            True if all tables in SCHEMA_TABLES exist in the schema, False otherwise
+        """
+        if not self.db_connection.connection:
+            raise Exception("No database connection available")
+            
+        cursor = self.db_connection.connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT count(*)
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relkind = 'r' AND c.relname = ANY(%s);
+            """, (schema_name, list(SCHEMA_TABLES)))
+            result = cursor.fetchone()
+            return bool(result) and result[0] == len(SCHEMA_TABLES)
+        finally:
+            cursor.close()
+    
     def setup_complete_schema(self, schema_name: str = 'papers') -> None:
         """
         Set up the complete database schema for paper metadata.
         
+        A schema already known to be complete is skipped without a query; otherwise
+        a single catalog probe decides whether any table has to be created.
+        
         Args:
             schema_name: Name of the schema to create
         """
-        print(f"Setting up complete schema '{schema_name}'...")
+        schema_key = (self.db_connection.host, self.db_connection.port,
+                      self.db_connection.dbname, schema_name)
+        if schema_key in self._ready_schemas:
+            return
         
         # Ensure we have a connection
         if not self.db_connection.connection:
             self.db_connection.connect()
         
+        try:
+            if self.check_schema_complete(schema_name):
+                # The probe opened a transaction; end it so the connection is idle
+                self.db_connection.connection.commit()
+                self._ready_schemas.add(schema_key)
+                print(f"Schema '{schema_name}' already set up.")
+                return
+        except Exception as e:
+            print(f"Error checking schema: {e}")
+            self.db_connection.connection.rollback()
+            raise
+        
+        print(f"Setting up complete schema '{schema_name}'...")
+        
         try:
             # Check and create schema if needed
             if not self.check_schema_exists(schema_name):
@@ -680,6 +733,7 @@ class SchemaManager:
             # Commit all changes
             if self.db_connection.connection:
                 self.db_connection.connection.commit()
+            self._ready_schemas.add(schema_key)
             print(f"Schema setup completed successfully for '{schema_name}'!")
             
         except Exception as e:
@@ -5,10 +5,11 @@ This module provides extraction functionality using Google Generative AI,
 refactored from the existing experimental components.
 """
 
+from .base_ai_extractor import BaseAIExtractor
 from .ai_extractor import AIExtractor
 from .text_extractor import TextExtractor
 from .table_extractor import TableExtractor
 from .image_extractor import ImageExtractor
 from .references_extractor import ReferencesExtractor
 
-__all__ = ['AIExtractor', 'TextExtractor', 'TableExtractor', 'ImageExtractor', 'ReferencesExtractor']
+__all__ = ['BaseAIExtractor', 'AIExtractor', 'TextExtractor', 'TableExtractor', 'ImageExtractor', 'ReferencesExtractor']
@@ -5,19 +5,20 @@ This module provides the AIExtractor class that uses Google's Generative AI
 to extract structured metadata from scientific papers.
 """
 
-import os
-import json
-from typing import Optional, Dict, Any
+from typing import Optional, List
 from datetime import datetime
-from google import genai
 from google.genai import types
-from dotenv import load_dotenv
 
 from ..models import PaperMetadata
-from ..config.ai_models import AI_MODELS
+from ..utils import json_fast
+from .base_ai_extractor import BaseAIExtractor
+from ..utils.logger import get_logger
 
 
-class AIExtractor:
+logger = get_logger(__name__)
+
+
+class AIExtractor(BaseAIExtractor):
     """
     AI-powered extractor for scientific paper metadata.
     
@@ -25,68 +26,39 @@ class AIExtractor:
     from scientific paper content.
     """
     
-    def __init__(self):
-        """Initialize the AI extractor with Google API configuration."""
-        # Load environment variables
-        load_dotenv()
-        
-        # Validate Google API key
-        self.google_api_key = os.getenv('GOOGLE_API_KEY')
-        if not self.google_api_key:
-            raise EnvironmentError(
-                "GOOGLE_API_KEY environment variable is not set. "
-                "Please set it to use the Google Generative AI API."
-            )
-        
-        # Define model configuration once - single source of truth
-        self.model_name = AI_MODELS.get_model_for_agent('metadata')
-        self.temperature = AI_MODELS.DEFAULT_TEMPERATURE
-        self.max_tokens = AI_MODELS.DEFAULT_MAX_TOKENS
-        
-        # Initialize the client
-        self.client = None
-        self._initialize_client()
-        
-        # Print model configuration for transparency
-        print(f"✓ AI Extractor initialized using model: {self.model_name}")
-        print(f"  Temperature: {self.temperature}, Max tokens: {self.max_tokens}")
-    
-    def _initialize_client(self) -> None:
-        """Initialize the Google Generative AI client."""
-        try:
-            self.client = genai.Client()
-            print("✓ Google GenAI client initialized successfully.")
-        except Exception as e:
-            print(f"✗ Error initializing Google GenAI client: {e}")
-            print("Please ensure the GOOGLE_API_KEY environment variable is set and valid.")
-            self.client = None
+    agent_key = 'metadata'
+    display_name = "AI Extractor"
+    client_purpose = "metadata extraction"
     
-    def extract_metadata(self, paper_content: str, source_file: str) -> Optional[PaperMetadata]:
+    def extract_metadata(self, paper_content: str, source_file: str,
+                         paper_id: Optional[int] = None) -> Optional[PaperMetadata]:
         """
         Extract metadata from paper content using Google Generative AI.
         
         Args:
             paper_content: The content of the paper
             source_file: Path to the source file
+            paper_id: Paper ID if the caller already generated it
             
         Returns:
             PaperMetadata instance if successful, None if failed
         """
         if not self.client:
-            print("✗ Google GenAI client not initialized. Cannot proceed with extraction.")
+            logger.error("✗ Google GenAI client not initialized. Cannot proceed with extraction.")
             return None
         
         try:
-            # Generate 64-bit ID for this paper
-            paper_id = PaperMetadata.generate_id(paper_content, source_file)
-            print(f"✓ Generated 64-bit ID: {paper_id}")
+            # Generate 64-bit ID for this paper unless the caller already did
+            if paper_id is None:
+                paper_id = PaperMetadata.generate_id(paper_content, source_file)
+            logger.info("✓ Generated 64-bit ID: %s", paper_id)
             
             # Construct the prompt
             prompt = self._build_extraction_prompt(paper_id, source_file, paper_content)
             
-            print("✓ Sending request to Google Generative AI...")
-            print(f"  🤖 Using model: {self.model_name}")
-            response = self.client.models.generate_content(
+            logger.info("✓ Sending request to Google Generative AI...")
+            logger.info("  🤖 Using model: %s", self.model_name)
+            response = self._generate_content(
                 model=self.model_name,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -96,49 +68,50 @@ class AIExtractor:
                 ),
             )
             
-            print("✓ Received response from Google Generative AI.")
+            logger.info("✓ Received response from Google Generative AI.")
             
             # Parse the response
             if response.text:
                 try:
-                    metadata_dict = json.loads(response.text)
-                    print("✓ Successfully extracted and parsed metadata.")
+                    metadata_dict = json_fast.loads(response.text)
+                    logger.info("✓ Successfully extracted and parsed metadata.")
                     
                     # Create PaperMetadata instance
                     paper_metadata = PaperMetadata(**metadata_dict)
                     return paper_metadata
                     
-                except json.JSONDecodeError as e:
-                    print(f"✗ Error decoding JSON from AI response: {e}")
-                    print("Raw response text was:")
-                    print(response.text)
+                except json_fast.JSONDecodeError as e:
+                    logger.error("✗ Error decoding JSON from AI response: %s", e)
+                    logger.error("Raw response text was:\n%s", response.text)
                     return None
                 except Exception as e:
-                    print(f"✗ Error creating PaperMetadata instance: {e}")
-                    print("Raw response text was:")
-                    print(response.text)
+                    logger.error("✗ Error creating PaperMetadata instance: %s", e)
+                    logger.error("Raw response text was:\n%s", response.text)
                     return None
             else:
-                print("✗ AI response was empty.")
+                logger.error("✗ AI response was empty.")
                 return None
                 
         except Exception as e:
-            print(f"✗ Error during metadata extraction: {e}")
+            logger.error("✗ Error during metadata extraction: %s", e)
             return None
     
-    def _build_extraction_prompt(self, paper_id: int, source_file: str, paper_content: str) -> str:
+    def _build_extraction_prompt(self, paper_id: int, source_file: str, paper_content: str) -> List[str]:
         """
         Build the extraction prompt for the AI model.
         
+        The paper content is passed as its own prompt part, so the full paper is
+        never copied into a larger prompt string.
+        
         Args:
             paper_id: Generated paper ID
             source_file: Source file path
             paper_content: Paper content
             
         Returns:
-            Formatted prompt string
+            Prompt parts, sent together as one user message
         """
-        prompt = f"""Please extract metadata from the following medical research paper.
+        instructions = f"""Please extract metadata from the following medical research paper.
 The output must be a JSON object that strictly conforms to the PaperMetadata schema provided to you.
 Do not change the schema or add any additional fields.
 Do not change the content of the fields or the Paper Content, just extract the information as accurately as possible.
@@ -151,10 +124,8 @@ Key instructions for specific fields:
 
 Paper Content:
 ---
-{paper_content}
----
 """
-        return prompt
+        return [instructions, paper_content, "\n---\n"]
     
     def extract_and_display(self, paper_content: str, source_file: str) -> Optional[PaperMetadata]:
         """
@@ -0,0 +1,153 @@
+"""
+Shared base class for the AI-powered extraction agents.
+
+This module provides the BaseAIExtractor class that holds the environment
+loading, API key validation, model configuration and Google GenAI client
+setup common to every extractor in the pipeline.
+"""
+
+import os
+import threading
+from functools import lru_cache
+from typing import Any
+import httpx
+from google import genai
+from google.genai import errors
+from dotenv import load_dotenv
+
+from ..config.ai_models import AI_MODELS
+from ..utils.logger import get_logger
+from ..utils.retry import with_retry
+
+
+logger = get_logger(__name__)
+
+# Upper bound on GenAI requests in flight at once in this process, shared by all
+# extractors and threads
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", 4))
+
+_llm_slots = threading.BoundedSemaphore(MAX_CONCURRENT_LLM_CALLS)
+
+
+@lru_cache(maxsize=None)
+def get_shared_client() -> genai.Client:
+    """
+    Get the Google GenAI client shared by every extractor in the process.
+    
+    Building a client sets up its HTTP transport and connection pool, so all
+    extractors (and all PaperProcessor instances in a batch) reuse one. A
+    failed construction is not cached and is retried on the next call.
+    
+    Returns:
+        Google GenAI client
+    """
+    return genai.Client()
+
+
+def is_transient_api_error(error: Exception) -> bool:
+    """
+    Tell whether a failed GenAI request is worth sending again.
+    
+    Args:
+        error: Error raised by the request
+        
+    Returns:
+        True for rate limiting, server errors and timeouts, False otherwise
+    """
+    if isinstance(error, errors.APIError):
+        return error.code in (408, 429) or error.code >= 500
+    # The client raises httpx connection errors and timeouts unwrapped
+    return isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError))
+
+
+class BaseAIExtractor:
+    """
+    Base class for AI-powered extractors using Google Generative AI.
+
+    Subclasses only declare which model they use (``agent_key``) and how they
+    describe themselves in the initialization messages.
+    """
+
+    # Agent type passed to AI_MODELS.get_model_for_agent
+    agent_key: str = 'default'
+
+    # Human-readable names used in the initialization messages
+    display_name: str = "AI Extractor"
+    client_purpose: str = "AI extraction"
+
+    # The .env file only needs to be parsed once per process
+    _dotenv_loaded: bool = False
+
+    def __init__(self):
+        """Initialize the extractor with Google API configuration."""
+        # Load environment variables once for all extractors
+        if not BaseAIExtractor._dotenv_loaded:
+            load_dotenv()
+            BaseAIExtractor._dotenv_loaded = True
+
+        # Check for API keys following established pattern
+        self.google_api_key = os.getenv('GOOGLE_API_KEY')
+        self.gemini_api_key = os.getenv('GEMINI_API_KEY')
+
+        if self.google_api_key and self.gemini_api_key:
+            logger.info("Both GOOGLE_API_KEY and GEMINI_API_KEY are set. Using GOOGLE_API_KEY.")
+
+        if not self.google_api_key and not self.gemini_api_key:
+            raise EnvironmentError(
+                "Neither GOOGLE_API_KEY nor GEMINI_API_KEY environment variable is set. "
+                "Please set one of them to use the Google Generative AI API."
+            )
+
+        # Define model configuration once - single source of truth
+        self.model_name = AI_MODELS.get_model_for_agent(self.agent_key)
+        self.temperature = AI_MODELS.DEFAULT_TEMPERATURE
+        self.max_tokens = AI_MODELS.DEFAULT_MAX_TOKENS
+
+        # Initialize the client following established pattern
+        self.client = None
+        self._initialize_client()
+
+        # Log model configuration for transparency
+        logger.info("✓ %s initialized using model: %s", self.display_name, self.model_name)
+        logger.info("  Temperature: %s, Max tokens: %s", self.temperature, self.max_tokens)
+
+    def _initialize_client(self) -> None:
+        """Initialize the Google Generative AI client."""
+        try:
+            self.client = get_shared_client()
+            logger.info("✓ Google GenAI client initialized successfully for %s.", self.client_purpose)
+        except Exception as e:
+            logger.error("✗ Error initializing Google GenAI client: %s", e)
+            logger.error("Please ensure the API key environment variable is set and valid.")
+            self.client = None
+
+    def _generate_content(self, **kwargs: Any) -> Any:
+        """
+        Send a generate_content request, retrying transient API failures.
+        
+        A rate-limited or failed request is retried with a short backoff
+        instead of failing the whole extraction step.
+        
+        Args:
+            **kwargs: Arguments for client.models.generate_content
+            
+        Returns:
+            Response from the model
+        """
+        return with_retry(self._send_request, should_retry=is_transient_api_error, **kwargs)
+
+    def _send_request(self, **kwargs: Any) -> Any:
+        """
+        Send one generate_content request once a request slot is free.
+        
+        The slot is held only while the request is in flight, not during a
+        retry's backoff, so at most MAX_CONCURRENT_LLM_CALLS requests run at once.
+        
+        Args:
+            **kwargs: Arguments for client.models.generate_content
+            
+        Returns:
+            Response from the model
+        """
+        with _llm_slots:
+            return self.client.models.generate_content(**kwargs)
@@ -6,23 +6,24 @@ using Google Generative AI for intelligent image analysis, description and keywo
 Follows the project's OOP architecture and established AI patterns.
 """
 
-import os
-import json
+import asyncio
 import re
 import base64
-from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pathlib import Path
-from google import genai
 from google.genai import types
-from dotenv import load_dotenv
 
 # Import the existing models and AI model configuration
 from ..models.image_data import ImageData
-from ..config.ai_models import AI_MODELS
+from ..utils import json_fast
+from ..utils.text_utils import build_context_preview
+from .base_ai_extractor import BaseAIExtractor
+from ..utils.logger import get_logger
 
 
-class ImageExtractor:
+logger = get_logger(__name__)
+
+
+class ImageExtractor(BaseAIExtractor):
     """
     AI-powered agent for extracting and analyzing images from scientific papers.
     
@@ -33,80 +34,50 @@ class ImageExtractor:
     - AI-driven image content analysis and interpretation
     """
     
-    def __init__(self):
-        """Initialize the AI-powered image extraction agent following established patterns."""
-        # Load environment variables
-        load_dotenv()
-        
-        # Check for API keys following established pattern
-        self.google_api_key = os.getenv('GOOGLE_API_KEY')
-        self.gemini_api_key = os.getenv('GEMINI_API_KEY')
-        
-        if self.google_api_key and self.gemini_api_key:
-            print("Both GOOGLE_API_KEY and GEMINI_API_KEY are set. Using GOOGLE_API_KEY.")
-        
-        if not self.google_api_key and not self.gemini_api_key:
-            raise EnvironmentError(
-                "Neither GOOGLE_API_KEY nor GEMINI_API_KEY environment variable is set. "
-                "Please set one of them to use the Google Generative AI API."
-            )
-        
-        # Define model configuration once - single source of truth
-        self.model_name = AI_MODELS.get_model_for_agent('default')
-        self.temperature = AI_MODELS.DEFAULT_TEMPERATURE
-        self.max_tokens = AI_MODELS.DEFAULT_MAX_TOKENS
-        
-        # Initialize the AI client following established pattern
-        self.client = None
-        self._initialize_client()
-        
-        # Print model configuration for transparency
-        print(f"✓ AI-powered image extraction agent initialized using model: {self.model_name}")
-        print(f"  Temperature: {self.temperature}, Max tokens: {self.max_tokens}")
-        
-    def _initialize_client(self) -> None:
-        """Initialize the Google Generative AI client following established patterns."""
-        try:
-            self.client = genai.Client()
-            print("✓ Google GenAI client initialized successfully for image analysis.")
-        except Exception as e:
-            print(f"✗ Error initializing Google GenAI client: {e}")
-            print("Please ensure the API key environment variable is set and valid.")
-            self.client = None
+    agent_key = 'default'
+    display_name = "AI-powered image extraction agent"
+    client_purpose = "image analysis"
     
-    def extract_images(self, paper_content: str, paper_id: Optional[int] = None) -> List[ImageData]:
+    def extract_images(self, paper_content: str, paper_id: Optional[int] = None,
+                       context_preview: Optional[str] = None) -> Optional[List[ImageData]]:
         """
         Extract and analyze images from paper content using AI.
         
         Args:
             paper_content: Full markdown content of the paper
             paper_id: Optional paper ID to link images to their parent paper
+            context_preview: Truncated paper context for the prompts, if already built
             
         Returns:
-            List of ImageData objects with comprehensive AI analysis
+            List of ImageData objects with comprehensive AI analysis, empty if the
+            paper has no images, or None if extraction failed
         """
         if not self.client:
-            print("✗ AI client not available. Cannot proceed with image extraction.")
-            return []
+            logger.error("✗ AI client not available. Cannot proceed with image extraction.")
+            return None
         
         try:
-            print("🔍 Starting AI-powered image extraction...")
+            logger.info("🔍 Starting AI-powered image extraction...")
             
             # Extract raw images using regex
             raw_images = self._extract_raw_images_from_markdown(paper_content)
             
             if not raw_images:
-                print("✗ No images found in markdown content")
+                logger.error("✗ No images found in markdown content")
                 return []
             
-            print(f"🖼️  Found {len(raw_images)} raw images, analyzing with AI...")
+            logger.info("🖼️  Found %s raw images, analyzing with AI...", len(raw_images))
+            
+            # Truncate paper context once; every image prompt shares the same preview
+            if context_preview is None:
+                context_preview = build_context_preview(paper_content)
             
             # Process each image with AI
             image_data_list = []
             for i, (alt_text, image_data, image_format) in enumerate(raw_images, 1):
                 try:
                     # Get AI analysis for this image
-                    analysis = self._ai_analyze_image(image_data, alt_text, paper_content, i, image_format)
+                    analysis = self._ai_analyze_image(image_data, alt_text, context_preview, i, image_format)
                     
                     if analysis:
                         # Create ImageData object
@@ -124,20 +95,40 @@ class ImageExtractor:
                             keywords=analysis.get('keywords', [])
                         )
                         image_data_list.append(image_obj)
-                        print(f"  ✓ Image {i}: '{alt_text[:50]}...' analyzed with AI")
+                        logger.info("  ✓ Image %s: '%s...' analyzed with AI", i, alt_text[:50])
                     else:
-                        print(f"  ✗ Image {i}: AI analysis failed")
+                        logger.error("  ✗ Image %s: AI analysis failed", i)
                         
                 except Exception as e:
-                    print(f"  ✗ Image {i}: Error during analysis: {e}")
+                    logger.error("  ✗ Image %s: Error during analysis: %s", i, e)
                     continue
             
-            print(f"✓ Successfully extracted and analyzed {len(image_data_list)} images")
+            if not image_data_list:
+                logger.error("✗ AI analysis failed for every image")
+                return None
+            
+            logger.info("✓ Successfully extracted and analyzed %s images", len(image_data_list))
             return image_data_list
             
         except Exception as e:
-            print(f"✗ Error during image extraction: {e}")
-            return []
+            logger.error("✗ Error during image extraction: %s", e)
+            return None
+    
+    async def extract_images_async(self, paper_content: str, paper_id: Optional[int] = None,
+                                   context_preview: Optional[str] = None) -> Optional[List[ImageData]]:
+        """
+        Async variant of extract_images that runs the blocking LLM calls in a worker thread.
+        
+        Args:
+            paper_content: Full markdown content of the paper
+            paper_id: Optional paper ID to link images to their parent paper
+            context_preview: Truncated paper context for the prompts, if already built
+            
+        Returns:
+            List of ImageData objects with comprehensive AI analysis, empty if the
+            paper has no images, or None if extraction failed
+        """
+        return await asyncio.to_thread(self.extract_images, paper_content, paper_id, context_preview)
     
     def _extract_raw_images_from_markdown(self, content: str) -> List[tuple]:
         """
@@ -173,15 +164,15 @@ class ImageExtractor:
                     ))
                 else:
                     if not self._validate_image_format(image_format):
-                        print(f"⚠️  Skipping unsupported image format: {image_format}")
+                        logger.warning("⚠️  Skipping unsupported image format: %s", image_format)
                     else:
-                        print(f"⚠️  Skipping invalid or too small image data (length: {len(cleaned_data)})")
+                        logger.warning("⚠️  Skipping invalid or too small image data (length: %s)", len(cleaned_data))
                         
             
             return valid_images
             
         except Exception as e:
-            print(f"✗ Error extracting raw images: {e}")
+            logger.error("✗ Error extracting raw images: %s", e)
             return []
     
     def _is_valid_base64(self, data: str) -> bool:
@@ -201,7 +192,7 @@ class ImageExtractor:
         except Exception:
             return False
     
-    def _ai_analyze_image(self, image_data: str, alt_text: str, paper_context: str, 
+    def _ai_analyze_image(self, image_data: str, alt_text: str, context_preview: str, 
                          image_number: int, image_format: str) -> Optional[Dict[str, Any]]:
         """
         Use AI to analyze an image in the context of the research paper.
@@ -209,7 +200,7 @@ class ImageExtractor:
         Args:
             image_data: Base64 encoded image data
             alt_text: Alt text or caption for the image
-            paper_context: Full paper content for context
+            context_preview: Paper content already truncated for the prompt
             image_number: Sequential number of this image
             image_format: Image format (png, jpg, etc.)
             
@@ -218,12 +209,9 @@ class ImageExtractor:
         """
         try:
             if not self.client:
-                print(f"✗ AI client not available for image {image_number} analysis")
+                logger.error("✗ AI client not available for image %s analysis", image_number)
                 return None
             
-            # Truncate paper context to avoid token limits while preserving context
-            context_preview = paper_context[:3000] + "..." if len(paper_context) > 3000 else paper_context
-            
             # Create the image data for AI analysis using Gemini API best practices
             try:
                 # Decode the base64 data to bytes for the API
@@ -232,7 +220,7 @@ class ImageExtractor:
                 # Validate image size (Gemini API best practices)
                 image_size_mb = len(image_bytes) / (1024 * 1024)
                 if image_size_mb > 15:  # Stay well under 20MB limit
-                    print(f"⚠️  Image {image_number} is large ({image_size_mb:.1f}MB), processing may be slower")
+                    logger.warning("⚠️  Image %s is large (%.1fMB), processing may be slower", image_number, image_size_mb)
                 
                 # Get proper MIME type
                 proper_mime_type = self._get_proper_mime_type(image_format)
@@ -244,7 +232,7 @@ class ImageExtractor:
                 )
                 
             except Exception as e:
-                print(f"✗ Error processing image data for image {image_number}: {e}")
+                logger.error("✗ Error processing image data for image %s: %s", image_number, e)
                 return None
             
             # Construct prompt following best practices for image understanding
@@ -272,8 +260,8 @@ Return ONLY a valid JSON object with these exact fields: 'summary', 'graphic_ana
 Do not include any explanatory text, just the JSON object."""
 
             # Make API call following Gemini image understanding best practices
-            print(f"  🤖 Analyzing image {image_number} with model: {self.model_name}")
-            response = self.client.models.generate_content(
+            logger.info("  🤖 Analyzing image %s with model: %s", image_number, self.model_name)
+            response = self._generate_content(
                 model=self.model_name,
                 contents=[
                     image_part,  # Image first
@@ -288,7 +276,7 @@ Do not include any explanatory text, just the JSON object."""
             if response.text:
                 try:
                     # Parse JSON response
-                    analysis = json.loads(response.text)
+                    analysis = json_fast.loads(response.text)
                     
                     # Validate required fields
                     required_fields = ['summary', 'graphic_analysis', 'statistical_analysis', 
@@ -304,18 +292,18 @@ Do not include any explanatory text, just the JSON object."""
                         
                         return analysis
                     else:
-                        print(f"✗ AI response missing required fields for image {image_number}")
+                        logger.error("✗ AI response missing required fields for image %s", image_number)
                         return None
                     
-                except json.JSONDecodeError as e:
-                    print(f"✗ Error parsing AI response as JSON for image {image_number}: {e}")
+                except json_fast.JSONDecodeError as e:
+                    logger.error("✗ Error parsing AI response as JSON for image %s: %s", image_number, e)
                     return None
             else:
-                print(f"✗ Empty response from AI for image {image_number}")
+                logger.error("✗ Empty response from AI for image %s", image_number)
                 return None
                 
         except Exception as e:
-            print(f"✗ Error during AI image analysis for image {image_number}: {e}")
+            logger.error("✗ Error during AI image analysis for image %s: %s", image_number, e)
             return None
     
     def _validate_image_format(self, image_format: str) -> bool:
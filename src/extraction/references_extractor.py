@@ -5,18 +5,24 @@ This module provides the ReferencesExtractor class that integrates the experimen
 references extraction functionality into the production pipeline.
 """
 
-import os
-import json
-from typing import List, Optional
-from google import genai
+import asyncio
+from typing import Any, List, Optional
 from google.genai import types
-from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
 
 from ..models import ReferencesData
-from ..config.ai_models import AI_MODELS
+from .base_ai_extractor import BaseAIExtractor
+from ..utils.logger import get_logger
 
 
-class ReferencesExtractor:
+logger = get_logger(__name__)
+
+
+# Built once per process; parses the AI response and checks it is a JSON array
+_REFERENCES_ADAPTER = TypeAdapter(List[Any])
+
+
+class ReferencesExtractor(BaseAIExtractor):
     """
     AI-powered extractor for scientific paper references/bibliography.
     
@@ -24,46 +30,9 @@ class ReferencesExtractor:
     into the production pipeline, following the established AI patterns.
     """
     
-    def __init__(self):
-        """Initialize the references extractor with Google API configuration."""
-        # Load environment variables
-        load_dotenv()
-        
-        # Check for API keys following established pattern
-        self.google_api_key = os.getenv('GOOGLE_API_KEY')
-        self.gemini_api_key = os.getenv('GEMINI_API_KEY')
-        
-        if self.google_api_key and self.gemini_api_key:
-            print("Both GOOGLE_API_KEY and GEMINI_API_KEY are set. Using GOOGLE_API_KEY.")
-        
-        if not self.google_api_key and not self.gemini_api_key:
-            raise EnvironmentError(
-                "Neither GOOGLE_API_KEY nor GEMINI_API_KEY environment variable is set. "
-                "Please set one of them to use the Google Generative AI API."
-            )
-        
-        # Define model configuration once - single source of truth
-        self.model_name = AI_MODELS.get_model_for_agent('text')  # Use text model for references
-        self.temperature = AI_MODELS.DEFAULT_TEMPERATURE
-        self.max_tokens = AI_MODELS.DEFAULT_MAX_TOKENS
-        
-        # Initialize the client following established pattern
-        self.client = None
-        self._initialize_client()
-        
-        # Print model configuration for transparency
-        print(f"✓ References Extractor initialized using model: {self.model_name}")
-        print(f"  Temperature: {self.temperature}, Max tokens: {self.max_tokens}")
-    
-    def _initialize_client(self) -> None:
-        """Initialize the Google Generative AI client following established patterns."""
-        try:
-            self.client = genai.Client()
-            print("✓ Google GenAI client initialized successfully for references extraction.")
-        except Exception as e:
-            print(f"✗ Error initializing Google GenAI client: {e}")
-            print("Please ensure the API key environment variable is set and valid.")
-            self.client = None
+    agent_key = 'text'  # Use text model for references
+    display_name = "References Extractor"
+    client_purpose = "references extraction"
     
     def extract_references(self, paper_content: str, paper_id: int) -> Optional[ReferencesData]:
         """
@@ -74,40 +43,57 @@ class ReferencesExtractor:
             paper_id: ID of the paper to link references to
             
         Returns:
-            ReferencesData object with extracted references or None if extraction failed
+            ReferencesData object with extracted references (none if the paper has
+            no references) or None if extraction failed
         """
         if not self.client:
-            print("✗ AI client not available. Cannot proceed with references extraction.")
+            logger.error("✗ AI client not available. Cannot proceed with references extraction.")
             return None
         
         try:
-            print("🔍 Starting AI-powered references extraction...")
+            logger.info("🔍 Starting AI-powered references extraction...")
             
             # Use AI to extract references
             references_list = self._ai_extract_references(paper_content)
             
-            if not references_list:
-                print("✗ No references found in paper content")
+            if references_list is None:
                 return None
+            if references_list:
+                logger.info("📚 Found %s references", len(references_list))
+            else:
+                logger.warning("✗ No references found in paper content")
             
-            print(f"📚 Found {len(references_list)} references")
-            
-            # Create ReferencesData object
-            references_data = ReferencesData(
+            # Every field is computed here (references were filtered to strings),
+            # so build the record without re-validating it
+            references_data = ReferencesData.for_paper(
+                paper_id,
                 id=ReferencesData.generate_references_id(paper_id, len(references_list)),
-                paper_id=paper_id,
-                references=references_list,
+                references=tuple(references_list),
                 reference_count=len(references_list)
             )
             
-            print(f"✓ Successfully extracted {len(references_list)} references")
+            logger.info("✓ Successfully extracted %s references", len(references_list))
             return references_data
             
         except Exception as e:
-            print(f"✗ Error during references extraction: {e}")
+            logger.error("✗ Error during references extraction: %s", e)
             return None
     
-    def _ai_extract_references(self, paper_content: str) -> List[str]:
+    async def extract_references_async(self, paper_content: str, paper_id: int) -> Optional[ReferencesData]:
+        """
+        Async variant of extract_references that runs the blocking LLM call in a worker thread.
+        
+        Args:
+            paper_content: Full content of the paper
+            paper_id: ID of the paper to link references to
+            
+        Returns:
+            ReferencesData object with extracted references (none if the paper has
+            no references) or None if extraction failed
+        """
+        return await asyncio.to_thread(self.extract_references, paper_content, paper_id)
+    
+    def _ai_extract_references(self, paper_content: str) -> Optional[List[str]]:
         """
         Use AI to intelligently extract references from paper content.
         
@@ -115,11 +101,13 @@ class ReferencesExtractor:
             paper_content: Full paper content
             
         Returns:
-            List of reference strings as they appear in the original text
+            List of reference strings as they appear in the original text, or
+            None if the AI call or its response failed
         """
         try:
-            # Construct prompt following best practices for reference extraction
-            prompt = f"""You are analyzing a scientific research paper to extract all references from the References, Bibliography, or Works Cited section.
+            # Construct prompt following best practices for reference extraction; the
+            # paper goes in its own prompt part rather than being copied into the instructions
+            prompt = ["""You are analyzing a scientific research paper to extract all references from the References, Bibliography, or Works Cited section.
 
 Your task:
 1. Identify the References/Bibliography section in the paper
@@ -131,17 +119,17 @@ Your task:
 
 Paper content to analyze:
 ---
-{paper_content}
+""", paper_content, """
 ---
 
 Return ONLY a valid JSON array of strings, where each string is one complete reference exactly as it appears in the original text.
 Example format: ["Reference 1 text here", "Reference 2 text here", ...]
-Do not include any explanatory text, just the JSON array of reference strings."""
+Do not include any explanatory text, just the JSON array of reference strings."""]
 
-            print(f"  🤖 Analyzing references with model: {self.model_name}")
-            response = self.client.models.generate_content(
+            logger.info("  🤖 Analyzing references with model: %s", self.model_name)
+            response = self._generate_content(
                 model=self.model_name,
-                contents=[prompt],
+                contents=prompt,
                 config=types.GenerateContentConfig(
                     temperature=self.temperature,
                     response_mime_type="application/json",
@@ -150,13 +138,8 @@ Do not include any explanatory text, just the JSON array of reference strings.""
             
             if response.text:
                 try:
-                    # Parse JSON response
-                    references_list = json.loads(response.text)
-                    
-                    # Validate that we got a list of strings
-                    if not isinstance(references_list, list):
-                        print("✗ AI response is not a list")
-                        return []
+                    # Parse JSON response and validate that we got a list
+                    references_list = _REFERENCES_ADAPTER.validate_json(response.text)
                     
                     # Filter out empty or very short references
                     valid_references = []
@@ -164,18 +147,18 @@ Do not include any explanatory text, just the JSON array of reference strings.""
                         if isinstance(ref, str) and len(ref.strip()) > 10:  # Minimum length filter
                             valid_references.append(ref.strip())
                         else:
-                            print(f"⚠️  Skipping invalid reference: {ref}")
+                            logger.warning("⚠️  Skipping invalid reference: %s", ref)
                     
-                    print(f"✓ AI extracted {len(valid_references)} valid references")
+                    logger.info("✓ AI extracted %s valid references", len(valid_references))
                     return valid_references
                     
-                except json.JSONDecodeError as e:
-                    print(f"✗ Error parsing AI response as JSON: {e}")
-                    return []
+                except ValidationError as e:
+                    logger.error("✗ Error parsing AI response as a JSON list: %s", e)
+                    return None
             else:
-                print("✗ Empty response from AI for references extraction")
-                return []
+                logger.error("✗ Empty response from AI for references extraction")
+                return None
                 
         except Exception as e:
-            print(f"✗ Error during AI references extraction: {e}")
-            return []
+            logger.error("✗ Error during AI references extraction: %s", e)
+            return None
@@ -5,19 +5,32 @@ This module provides AI-powered table extraction capabilities for scientific pap
 following the project's established patterns for extraction, analysis, and data validation.
 """
 
-import os
-import json
+import asyncio
+import logging
 import re
 from typing import List, Optional, Dict, Any
-from google import genai
 from google.genai import types
-from dotenv import load_dotenv
 
 from ..models.table_data import TableData
-from ..config.ai_models import AI_MODELS
+from ..utils import json_fast
+from ..utils.logger import get_logger
+from ..utils.text_utils import build_context_preview
+from .base_ai_extractor import BaseAIExtractor
 
 
-class TableExtractor:
+logger = get_logger(__name__)
+
+# Complete markdown tables: header row | separator row | one or more data rows.
+# Anchored at line start, the separator class excludes newlines and every row
+# must end the line (after optional trailing spaces or tabs), so the match
+# never backtracks across rows.
+_TABLE_RE = re.compile(
+    r'^\|[^\n]+\|[ \t]*\n\|[-| \t:]+\|[ \t]*\n(?:\|[^\n]+\|[ \t]*(?:\n|\Z))+',
+    re.MULTILINE,
+)
+
+
+class TableExtractor(BaseAIExtractor):
     """
     AI-powered table extraction service for scientific papers.
     
@@ -32,80 +45,51 @@ class TableExtractor:
     - Integration with existing 64-bit ID system
     """
     
-    def __init__(self):
-        """
-        Initialize the table extractor with Google GenAI client.
-        
-        Follows the established pattern from ai_extractor.py for consistent
-        initialization and error handling.
-        """
-        # Load environment variables
-        load_dotenv()
-        
-        # Check for API keys following established pattern
-        self.google_api_key = os.getenv('GOOGLE_API_KEY')
-        self.gemini_api_key = os.getenv('GEMINI_API_KEY')
-        
-        if self.google_api_key and self.gemini_api_key:
-            print("Both GOOGLE_API_KEY and GEMINI_API_KEY are set. Using GOOGLE_API_KEY.")
-        
-        if not self.google_api_key and not self.gemini_api_key:
-            raise EnvironmentError(
-                "Neither GOOGLE_API_KEY nor GEMINI_API_KEY environment variable is set. "
-                "Please set one of them to use the Google Generative AI API."
-            )
-        
-        # Initialize the AI client
-        self.client = None
-        self._initialize_client()
-        
-        # Print model configuration for transparency
-        print(f"✓ Table Extractor initialized using model: {AI_MODELS.get_model_for_agent('table')}")
-        print(f"  Temperature: {AI_MODELS.DEFAULT_TEMPERATURE}, Max tokens: {AI_MODELS.DEFAULT_MAX_TOKENS}")
-        
-    def _initialize_client(self) -> None:
-        """Initialize the Google Generative AI client following established patterns."""
-        try:
-            self.client = genai.Client()
-            print("✓ Google GenAI client initialized successfully for table extraction.")
-        except Exception as e:
-            print(f"✗ Error initializing Google GenAI client: {e}")
-            print("Please ensure the API key environment variable is set and valid.")
-            self.client = None
+    agent_key = 'table'
+    display_name = "Table Extractor"
+    client_purpose = "table extraction"
     
-    def extract_tables(self, paper_content: str, paper_id: Optional[int] = None) -> List[TableData]:
+    def extract_tables(self, paper_content: str, paper_id: Optional[int] = None,
+                       context_preview: Optional[str] = None) -> Optional[List[TableData]]:
         """
         Extract and analyze tables from paper content using AI.
         
         Args:
             paper_content: Full markdown content of the paper
             paper_id: Optional paper ID to link tables to their parent paper
+            context_preview: Truncated paper context for the prompts, if already built
             
         Returns:
-            List of TableData objects with comprehensive AI analysis
+            List of TableData objects with comprehensive AI analysis, empty if the
+            paper has no tables, or None if extraction failed
         """
         if not self.client:
-            print("✗ AI client not available. Cannot proceed with table extraction.")
-            return []
+            logger.error("✗ AI client not available. Cannot proceed with table extraction.")
+            return None
         
         try:
-            print("🔍 Starting AI-powered table extraction...")
+            logger.info("🔍 Starting AI-powered table extraction...")
             
             # Extract raw tables using regex
             raw_tables = self._extract_raw_tables_from_markdown(paper_content)
             
             if not raw_tables:
-                print("✗ No tables found in markdown content")
+                logger.info("✗ No tables found in markdown content")
                 return []
             
-            print(f"📊 Found {len(raw_tables)} raw tables, analyzing with AI...")
+            logger.info("📊 Found %d raw tables, analyzing with AI...", len(raw_tables))
+            
+            # Truncate paper context once to avoid token limits while preserving context;
+            # every table prompt shares the same preview
+            if context_preview is None:
+                context_preview = build_context_preview(paper_content)
             
             # Process each table with AI
             table_data_list = []
             for i, raw_table in enumerate(raw_tables, 1):
                 try:
                     # Get AI analysis for this table
-                    analysis = self._ai_analyze_table(raw_table, paper_content, i)
+                    analysis = self._ai_analyze_table(raw_table, context_preview, i)
                     
                     if analysis:
                         # Create TableData object
@@ -127,20 +111,41 @@ class TableExtractor:
                             row_count=self._count_rows(raw_table)
                         )
                         table_data_list.append(table_data)
-                        print(f"  ✓ Table {i}: '{table_data.title[:50]}...' analyzed with AI")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("  ✓ Table %d: '%s...' analyzed with AI", i, table_data.title[:50])
                     else:
-                        print(f"  ✗ Table {i}: AI analysis failed")
+                        logger.warning("  ✗ Table %d: AI analysis failed", i)
                         
                 except Exception as e:
-                    print(f"  ✗ Table {i}: Error during analysis: {e}")
+                    logger.warning("  ✗ Table %d: Error during analysis: %s", i, e)
                     continue
             
-            print(f"✓ Successfully extracted and analyzed {len(table_data_list)} tables")
+            if not table_data_list:
+                logger.error("✗ AI analysis failed for every table")
+                return None
+            
+            logger.info("✓ Successfully extracted and analyzed %d tables", len(table_data_list))
             return table_data_list
             
         except Exception as e:
-            print(f"✗ Error during table extraction: {e}")
-            return []
+            logger.error("✗ Error during table extraction: %s", e)
+            return None
+    
+    async def extract_tables_async(self, paper_content: str, paper_id: Optional[int] = None,
+                                   context_preview: Optional[str] = None) -> Optional[List[TableData]]:
+        """
+        Async variant of extract_tables that runs the blocking LLM calls in a worker thread.
+        
+        Args:
+            paper_content: Full markdown content of the paper
+            paper_id: Optional paper ID to link tables to their parent paper
+            context_preview: Truncated paper context for the prompts, if already built
+            
+        Returns:
+            List of TableData objects with comprehensive AI analysis, empty if the
+            paper has no tables, or None if extraction failed
+        """
+        return await asyncio.to_thread(self.extract_tables, paper_content, paper_id, context_preview)
     
     def _extract_raw_tables_from_markdown(self, content: str) -> List[str]:
         """
@@ -153,26 +158,22 @@ class TableExtractor:
             List of raw table strings in markdown format
         """
         try:
-            # Regex pattern to match complete markdown tables
-            # Matches: header row | separator row | data rows
-            table_pattern = r'(\|[^\n]+\|\n\|[-|\s:]+\|\n(?:\|[^\n]+\|\n?)*)'
-            
-            tables = re.findall(table_pattern, content, re.MULTILINE)
+            # Match complete markdown tables (header, separator and data rows)
+            tables = _TABLE_RE.findall(content)
             
             # Filter and clean tables
             cleaned_tables = []
             for table in tables:
                 table = table.strip()
-                # Only include tables with meaningful content:
-                # - At least 2 rows (header + data)
-                # - Sufficient column structure (more than 6 pipe characters)
-                if table.count('\n') >= 2 and table.count('|') > 6:
+                # _TABLE_RE already guarantees a header and at least one data row,
+                # so only check for sufficient column structure (more than 6 pipe characters)
+                if table.count('|') > 6:
                     cleaned_tables.append(table)
             
             return cleaned_tables
             
         except Exception as e:
-            print(f"✗ Error extracting raw tables: {e}")
+            logger.error("✗ Error extracting raw tables: %s", e)
             return []
     
     def _count_columns(self, table_content: str) -> int:
@@ -211,13 +212,13 @@ class TableExtractor:
         except:
             return 0
     
-    def _ai_analyze_table(self, table_content: str, paper_context: str, table_number: int) -> Optional[Dict[str, Any]]:
+    def _ai_analyze_table(self, table_content: str, context_preview: str, table_number: int) -> Optional[Dict[str, Any]]:
         """
         Use AI to analyze a table in the context of the research paper.
         
         Args:
             table_content: Raw markdown table content
-            paper_context: Full paper content for context
+            context_preview: Paper content already truncated for the prompt
             table_number: Sequential number of this table
             
         Returns:
@@ -225,12 +226,9 @@ class TableExtractor:
         """
         try:
             if not self.client:
-                print(f"✗ AI client not available for table {table_number} analysis")
+                logger.error("✗ AI client not available for table %d analysis", table_number)
                 return None
             
-            # Truncate paper context to avoid token limits while preserving context
-            context_preview = paper_context[:3000] + "..." if len(paper_context) > 3000 else paper_context
-            
             prompt = f"""You are analyzing Table {table_number} from a scientific research paper. 
 
 Paper Context (first 3000 chars):
@@ -256,13 +254,12 @@ Focus on the research significance and interpret the data in the context of the
 Return ONLY a valid JSON object with these exact fields: 'title', 'summary', 'context_analysis', 'statistical_findings', 'keywords'
 Do not include any explanatory text, just the JSON object."""
 
-            model_name = AI_MODELS.get_model_for_agent('table')
-            print(f"  🤖 Analyzing table {table_number} with model: {model_name}")
-            response = self.client.models.generate_content(
-                model=model_name,
+            logger.debug("  🤖 Analyzing table %d with model: %s", table_number, self.model_name)
+            response = self._generate_content(
+                model=self.model_name,
                 contents=prompt,
                 config=types.GenerateContentConfig(
-                    temperature=AI_MODELS.DEFAULT_TEMPERATURE,
+                    temperature=self.temperature,
                     response_mime_type="application/json",
                 ),
             )
@@ -270,23 +267,23 @@ Do not include any explanatory text, just the JSON object."""
             if response.text:
                 try:
                     # Parse JSON response
-                    analysis = json.loads(response.text)
+                    analysis = json_fast.loads(response.text)
                     
                     # Validate required fields
                     required_fields = ['title', 'summary', 'context_analysis', 'statistical_findings', 'keywords']
                     if all(field in analysis for field in required_fields):
                         return analysis
                     else:
-                        print(f"✗ AI response missing required fields for table {table_number}")
+                        logger.warning("✗ AI response missing required fields for table %d", table_number)
                         return None
                     
-                except json.JSONDecodeError as e:
-                    print(f"✗ Error parsing AI response as JSON for table {table_number}: {e}")
+                except json_fast.JSONDecodeError as e:
+                    logger.warning("✗ Error parsing AI response as JSON for table %d: %s", table_number, e)
                     return None
             else:
-                print(f"✗ Empty response from AI for table {table_number}")
+                logger.warning("✗ Empty response from AI for table %d", table_number)
                 return None
                 
         except Exception as e:
-            print(f"✗ Error during AI table analysis for table {table_number}: {e}")
+            logger.error("✗ Error during AI table analysis for table %d: %s", table_number, e)
             return None
@@ -5,19 +5,24 @@ This module provides the TextExtractor class that integrates the experimental
 text agent functionality into the production pipeline.
 """
 
-import os
-import json
-import re
-from typing import List, Optional
-from google import genai
+import asyncio
+from typing import Any, Dict, List, Optional
 from google.genai import types
-from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
 
 from ..models import TextSection
-from ..config.ai_models import AI_MODELS
+from .base_ai_extractor import BaseAIExtractor
+from ..utils.logger import get_logger
 
 
-class TextExtractor:
+logger = get_logger(__name__)
+
+
+# Built once per process; parses and type-checks the AI response in a single pass
+_SECTIONS_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
+
+class TextExtractor(BaseAIExtractor):
     """
     AI-powered extractor for scientific paper text sections.
     
@@ -25,43 +30,11 @@ class TextExtractor:
     into the production pipeline, following the established AI patterns.
     """
     
-    def __init__(self):
-        """Initialize the text extractor with Google API configuration."""
-        # Load environment variables
-        load_dotenv()
-        
-        # Validate Google API key
-        self.google_api_key = os.getenv('GOOGLE_API_KEY')
-        if not self.google_api_key:
-            raise EnvironmentError(
-                "GOOGLE_API_KEY environment variable is not set. "
-                "Please set it to use the Google Generative AI API."
-            )
-        
-        # Define model configuration once - single source of truth
-        self.model_name = AI_MODELS.get_model_for_agent('text')
-        self.temperature = AI_MODELS.DEFAULT_TEMPERATURE
-        self.max_tokens = AI_MODELS.DEFAULT_MAX_TOKENS
-        
-        # Initialize the client following established pattern
-        self.client = None
-        self._initialize_client()
-        
-        # Print model configuration for transparency
-        print(f"✓ Text Extractor initialized using model: {self.model_name}")
-        print(f"  Temperature: {self.temperature}, Max tokens: {self.max_tokens}")
-    
-    def _initialize_client(self) -> None:
-        """Initialize the Google Generative AI client following ai_extractor pattern."""
-        try:
-            self.client = genai.Client()
-            print("✓ Google GenAI client initialized successfully for text extraction.")
-        except Exception as e:
-            print(f"✗ Error initializing Google GenAI client: {e}")
-            print("Please ensure the GOOGLE_API_KEY environment variable is set and valid.")
-            self.client = None
+    agent_key = 'text'
+    display_name = "Text Extractor"
+    client_purpose = "text extraction"
     
-    def extract_text_sections(self, paper_content: str, paper_id: int) -> List[TextSection]:
+    def extract_text_sections(self, paper_content: str, paper_id: int) -> Optional[List[TextSection]]:
         """
         Extract text sections from paper content using AI.
         
@@ -70,20 +43,23 @@ class TextExtractor:
             paper_id: ID of the paper to link sections to
             
         Returns:
-            List of TextSection objects with AI-generated summaries and keywords
+            List of TextSection objects with AI-generated summaries and keywords,
+            empty if the AI found no sections, or None if extraction failed
         """
         if not self.client:
-            print("✗ AI client not available. Cannot proceed with text section extraction.")
-            return []
+            logger.error("✗ AI client not available. Cannot proceed with text section extraction.")
+            return None
         
         try:
-            print("🔍 Starting AI-powered text section extraction...")
+            logger.info("🔍 Starting AI-powered text section extraction...")
             
             # Use AI to extract sections with analysis
             sections_data = self._ai_extract_and_analyze_sections(paper_content)
             
+            if sections_data is None:
+                return None
             if not sections_data:
-                print("✗ No sections identified by AI")
+                logger.warning("✗ No sections identified by AI")
                 return []
             
             # Convert to TextSection objects
@@ -108,16 +84,30 @@ class TextExtractor:
                         word_count=len(content.split())
                     )
                     text_sections.append(section)
-                    print(f"  ✓ Section {i}: '{title[:50]}...' analyzed with AI")
+                    logger.info("  ✓ Section %s: '%s...' analyzed with AI", i, title[:50])
             
-            print(f"✓ Successfully extracted {len(text_sections)} sections with AI analysis")
+            logger.info("✓ Successfully extracted %s sections with AI analysis", len(text_sections))
             return text_sections
             
         except Exception as e:
-            print(f"✗ Error during AI-powered text section extraction: {e}")
-            return []
+            logger.error("✗ Error during AI-powered text section extraction: %s", e)
+            return None
     
-    def _ai_extract_and_analyze_sections(self, paper_content: str) -> List[dict]:
+    async def extract_text_sections_async(self, paper_content: str, paper_id: int) -> Optional[List[TextSection]]:
+        """
+        Async variant of extract_text_sections that runs the blocking LLM call in a worker thread.
+        
+        Args:
+            paper_content: Full content of the paper
+            paper_id: ID of the paper to link sections to
+            
+        Returns:
+            List of TextSection objects with AI-generated summaries and keywords,
+            empty if the AI found no sections, or None if extraction failed
+        """
+        return await asyncio.to_thread(self.extract_text_sections, paper_content, paper_id)
+    
+    def _ai_extract_and_analyze_sections(self, paper_content: str) -> Optional[List[dict]]:
         """
         Use AI to intelligently extract sections with comprehensive analysis.
         
@@ -125,10 +115,12 @@ class TextExtractor:
             paper_content: Full paper content
             
         Returns:
-            List of section dictionaries with title, content, summary, keywords, and level
+            List of section dictionaries with title, content, summary, keywords, and level,
+            or None if the AI call or its response failed
         """
         try:
-            prompt = f"""You are analyzing a scientific research paper. Extract the main text sections, excluding:
+            # The paper goes in its own prompt part rather than being copied into the instructions
+            prompt = ["""You are analyzing a scientific research paper. Extract the main text sections, excluding:
 - References/Bibliography
 - Tables and figures 
 - Image descriptions
@@ -148,16 +140,16 @@ Focus on substantial text sections containing research content, methods, results
 
 Paper content to analyze:
 ---
-{paper_content}
+""", paper_content, """
 ---
 
 Return ONLY a valid JSON array of objects with these exact fields: 'title', 'content', 'summary', 'keywords', 'level'
-Do not include any explanatory text, just the JSON array."""
+Do not include any explanatory text, just the JSON array."""]
 
-            print(f"  🤖 Analyzing text sections with model: {self.model_name}")
-            response = self.client.models.generate_content(
+            logger.info("  🤖 Analyzing text sections with model: %s", self.model_name)
+            response = self._generate_content(
                 model=self.model_name,
-                contents=[prompt],
+                contents=prompt,
                 config=types.GenerateContentConfig(
                     temperature=self.temperature,
                     response_mime_type="application/json",
@@ -166,24 +158,19 @@ Do not include any explanatory text, just the JSON array."""
             
             if response.text:
                 try:
-                    # Parse JSON response directly
-                    sections_data = json.loads(response.text)
+                    # Parse JSON response and validate that we got a list of objects
+                    sections_data = _SECTIONS_ADAPTER.validate_json(response.text)
                     
-                    # Validate that we got a list
-                    if not isinstance(sections_data, list):
-                        print("✗ AI response is not a list")
-                        return []
-                    
-                    print(f"✓ AI extracted and analyzed {len(sections_data)} sections")
+                    logger.info("✓ AI extracted and analyzed %s sections", len(sections_data))
                     return sections_data
                     
-                except json.JSONDecodeError as e:
-                    print(f"✗ Error parsing AI response as JSON: {e}")
-                    return []
+                except ValidationError as e:
+                    logger.error("✗ Error parsing AI response as a JSON list of sections: %s", e)
+                    return None
             else:
-                print("✗ Empty response from AI for section extraction")
-                return []
+                logger.error("✗ Empty response from AI for section extraction")
+                return None
                 
         except Exception as e:
-            print(f"✗ Error during AI section extraction and analysis: {e}")
-            return []
+            logger.error("✗ Error during AI section extraction and analysis: %s", e)
+            return None
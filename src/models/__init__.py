@@ -6,13 +6,51 @@ text sections functionality, table extraction functionality, image extraction fu
 and references extraction functionality.
 """
 
-from .paper_metadata import PaperMetadata, generate_64bit_id
-from .text_section import TextSection
-from .table_data import TableData
-from .image_data import ImageData
-from .references_data import ReferencesData
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ['PaperMetadata', 'TextSection', 'TableData', 'ImageData', 'ReferencesData', 'generate_64bit_id']
+if TYPE_CHECKING:
+    from .base_data_model import BaseDataModel, PaperChildModel
+    from .paper_metadata import PaperMetadata, batch_now, batch_timestamp, generate_64bit_id, generate_fast_64bit_id
+    from .text_section import TextSection
+    from .table_data import TableData
+    from .image_data import ImageData
+    from .references_data import ReferencesData
+
+__all__ = ['BaseDataModel', 'PaperChildModel', 'PaperMetadata', 'TextSection', 'TableData', 'ImageData', 'ReferencesData', 'generate_64bit_id',
+           'generate_fast_64bit_id', 'batch_now', 'batch_timestamp']
+
+# Public name -> submodule defining it. Models are imported on first access
+# (PEP 562) so callers only pay the Pydantic import cost for what they use.
+_LAZY_IMPORTS = {
+    'BaseDataModel': '.base_data_model',
+    'PaperChildModel': '.base_data_model',
+    'PaperMetadata': '.paper_metadata',
+    'generate_64bit_id': '.paper_metadata',
+    'generate_fast_64bit_id': '.paper_metadata',
+    'batch_now': '.paper_metadata',
+    'batch_timestamp': '.paper_metadata',
+    'TextSection': '.text_section',
+    'TableData': '.table_data',
+    'ImageData': '.image_data',
+    'ReferencesData': '.references_data',
+}
+
+
+def __getattr__(name: str):
+    """Resolve model classes lazily on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # Future models will be added here as they are implemented:
 # - Author (for detailed author information)
@@ -0,0 +1,60 @@
+"""
+Shared Pydantic base model for paper extraction data.
+
+This module defines the BaseDataModel class that all extraction models
+inherit from, providing common serialization helpers.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class BaseDataModel(BaseModel):
+    """
+    Base class for the paper extraction models.
+
+    Holds helpers shared by every model so that storage, logging and any
+    future HTTP layer serialize them the same way.
+    """
+
+    # Build the core schema on first use instead of at import time; subclasses
+    # merge their own model_config on top of this one
+    model_config = ConfigDict(defer_build=True)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the model straight to JSON bytes.
+
+        Uses the compiled pydantic-core serializer directly, avoiding the
+        intermediate dict from model_dump() and the str -> bytes encode of
+        model_dump_json(). Datetimes are emitted as ISO 8601 strings.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
+
+class PaperChildModel(BaseDataModel):
+    """
+    Base class for records that belong to a parent paper.
+
+    Text sections, tables, images and references all carry a ``paper_id``
+    foreign key and are created in bulk once the parent paper is known.
+    """
+
+    @classmethod
+    def for_paper(cls, paper_id: int, **fields):
+        """
+        Build a record for a known-valid paper without running validation.
+
+        Only use with trusted values (database rows or fields computed by the
+        pipeline itself); AI output should still go through the constructor.
+
+        Args:
+            paper_id: ID of the parent paper
+            **fields: Remaining model fields; unset fields take their defaults
+
+        Returns:
+            Model instance
+        """
+        return cls.model_construct(paper_id=paper_id, **fields)
@@ -6,12 +6,31 @@ image metadata and AI analysis results from scientific papers.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
-from pydantic import BaseModel, Field
-from .paper_metadata import generate_64bit_id
+from pydantic import ConfigDict, Field
 
+from .base_data_model import PaperChildModel
+from . import paper_metadata
+from .paper_metadata import batch_now, generate_64bit_id, generate_fast_64bit_id
 
-class ImageData(BaseModel):
+
+@lru_cache(maxsize=4096)
+def _cached_image_id(alt_text: str, data_prefix: str, image_number: int) -> int:
+    """Memoized image ID keyed on the already-truncated image data prefix."""
+    if paper_metadata.USE_FAST_HASH:
+        # Assemble the bytes directly instead of formatting a str and encoding it;
+        # base64 data is pure ASCII
+        return generate_fast_64bit_id(b"image_%d:%b:%b" % (
+            image_number,
+            alt_text.encode('utf-8', errors='ignore'),
+            data_prefix.encode('ascii', errors='ignore'),
+        ))
+    unique_input = f"image_{image_number}:{alt_text}:{data_prefix}"
+    return generate_64bit_id(unique_input, f"image_{image_number}")
+
+
+class ImageData(PaperChildModel):
     """
     Model for extracted images from scientific papers.
     
@@ -19,6 +38,8 @@ class ImageData(BaseModel):
     and uses the established 64-bit ID system.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     id: int = Field(..., description="64-bit unique identifier for this image")
     paper_id: Optional[int] = Field(None, description="64-bit ID of the parent paper if available")
     image_number: int = Field(..., description="Sequential order of this image in the document")
@@ -30,7 +51,7 @@ class ImageData(BaseModel):
     statistical_analysis: str = Field("", description="Analysis of any statistical content in the image")
     contextual_relevance: str = Field(..., description="How the image relates to the research context")
     keywords: List[str] = Field(default_factory=list, description="Keywords related to image and paper context")
-    extracted_at: datetime = Field(default_factory=datetime.now, description="Timestamp of extraction")
+    extracted_at: datetime = Field(default_factory=batch_now, description="Timestamp of extraction")
     
     @classmethod
     def generate_image_id(cls, alt_text: str, image_data: str, image_number: int) -> int:
@@ -45,7 +66,6 @@ class ImageData(BaseModel):
         Returns:
             64-bit integer ID
         """
-        # Create unique input combining all image identifiers
-        # Use first 500 chars of image data to ensure uniqueness while avoiding massive strings
-        unique_input = f"image_{image_number}:{alt_text}:{image_data[:500]}"
-        return generate_64bit_id(unique_input, f"image_{image_number}")
+        # Use first 500 chars of image data to ensure uniqueness while keeping the cache key bounded
+        data_prefix = image_data if len(image_data) <= 500 else image_data[:500]
+        return _cached_image_id(alt_text, data_prefix, image_number)
@@ -2,10 +2,62 @@
 Core data models for paper extraction system.
 """
 
-from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
 import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator, List, Optional
+from pydantic import ConfigDict, Field, field_validator
+
+from .base_data_model import BaseDataModel
+
+
+# Section, table, image and references IDs are opaque identifiers rather than
+# security tokens, so they default to the cheaper generate_fast_64bit_id.
+# Set to False (before any IDs are generated) to use SHA-256 for them as well.
+USE_FAST_HASH = True
+
+
+# Timestamp shared by every model created inside a batch_timestamp() block
+_batch_timestamp: ContextVar[Optional[datetime]] = ContextVar('batch_timestamp', default=None)
+
+
+def batch_now() -> datetime:
+    """
+    Return the current batch timestamp, or datetime.now() outside of a batch.
+    
+    Used as the extracted_at default so that all records extracted from one
+    paper share a single timestamp instead of reading the clock per model.
+    
+    Returns:
+        Extraction timestamp
+    """
+    timestamp = _batch_timestamp.get()
+    return timestamp if timestamp is not None else datetime.now()
+
+
+@contextmanager
+def batch_timestamp(timestamp: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Fix the extraction timestamp for all models created within the block.
+    
+    Can also be used as a decorator; each call then gets a fresh timestamp,
+    unless it runs inside an enclosing batch, whose timestamp it keeps.
+    
+    Args:
+        timestamp: Timestamp of a batch started elsewhere, such as in the
+            process that dispatched this work; a new one is taken if not given
+    
+    Yields:
+        The timestamp returned by batch_now() inside the block
+    """
+    if timestamp is None:
+        timestamp = _batch_timestamp.get() or datetime.now()
+    token = _batch_timestamp.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _batch_timestamp.reset(token)
 
 
 def generate_64bit_id(content: str, source_file: str) -> int:
@@ -33,7 +85,24 @@ def generate_64bit_id(content: str, source_file: str) -> int:
     return hash_64bit & 0x7FFFFFFFFFFFFFFF
 
 
-class PaperMetadata(BaseModel):
+def generate_fast_64bit_id(data: bytes) -> int:
+    """
+    Generate a 64-bit ID from already-encoded bytes using an 8-byte BLAKE2b digest.
+    
+    Unlike the built-in hash(), the result is stable across processes, so IDs
+    stay deterministic between runs.
+    
+    Args:
+        data: Encoded unique input
+        
+    Returns:
+        Positive 64-bit integer ID
+    """
+    digest = hashlib.blake2b(data, digest_size=8).digest()
+    return int.from_bytes(digest, 'big') & 0x7FFFFFFFFFFFFFFF
+
+
+class PaperMetadata(BaseDataModel):
     """
     Pydantic model for scientific paper metadata.
     
@@ -41,6 +110,9 @@ class PaperMetadata(BaseModel):
     implemented and stored in the papers.paper_metadata table.
     """
     
+    # Instances are immutable once extracted; use model_copy(update=...) to derive variants
+    model_config = ConfigDict(frozen=True)
+    
     # Core identification and bibliographic information
     id: int = Field(..., description="64-bit unique identifier for the paper")
     title: str = Field(..., description="Title of the paper")
@@ -56,7 +128,7 @@ class PaperMetadata(BaseModel):
     
     # Source and extraction information
     source_file: str = Field(..., description="Source file path or name")
-    extracted_at: datetime = Field(default_factory=datetime.now, description="Timestamp of extraction")
+    extracted_at: datetime = Field(default_factory=batch_now, description="Timestamp of extraction")
     
     # Funding and ethical considerations
     funding_sources: List[str] = Field(default_factory=list, description="Funding sources")
@@ -68,8 +140,9 @@ class PaperMetadata(BaseModel):
     # Supplemental materials
     supplemental_materials: List[str] = Field(default_factory=list, description="List of supplemental materials")
 
-    @validator('id')
-    def validate_id_size(cls, v):
+    @field_validator('id')
+    @classmethod
+    def validate_id_size(cls, v: int) -> int:
         """Ensure the ID fits within 64 bits."""
         if v < 0 or v >= (1 << 64):
             raise ValueError("ID must be a 64-bit integer (0 to 2^64-1)")
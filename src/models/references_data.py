@@ -6,12 +6,25 @@ references/bibliography data from scientific papers.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
-from .paper_metadata import generate_64bit_id
+from functools import lru_cache
+from typing import Optional, Tuple
+from pydantic import ConfigDict, Field
 
+from .base_data_model import PaperChildModel
+from . import paper_metadata
+from .paper_metadata import batch_now, generate_64bit_id, generate_fast_64bit_id
 
-class ReferencesData(BaseModel):
+
+@lru_cache(maxsize=4096)
+def _cached_references_id(paper_id: int, reference_count: int) -> int:
+    """Memoized references list ID."""
+    if paper_metadata.USE_FAST_HASH:
+        return generate_fast_64bit_id(b"references_%d:%d" % (paper_id, reference_count))
+    unique_input = f"references_{paper_id}:{reference_count}"
+    return generate_64bit_id(unique_input, f"references_{paper_id}")
+
+
+class ReferencesData(PaperChildModel):
     """
     Model for extracted references from scientific papers.
     
@@ -19,11 +32,13 @@ class ReferencesData(BaseModel):
     and uses the established 64-bit ID system.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     id: int = Field(..., description="64-bit unique identifier for this references list")
     paper_id: Optional[int] = Field(None, description="64-bit ID of the parent paper if available")
-    references: List[str] = Field(default_factory=list, description="List of references as they appear in original text")
+    references: Tuple[str, ...] = Field(default_factory=tuple, description="References as they appear in original text")
     reference_count: int = Field(..., description="Total number of references found")
-    extracted_at: datetime = Field(default_factory=datetime.now, description="Timestamp of extraction")
+    extracted_at: datetime = Field(default_factory=batch_now, description="Timestamp of extraction")
     
     @classmethod
     def generate_references_id(cls, paper_id: int, reference_count: int) -> int:
@@ -37,6 +52,4 @@ class ReferencesData(BaseModel):
         Returns:
             64-bit integer ID
         """
-        # Create unique input combining paper ID and reference count
-        unique_input = f"references_{paper_id}:{reference_count}"
-        return generate_64bit_id(unique_input, f"references_{paper_id}")
+        return _cached_references_id(paper_id, reference_count)
@@ -6,13 +6,31 @@ following the project's established patterns for data validation and 64-bit ID g
 """
 
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Optional, Tuple
+from pydantic import ConfigDict, Field
 
-from .paper_metadata import generate_64bit_id
+from .base_data_model import PaperChildModel
 
+from . import paper_metadata
+from .paper_metadata import batch_now, generate_64bit_id, generate_fast_64bit_id
 
-class TableData(BaseModel):
+
+@lru_cache(maxsize=4096)
+def _cached_table_id(title: str, content_prefix: str, table_number: int) -> int:
+    """Memoized table ID keyed on the already-truncated content prefix."""
+    if paper_metadata.USE_FAST_HASH:
+        # Assemble the bytes directly instead of formatting a str and encoding it
+        return generate_fast_64bit_id(b"table_%d:%b:%b" % (
+            table_number,
+            title.encode('utf-8', errors='ignore'),
+            content_prefix.encode('utf-8', errors='ignore'),
+        ))
+    unique_input = f"table_{table_number}:{title}:{content_prefix}"
+    return generate_64bit_id(unique_input, f"table_{table_number}")
+
+
+class TableData(PaperChildModel):
     """
     Pydantic model for extracted tables from scientific papers.
     
@@ -34,6 +52,10 @@ class TableData(BaseModel):
         extracted_at: Timestamp when extraction was performed
     """
     
+    # Tables are never modified after extraction; datetimes already serialize
+    # to ISO 8601 in Pydantic v2, so no custom json_encoders are needed
+    model_config = ConfigDict(frozen=True)
+    
     id: int = Field(
         ..., 
         description="64-bit unique identifier for this table"
@@ -66,8 +88,8 @@ class TableData(BaseModel):
         ..., 
         description="AI-identified statistical results, conclusions, and key findings"
     )
-    keywords: List[str] = Field(
-        default_factory=list, 
+    keywords: Tuple[str, ...] = Field(
+        default_factory=tuple, 
         description="AI-generated keywords for search and categorization"
     )
     column_count: int = Field(
@@ -79,7 +101,7 @@ class TableData(BaseModel):
         description="Number of data rows (excluding header and separator rows)"
     )
     extracted_at: datetime = Field(
-        default_factory=datetime.now, 
+        default_factory=batch_now, 
         description="Timestamp when the table extraction was performed"
     )
     
@@ -108,16 +130,6 @@ class TableData(BaseModel):
             >>> isinstance(table_id, int)
             True
         """
-        # Create unique input combining all table identifiers
-        # Use first 500 chars of content to ensure uniqueness while avoiding massive strings
-        unique_input = f"table_{table_number}:{title}:{content[:500]}"
-        return generate_64bit_id(unique_input, f"table_{table_number}")
-
-    class Config:
-        """Pydantic model configuration."""
-        # Allow extra validation and serialization features
-        validate_assignment = True
-        # Ensure datetime objects are serialized properly
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+        # Use first 500 chars of content to ensure uniqueness while keeping the cache key bounded
+        content_prefix = content if len(content) <= 500 else content[:500]
+        return _cached_table_id(title, content_prefix, table_number)
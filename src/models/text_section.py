@@ -6,14 +6,32 @@ and type safety. This model represents extracted text sections from scientific p
 """
 
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Optional, Tuple
+from pydantic import ConfigDict, Field
+
+from .base_data_model import PaperChildModel
 
 # Import the existing ID generation function
-from .paper_metadata import generate_64bit_id
+from . import paper_metadata
+from .paper_metadata import batch_now, generate_64bit_id, generate_fast_64bit_id
+
 
+@lru_cache(maxsize=4096)
+def _cached_section_id(title: str, content_prefix: str, section_number: int) -> int:
+    """Memoized section ID keyed on the already-truncated content prefix."""
+    if paper_metadata.USE_FAST_HASH:
+        # Assemble the bytes directly instead of formatting a str and encoding it
+        return generate_fast_64bit_id(b"section_%d:%b:%b" % (
+            section_number,
+            title.encode('utf-8', errors='ignore'),
+            content_prefix.encode('utf-8', errors='ignore'),
+        ))
+    unique_input = f"section_{section_number}:{title}:{content_prefix}"
+    return generate_64bit_id(unique_input, f"section_{section_number}")
 
-class TextSection(BaseModel):
+
+class TextSection(PaperChildModel):
     """
     Model for extracted text sections from scientific papers.
     
@@ -21,16 +39,18 @@ class TextSection(BaseModel):
     and uses the established 64-bit ID system.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     id: int = Field(..., description="64-bit unique identifier for this section")
     paper_id: Optional[int] = Field(None, description="64-bit ID of the parent paper if available")
     title: str = Field(..., description="Title/heading of the section")
     content: str = Field(..., description="Full text content of the section (verbatim)")
     summary: str = Field(..., description="Comprehensive summary of the section content")
-    keywords: List[str] = Field(default_factory=list, description="Key words and phrases for searching this section")
+    keywords: Tuple[str, ...] = Field(default_factory=tuple, description="Key words and phrases for searching this section")
     section_number: int = Field(..., description="Sequential order of this section in the document")
     level: int = Field(1, description="Heading level (1 for main sections, 2 for subsections, etc.)")
     word_count: int = Field(0, description="Number of words in the content")
-    extracted_at: datetime = Field(default_factory=datetime.now, description="Timestamp of extraction")
+    extracted_at: datetime = Field(default_factory=batch_now, description="Timestamp of extraction")
     
     @classmethod
     def generate_section_id(cls, title: str, content: str, section_number: int) -> int:
@@ -45,6 +65,6 @@ class TextSection(BaseModel):
         Returns:
             64-bit integer ID
         """
-        # Create unique input combining all section identifiers
-        unique_input = f"section_{section_number}:{title}:{content[:500]}"
-        return generate_64bit_id(unique_input, f"section_{section_number}")
+        # IDs are pure functions of their inputs, so re-runs hit the cache
+        content_prefix = content if len(content) <= 500 else content[:500]
+        return _cached_section_id(title, content_prefix, section_number)
@@ -5,14 +5,132 @@ This module provides the PaperProcessor class that orchestrates the complete
 paper processing workflow using the refactored components.
 """
 
+import asyncio
+import glob
+import hashlib
+import itertools
+import logging
+import multiprocessing
 import os
+import queue
 import sys
-from typing import Optional, Tuple, Dict, List
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Dict, List, Mapping
 
-from .models import PaperMetadata, TextSection, TableData, ImageData, ReferencesData
-from .extraction import AIExtractor, TextExtractor, TableExtractor, ImageExtractor, ReferencesExtractor
-from .database import DatabaseConnection, SchemaManager, PaperMetadataRepository, TextSectionsRepository, TableDataRepository, ImageRepository, ReferencesRepository
-from .utils import FileLoader
+from pydantic import TypeAdapter, ValidationError
+
+from .models import PaperMetadata, TextSection, TableData, ImageData, ReferencesData, batch_now, batch_timestamp
+from .database import DatabaseConnection, PaperMetadataRepository, TextSectionsRepository, TableDataRepository, ImageRepository, ReferencesRepository
+from .config.ai_models import AI_MODELS
+from .utils import FileLoader, ExtractionCache, DEFAULT_CACHE_DIR, build_context_preview, configure_logging, get_logger
+
+if TYPE_CHECKING:
+    from .extraction import AIExtractor, TextExtractor, TableExtractor, ImageExtractor, ReferencesExtractor
+    from .database import SchemaManager
+
+
+logger = get_logger(__name__)
+
+# Database writer threads of process_batch, and how many prepared papers may wait
+# for a writer before the extraction of further papers is held back
+DEFAULT_WRITERS = 2
+PIPELINE_QUEUE_SIZE = 16
+
+# Validators for cached extraction results, by extraction step
+_CACHE_ADAPTERS: Dict[str, TypeAdapter] = {
+    'metadata': TypeAdapter(PaperMetadata),
+    'text_sections': TypeAdapter(List[TextSection]),
+    'tables': TypeAdapter(List[TableData]),
+    'images': TypeAdapter(List[ImageData]),
+    'references': TypeAdapter(ReferencesData),
+}
+
+# Extractor class running each extraction step; its agent_key decides the model used
+_STEP_EXTRACTORS = {
+    'metadata': 'AIExtractor',
+    'text_sections': 'TextExtractor',
+    'tables': 'TableExtractor',
+    'images': 'ImageExtractor',
+    'references': 'ReferencesExtractor',
+}
+
+
+def _step_model(step: str) -> str:
+    """
+    Name the model an extraction step runs on, as part of its cache key.
+    
+    Args:
+        step: Extraction step, a key of _STEP_EXTRACTORS
+        
+    Returns:
+        Model name for the agent_key of the step's extractor
+    """
+    # Imported here, like the extractors themselves, to load the GenAI SDK only when needed
+    from . import extraction
+    return AI_MODELS.get_model_for_agent(getattr(extraction, _STEP_EXTRACTORS[step]).agent_key)
+
+
+def _overwrite(*parts: str) -> Mapping[str, bool]:
+    """Build a read-only overwrite choice that replaces only the given parts."""
+    return MappingProxyType({
+        part: part in parts
+        for part in ('metadata', 'text_sections', 'tables', 'images', 'references')
+    })
+
+
+# Overwrite choices offered for a paper that is already stored, by menu entry
+_SKIP_ALL = _overwrite()
+_OVERWRITE_ALL = _overwrite('metadata', 'text_sections', 'tables', 'images', 'references')
+_OVERWRITE_CHOICES: Dict[str, Mapping[str, bool]] = {
+    '1': _SKIP_ALL,
+    '2': _overwrite('text_sections'),
+    '3': _overwrite('tables'),
+    '4': _overwrite('images'),
+    '5': _overwrite('references'),
+    '6': _overwrite('text_sections', 'tables'),
+    '7': _overwrite('text_sections', 'images'),
+    '8': _overwrite('text_sections', 'references'),
+    '9': _overwrite('tables', 'images'),
+    '10': _overwrite('tables', 'references'),
+    '11': _overwrite('images', 'references'),
+    '12': _OVERWRITE_ALL,
+}
+
+
+async def _resolved(value: Any) -> Any:
+    """Return a value from a coroutine, standing in for an extraction that is skipped."""
+    return value
+
+
+@dataclass
+class _PreparedPaper:
+    """
+    A paper whose duplicate check and AI extractions are done, ready to be stored.
+    
+    process_batch builds these in worker processes and stores them in the
+    parent, so every field must be picklable.
+    """
+    # None when a stored paper is kept without extracting its metadata
+    paper_metadata: Optional[PaperMetadata]
+    exists: bool
+    overwrite_choices: Dict[str, bool]
+    # Parts that are wanted come back as None if their extraction failed
+    text_sections: Optional[List[TextSection]] = None
+    tables: Optional[List[TableData]] = None
+    images: Optional[List[ImageData]] = None
+    references: Optional[ReferencesData] = None
+    
+    def wanted(self) -> Dict[str, bool]:
+        """Which of 'text_sections', 'tables', 'images' and 'references' to extract and store."""
+        return {
+            part: not self.exists or self.overwrite_choices.get(part, False)
+            for part in ('text_sections', 'tables', 'images', 'references')
+        }
 
 
 class PaperProcessor:
@@ -23,31 +141,113 @@ class PaperProcessor:
     workflow from file loading to database storage.
     """
     
-    def __init__(self, schema_name: str = 'papers'):
+    def __init__(self, schema_name: str = 'papers', non_interactive: bool = False,
+                 synchronous_commit: bool = True):
         """
         Initialize the paper processor.
         
         Args:
             schema_name: Name of the database schema to use
+            non_interactive: Instead of prompting for input, keep what is stored for papers
+                that already exist and only fill in their missing parts
+            synchronous_commit: Set to False for bulk ingest to commit papers without
+                waiting for the WAL flush; a server crash may lose the latest papers
         """
         self.schema_name = schema_name
+        self.non_interactive = non_interactive
+        self.synchronous_commit = synchronous_commit
         
-        # Initialize components
+        # Initialize components; the schema manager and AI extractors are created
+        # on first use so read-only commands never load the GenAI SDK
         self.db_connection = DatabaseConnection()
-        self.schema_manager = SchemaManager(self.db_connection)
         self.repository = PaperMetadataRepository(self.db_connection, schema_name)
         self.text_sections_repository = TextSectionsRepository(self.db_connection, schema_name)
         self.table_data_repository = TableDataRepository(self.db_connection, schema_name)
         self.image_repository = ImageRepository(self.db_connection, schema_name)
         self.references_repository = ReferencesRepository(self.db_connection, schema_name)
-        self.extractor = AIExtractor()
-        self.text_extractor = TextExtractor()
-        self.table_extractor = TableExtractor()
-        self.image_extractor = ImageExtractor()
-        self.references_extractor = ReferencesExtractor()
         
-        print(f"✓ Paper processor initialized with schema '{schema_name}'")
+        # Papers already found or stored during this processor's lifetime, keyed by
+        # DOI and by title, so repeated lookups in a run skip the database
+        self._seen_dois: Dict[str, Dict[str, Any]] = {}
+        self._seen_titles: Dict[str, Dict[str, Any]] = {}
+        
+        # DOI lookups answered before this processor started, such as the batched
+        # lookup of process_batch; None marks a DOI known not to be stored
+        self._known_dois: Dict[str, Optional[Dict[str, Any]]] = {}
+        
+        # Set once setup_complete_schema has run, so the DDL checks happen once per processor
+        self._schema_ready = False
+        
+        # AI extraction results from earlier runs, so unchanged papers skip their LLM calls
+        self.cache = ExtractionCache(os.getenv("PAPER_CACHE_DIR", DEFAULT_CACHE_DIR))
+        
+        logger.info("✓ Paper processor initialized with schema '%s'", schema_name)
+    
+    @cached_property
+    def schema_manager(self) -> 'SchemaManager':
+        """Schema manager, only needed on write paths."""
+        from .database import SchemaManager
+        return SchemaManager(self.db_connection)
+    
+    @cached_property
+    def extractor(self) -> 'AIExtractor':
+        """Metadata extractor, created on first use."""
+        from .extraction import AIExtractor
+        return AIExtractor()
+    
+    @cached_property
+    def text_extractor(self) -> 'TextExtractor':
+        """Text section extractor, created on first use."""
+        from .extraction import TextExtractor
+        return TextExtractor()
+    
+    @cached_property
+    def table_extractor(self) -> 'TableExtractor':
+        """Table extractor, created on first use."""
+        from .extraction import TableExtractor
+        return TableExtractor()
+    
+    @cached_property
+    def image_extractor(self) -> 'ImageExtractor':
+        """Image extractor, created on first use."""
+        from .extraction import ImageExtractor
+        return ImageExtractor()
+    
+    @cached_property
+    def references_extractor(self) -> 'ReferencesExtractor':
+        """References extractor, created on first use."""
+        from .extraction import ReferencesExtractor
+        return ReferencesExtractor()
+    
+    def __enter__(self) -> 'PaperProcessor':
+        """Open the database connection once for a series of operations."""
+        self._ensure_connection()
+        return self
     
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the database connection."""
+        self.shutdown()
+    
+    def __del__(self) -> None:
+        """Release the database connection if shutdown() was never called."""
+        if getattr(self, 'db_connection', None) is not None and self.db_connection.connection:
+            self.close_connections()
+    
+    def _ensure_connection(self) -> None:
+        """Connect to the database unless a connection is already open."""
+        if not self.db_connection.connection:
+            self.db_connection.connect()
+    
+    def _ensure_schema(self) -> None:
+        """Set up the database schema the first time it is needed."""
+        if self._schema_ready:
+            logger.info("✓ Schema '%s' already set up", self.schema_name)
+            return
+        
+        self.schema_manager.setup_complete_schema(self.schema_name)
+        self._schema_ready = True
+    
+    @batch_timestamp()
     def process_paper(self, paper_file_path: str) -> bool:
         """
         Process a single paper through the complete pipeline.
@@ -58,166 +258,588 @@ class PaperProcessor:
         Returns:
             True if successful, False otherwise
         """
-        print("🚀 Starting paper processing pipeline...")
-        print("=" * 60)
+        logger.info("🚀 Starting paper processing pipeline...")
+        logger.info("=" * 60)
         
         try:
-            # Step 1: Validate and load paper content
-            print("\n📖 Step 1: Loading paper content...")
-            if not FileLoader.validate_file_exists(paper_file_path):
-                print(f"✗ Error: Paper file does not exist: {paper_file_path}")
-                return False
+            prepared = self._prepare_paper(paper_file_path)
+            return prepared is not None and self._store_paper(prepared)
             
-            paper_content = FileLoader.load_paper_content(paper_file_path)
-            if not paper_content:
-                print("✗ Failed to load paper content")
-                return False
+        except Exception as e:
+            logger.error("\n✗ Critical error in paper processing pipeline: %s", e)
+            # Rollback on error
+            if self.db_connection.connection:
+                self.db_connection.connection.rollback()
+            return False
+    
+    @batch_timestamp()
+    def process_batch(self, paper_file_paths: List[str], workers: Optional[int] = None,
+                      writers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Process several papers as a pipeline of extraction processes feeding database writers.
+        
+        Worker processes load each paper, check it for duplicates and run its AI
+        extractions with their own non-interactive processors; papers that
+        already exist only get their missing parts filled in. The prepared
+        papers pass through a bounded queue to writer threads in this process,
+        each with its own pooled connection, so LLM calls overlap with database
+        writes instead of alternating with them. While the queue is full no
+        further papers are sent to extraction.
+        
+        Later copies of a paper that occurs more than once in the batch are
+        skipped, and the DOIs found in the files are looked up with a single
+        query before any worker starts. Workers are started with the spawn
+        method so no connection or lock held by this process is copied into them.
+        
+        Args:
+            paper_file_paths: Paths to the paper files to process
+            workers: Number of worker processes; defaults to the PAPER_WORKERS
+                environment variable, or one less than the number of CPUs
+            writers: Number of database writer threads; defaults to the
+                PAPER_WRITERS environment variable, or DEFAULT_WRITERS
             
-            # Step 2: Extract metadata using AI
-            print("\n🤖 Step 2: Extracting metadata using AI...")
-            paper_metadata = self.extractor.extract_metadata(paper_content, paper_file_path)
-            if not paper_metadata:
-                print("✗ Failed to extract metadata")
-                return False
+        Returns:
+            Dictionary mapping each paper file path to its success flag
+        """
+        if workers is None:
+            workers = int(os.getenv("PAPER_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+        if writers is None:
+            writers = int(os.getenv("PAPER_WRITERS", DEFAULT_WRITERS))
+        
+        logger.info("🚀 Starting batch processing of %s paper(s) in %s process(es) with %s writer(s)...",
+                    len(paper_file_paths), workers, writers)
+        logger.info("=" * 60)
+        
+        results: Dict[str, bool] = {}
+        # Guards results and claimed, which the writer threads share
+        lock = threading.Lock()
+        # Papers being stored by this batch, by ('id', paper ID) for stored papers
+        # and by ('doi', DOI) and ('title', title) for new ones, with their file
+        claimed: Dict[Tuple[str, Any], str] = {}
+        # Prepared papers on their way to the writers; None tells a writer to stop
+        payloads: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        
+        def finish(paper_file_path: str, success: bool) -> None:
+            with lock:
+                results[paper_file_path] = success
+                logger.info("%s [%s/%s] %s", '✓' if success else '✗',
+                            len(results), len(paper_file_paths), paper_file_path)
+        
+        def claim(paper_file_path: str, prepared: _PreparedPaper) -> Optional[str]:
+            # Returns the file already claiming the same paper, if any
+            paper_metadata = prepared.paper_metadata
+            if prepared.exists:
+                keys = [('id', paper_metadata.id)]
+            else:
+                keys = [('doi', paper_metadata.doi.lower())] if paper_metadata.doi else []
+                if paper_metadata.title:
+                    keys.append(('title', paper_metadata.title))
+            with lock:
+                for key in keys:
+                    if key in claimed:
+                        return claimed[key]
+                for key in keys:
+                    claimed[key] = paper_file_path
+            return None
+        
+        def release(paper_file_path: str) -> None:
+            # A paper that failed to store may still be stored from a later copy
+            with lock:
+                for key in [key for key, path in claimed.items() if path == paper_file_path]:
+                    del claimed[key]
+        
+        def write(writer: 'PaperProcessor') -> None:
+            try:
+                with batch_timestamp(timestamp):
+                    while (payload := payloads.get()) is not None:
+                        paper_file_path, prepared = payload
+                        if prepared.paper_metadata is not None:
+                            first_copy = claim(paper_file_path, prepared)
+                            if first_copy:
+                                logger.info("⏭️  Skipping %s: same paper as %s", paper_file_path, first_copy)
+                                finish(paper_file_path, True)
+                                continue
+                        success = writer._store_paper(prepared)
+                        if not success:
+                            release(paper_file_path)
+                        finish(paper_file_path, success)
+            finally:
+                writer.shutdown()
+        
+        # Workers cannot see each other's papers and doi is not unique in the
+        # database, so later copies of a paper in the batch are skipped up front
+        first_copies, sniffed_dois = _find_first_copies(paper_file_paths)
+        for paper_file_path, first_copy in first_copies.items():
+            if first_copy != paper_file_path:
+                logger.info("⏭️  Skipping %s: same paper as %s", paper_file_path, first_copy)
+                results[paper_file_path] = True
+        dispatched = [path for path, first_copy in first_copies.items() if first_copy == path]
+        
+        try:
+            # Set up the schema once here so workers never run the DDL concurrently
+            self._prepare_database()
+            
+            # Look up the DOIs found in the files with one query for the whole batch,
+            # so workers start with their duplicate pre-check already answered
+            logger.info("\n🔍 Checking the batch for papers already stored...")
+            batch_dois = {sniffed_dois[path] for path in dispatched if sniffed_dois[path]}
+            existing = self.repository.find_existing(batch_dois, set())['doi']
+            
+            # Context variables reach neither other processes nor pool threads, so
+            # hand the workers and writers the batch timestamp explicitly
+            timestamp = batch_now()
+            
+            # Created up front so a writer that cannot start fails the batch here,
+            # rather than leaving the queue without a consumer
+            writer_processors = [
+                PaperProcessor(self.schema_name, non_interactive=True, synchronous_commit=self.synchronous_commit)
+                for _ in range(writers)
+            ]
+            for writer in writer_processors:
+                writer._schema_ready = True
+            
+            with ThreadPoolExecutor(max_workers=writers) as writer_pool:
+                writer_futures = [writer_pool.submit(write, writer) for writer in writer_processors]
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=configure_logging,
+                        initargs=(logging.getLogger().getEffectiveLevel(),)
+                    ) as pool:
+                        def submit(paper_file_path: str):
+                            doi = sniffed_dois[paper_file_path]
+                            known_dois = {doi: existing.get(doi)} if doi else {}
+                            return pool.submit(_prepare_one, paper_file_path, self.schema_name, timestamp, known_dois)
+                        
+                        # One paper per worker is in extraction at a time, and the next is only
+                        # dispatched once the previous result is queued for the writers
+                        remaining = iter(dispatched)
+                        pending = {submit(path): path for path in itertools.islice(remaining, workers)}
+                        while pending:
+                            completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in completed:
+                                paper_file_path = pending.pop(future)
+                                try:
+                                    prepared = future.result()
+                                except Exception as e:
+                                    logger.error("\n✗ Error processing %s: %s", paper_file_path, e)
+                                    prepared = None
+                                if prepared is None:
+                                    finish(paper_file_path, False)
+                                else:
+                                    payloads.put((paper_file_path, prepared))
+                                
+                                next_path = next(remaining, None)
+                                if next_path is not None:
+                                    pending[submit(next_path)] = next_path
+                finally:
+                    for _ in writer_futures:
+                        payloads.put(None)
+                
+                for future in writer_futures:
+                    future.result()
             
-            # Step 3: Setup database connection and schema
-            print("\n🗄️  Step 3: Setting up database connection...")
-            self.db_connection.connect()
+        except Exception as e:
+            logger.error("\n✗ Critical error in batch processing: %s", e)
+            for paper_file_path in paper_file_paths:
+                results.setdefault(paper_file_path, False)
+        
+        succeeded = sum(1 for ok in results.values() if ok)
+        logger.info("\n🎉 Batch complete: %s/%s paper(s) processed successfully", succeeded, len(paper_file_paths))
+        return results
+    
+    def _prepare_database(self) -> None:
+        """Connect to the database and make sure the schema exists."""
+        logger.info("\n🗄️  Step 3: Setting up database connection...")
+        self._ensure_connection()
+        
+        logger.info("\n📋 Step 4: Ensuring database schema exists...")
+        self._ensure_schema()
+    
+    def _prepare_paper(self, paper_file_path: str) -> Optional['_PreparedPaper']:
+        """
+        Run the pipeline for a paper up to, but not including, the database writes.
+        
+        The paper is loaded, checked for duplicates and sent through the AI
+        extractions its overwrite choices call for. The database is only read,
+        so process_batch runs this in its worker processes and leaves the writes
+        to its writer threads.
+        
+        Args:
+            paper_file_path: Path to the paper file to process
             
-            print("\n📋 Step 4: Ensuring database schema exists...")
-            self.schema_manager.setup_complete_schema(self.schema_name)
+        Returns:
+            The paper ready for _store_paper, or None if loading or metadata
+            extraction failed
+        """
+        # Steps 3-4 (database connection and schema) don't depend on the AI
+        # output, so run them in the background while the LLM call is in flight
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            database_ready = executor.submit(self._prepare_database)
+            
+            # Step 5 (early): If the file names its DOI, look it up on the database
+            # thread as soon as the schema is ready. A stored paper is reported now
+            # so a skip never pays for the LLM calls
+            sniffed_doi = FileLoader.sniff_doi(paper_file_path)
+            doi_lookup = executor.submit(self._lookup_doi, sniffed_doi) if sniffed_doi else None
+            decision = None
+            if doi_lookup:
+                database_ready.result()
+                sniffed_paper = doi_lookup.result()
+                if sniffed_paper:
+                    decision = self._check_paper_exists(sniffed_doi, sniffed_paper)
+                    if not any(decision[1].values()):
+                        return _PreparedPaper(None, True, dict(decision[1]))
+            
+            # Steps 1-2: Load paper content and extract metadata; the other parts
+            # are only extracted once the duplicate check says they are wanted
+            extracted = self._extract_paper(paper_file_path)
+            
+            # Surface connection/schema errors before touching the database
+            database_ready.result()
+        
+        if not extracted:
+            return None
+        paper_content, paper_metadata = extracted
+        
+        if decision:
+            # Duplicate already handled before extraction. The DOI in the file is a
+            # more reliable key than the one the AI extracted, so keep that match
+            # even when the two differ
+            return self._prepare_storage(paper_content, paper_metadata, sniffed_paper, decision)
+        
+        # Step 5: Check for duplicate papers
+        logger.info("\n🔍 Step 5: Checking for duplicate papers...")
+        doi_checked = doi_lookup is not None and paper_metadata.doi == sniffed_doi
+        existing_paper = self._find_existing_paper(paper_metadata, check_doi=not doi_checked)
+        
+        return self._prepare_storage(paper_content, paper_metadata, existing_paper)
+    
+    def _extract_paper(self, paper_file_path: str) -> Optional[Tuple[str, PaperMetadata]]:
+        """
+        Load a paper file and extract its metadata using AI.
+        
+        Args:
+            paper_file_path: Path to the paper file
             
-            # Step 5: Check for duplicate papers and get user preferences
-            print("\n🔍 Step 5: Checking for duplicate papers...")
-            exists, overwrite_choices = self._check_paper_exists(paper_metadata)
+        Returns:
+            Tuple of (paper_content, paper_metadata) or None if loading or
+            metadata extraction failed
+        """
+        # Step 1: Load paper content
+        logger.info("\n📖 Step 1: Loading paper content...")
+        # A missing file is reported by the loader; no separate existence check
+        paper_content = FileLoader.load_paper_content(paper_file_path)
+        if not paper_content:
+            logger.error("✗ Failed to load paper content")
+            return None
+        
+        # Unchanged content reuses the results of its last extraction
+        content_hash = ExtractionCache.hash_content(paper_content)
+        paper_metadata = self._get_cached(content_hash, 'metadata')
+        if paper_metadata:
+            logger.info("\n⚡ Step 2: Using cached AI extraction for this paper")
+            # The same contents may have been extracted from another path, and the
+            # paper ID is derived from the path as well as the content
+            return paper_content, paper_metadata.model_copy(update={
+                'id': PaperMetadata.generate_id(paper_content, paper_file_path),
+                'source_file': paper_file_path
+            })
+        
+        # Step 2: Extract metadata using AI
+        logger.info("\n🤖 Step 2: Extracting metadata using AI...")
+        paper_metadata = self.extractor.extract_metadata(paper_content, paper_file_path)
+        
+        if not paper_metadata:
+            logger.error("✗ Failed to extract metadata")
+            return None
+        
+        self._put_cached(content_hash, 'metadata', paper_metadata)
+        
+        return paper_content, paper_metadata
+    
+    def _get_cached(self, content_hash: str, step: str) -> Optional[Any]:
+        """
+        Look up the cached result of an extraction step for a paper.
+        
+        Args:
+            content_hash: ExtractionCache.hash_content of the paper
+            step: Extraction step, a key of _CACHE_ADAPTERS
             
-            if exists and not any(overwrite_choices.values()):
-                print("⏭️  Skipping processing - keeping all existing data.")
-                return True
+        Returns:
+            Validated cached result, or None if nothing valid is cached
+        """
+        key = ExtractionCache.make_key(content_hash, step, _step_model(step))
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        
+        try:
+            return _CACHE_ADAPTERS[step].validate_python(cached)
+        except ValidationError:
+            # Written by an older version of the models
+            self.cache.invalidate(key)
+            return None
+    
+    def _put_cached(self, content_hash: str, step: str, result: Any) -> None:
+        """
+        Cache the result of an extraction step for a paper.
+        
+        Failed extractions (None) are not cached, so they are retried. Empty
+        results are, so a paper with nothing to find in a part is not sent to
+        the LLM for it again.
+        
+        Args:
+            content_hash: ExtractionCache.hash_content of the paper
+            step: Extraction step, a key of _CACHE_ADAPTERS
+            result: Extracted model or list of models, or None if extraction failed
+        """
+        if result is None:
+            return
+        key = ExtractionCache.make_key(content_hash, step, _step_model(step))
+        self.cache.put(key, _CACHE_ADAPTERS[step].dump_python(result, mode='json'))
+    
+    async def _extract_paper_content(
+        self, paper_content: str, paper_id: int, wanted: Dict[str, bool]
+    ) -> Tuple[Optional[List[TextSection]], Optional[List[TableData]], Optional[List[ImageData]], Optional[ReferencesData]]:
+        """
+        Run the text section, table, image and references LLM calls concurrently.
+        
+        The calls only read the paper content, so none waits for another. Parts
+        not wanted are not extracted and come back empty, and parts whose
+        extraction failed come back as None. Parts cached from an earlier run
+        of the same content, including parts found to be empty, are not
+        extracted again.
+        
+        Args:
+            paper_content: Full paper content
+            paper_id: ID of the paper the extracted records belong to
+            wanted: Which of 'text_sections', 'tables', 'images' and 'references' to extract
             
-            # Step 6: Handle selective overwrite if needed
-            if exists:
-                print("\n🔄 Step 6: Cleaning up existing data for selective overwrite...")
-                
-                # Delete existing text sections if user chose to overwrite them
-                if overwrite_choices.get('text_sections', False):
-                    print("   Deleting existing text sections...")
-                    self.text_sections_repository.delete_by_paper_id(paper_metadata.id)
-                
-                # Delete existing images if user chose to overwrite them
-                if overwrite_choices.get('images', False):
-                    print("   Deleting existing images...")
-                    self.image_repository.delete_by_paper_id(paper_metadata.id)
-                
-                # Delete existing tables if user chose to overwrite them
-                if overwrite_choices.get('tables', False):
-                    print("   Deleting existing tables...")
-                    self.table_data_repository.delete_tables_by_paper_id(paper_metadata.id)
-                
-                # Delete existing references if user chose to overwrite them
-                if overwrite_choices.get('references', False):
-                    print("   Deleting existing references...")
-                    self.references_repository.delete_by_paper_id(paper_metadata.id)
-                    self.table_data_repository.delete_tables_by_paper_id(paper_metadata.id)
+        Returns:
+            Tuple of (text_sections, tables, images, references)
+        """
+        # Tables and images share one truncated copy of the paper as prompt context
+        context_preview = build_context_preview(paper_content)
+        extractions = {
+            'text_sections': lambda: self.text_extractor.extract_text_sections_async(paper_content, paper_id),
+            'tables': lambda: self.table_extractor.extract_tables_async(paper_content, paper_id, context_preview),
+            'images': lambda: self.image_extractor.extract_images_async(paper_content, paper_id, context_preview),
+            'references': lambda: self.references_extractor.extract_references_async(paper_content, paper_id),
+        }
+        
+        # Unchanged content reuses the results of its last extraction
+        content_hash = ExtractionCache.hash_content(paper_content)
+        calls = []
+        extracted_steps = []
+        for step, extract in extractions.items():
+            if not wanted[step]:
+                calls.append(_resolved(None if step == 'references' else []))
+            elif (cached := self._get_cached(content_hash, step)) is not None:
+                calls.append(_resolved(cached))
+            else:
+                extracted_steps.append(step)
+                calls.append(extract())
+        
+        logger.info("\n🤖 Steps 8-14: Extracting %s using AI...",
+                    ', '.join(step.replace('_', ' ') for step in extracted_steps) or 'nothing')
+        text_sections, tables, images, references = await asyncio.gather(*calls)
+        
+        for step, result in zip(extractions, (text_sections, tables, images, references)):
+            if step in extracted_steps:
+                self._put_cached(content_hash, step, result)
+        
+        # Cached results may belong to another paper ID
+        text_sections, tables, images = (
+            None if records is None else
+            [record if record.paper_id == paper_id else record.model_copy(update={'paper_id': paper_id})
+             for record in records]
+            for records in (text_sections, tables, images)
+        )
+        if references and references.paper_id != paper_id:
+            references = references.model_copy(update={
+                'paper_id': paper_id,
+                'id': ReferencesData.generate_references_id(paper_id, references.reference_count)
+            })
+        
+        return text_sections, tables, images, references
+    
+    def _prepare_storage(self, paper_content: str, paper_metadata: PaperMetadata,
+                         existing_paper: Optional[Dict[str, Any]],
+                         decision: Optional[Tuple[Optional[int], Mapping[str, bool]]] = None) -> '_PreparedPaper':
+        """
+        Settle the overwrite choices for a paper and run the AI extractions they call for.
+        
+        Args:
+            paper_content: Full paper content
+            paper_metadata: Extracted paper metadata
+            existing_paper: Matching stored paper ({'id', 'title', 'doi'}) or None if new
+            decision: Result of _check_paper_exists if the user was already asked
+            
+        Returns:
+            The paper ready for _store_paper
+        """
+        if decision is None:
+            decision = self._check_paper_exists(paper_metadata.doi, existing_paper)
+        existing_id, overwrite_choices = decision
+        exists = existing_id is not None
+        
+        if exists:
+            # Reuse the stored paper ID so updates and child rows target the existing record
+            paper_metadata = paper_metadata.model_copy(update={'id': existing_id})
+        
+        prepared = _PreparedPaper(paper_metadata, exists, dict(overwrite_choices))
+        if exists and not any(overwrite_choices.values()):
+            return prepared
+        
+        # Steps 8, 10, 12 and 14: run the AI extractions still needed concurrently,
+        # before any transaction so none is held open during LLM calls
+        prepared.text_sections, prepared.tables, prepared.images, prepared.references = asyncio.run(
+            self._extract_paper_content(paper_content, paper_metadata.id, prepared.wanted())
+        )
+        return prepared
+    
+    def _store_paper(self, prepared: '_PreparedPaper') -> bool:
+        """
+        Store a prepared paper and its extracted content, honouring its overwrite choices.
+        
+        Expects the schema to be set up already.
+        
+        Args:
+            prepared: Result of _prepare_paper
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        paper_metadata = prepared.paper_metadata
+        exists = prepared.exists
+        overwrite_choices = prepared.overwrite_choices
+        if exists and not any(overwrite_choices.values()):
+            logger.info("⏭️  Skipping processing - keeping all existing data.")
+            return True
+        
+        wanted = prepared.wanted()
+        text_sections, tables, images, references = (
+            prepared.text_sections, prepared.tables, prepared.images, prepared.references
+        )
+        
+        try:
+            self._ensure_connection()
             
-            # Step 7: Insert/Update paper metadata if needed
+            # Steps 6-15 commit one part at a time, so the parts saved before a failure
+            # stay stored; a non-interactive rerun fills in the parts still missing.
+            # Deleting a part and saving its replacement share a transaction so
+            # neither is left half done. A part whose extraction failed is left as stored
+            
+            # Step 7: Insert/Update paper metadata first, as every other part references it
             if not exists or overwrite_choices.get('metadata', False):
-                print(f"\n💾 Step 7: {'Updating' if exists else 'Inserting'} paper metadata...")
-                success = self._save_paper_metadata(paper_metadata, update_existing=exists)
-                if not success:
-                    return False
+                logger.info("\n💾 Step 7: %s paper metadata...", 'Updating' if exists else 'Inserting')
+                with self.db_connection.transaction(synchronous_commit=self.synchronous_commit):
+                    success = self._save_paper_metadata(paper_metadata)
+                    if not success:
+                        raise Exception("Failed to save paper metadata")
             else:
-                print("\n⏭️  Step 7: Skipping paper metadata (keeping existing)")
-            
-            # Step 8: Extract and save text sections if needed
-            if not exists or overwrite_choices.get('text_sections', False):
-                print("\n📝 Step 8: Extracting text sections using AI...")
-                text_sections = self.text_extractor.extract_text_sections(paper_content, paper_metadata.id)
-                
-                if text_sections:
-                    print("\n💾 Step 9: Saving text sections to database...")
-                    sections_success = self.text_sections_repository.save_all(text_sections)
-                    if not sections_success:
-                        print("⚠️  Warning: Failed to save some text sections")
-                else:
-                    print("⚠️  Warning: No text sections extracted")
+                logger.info("\n⏭️  Step 7: Skipping paper metadata (keeping existing)")
+            
+            # Steps 6 and 9: Replace text sections if needed
+            if wanted['text_sections'] and text_sections is None:
+                logger.warning("⚠️  Warning: Text section extraction failed; stored text sections left unchanged")
+            elif wanted['text_sections']:
+                with self.db_connection.transaction(synchronous_commit=self.synchronous_commit):
+                    if exists:
+                        logger.info("\n🔄 Step 6: Deleting existing text sections...")
+                        self.text_sections_repository.delete_by_paper_id(paper_metadata.id)
+                    if text_sections:
+                        logger.info("\n💾 Step 9: Saving text sections to database...")
+                        sections_success = self.text_sections_repository.save_all(text_sections)
+                        if not sections_success:
+                            logger.warning("⚠️  Warning: Failed to save some text sections")
+                    else:
+                        logger.warning("⚠️  Warning: No text sections extracted")
             else:
-                print("\n⏭️  Step 8-9: Skipping text sections (keeping existing)")
-                text_sections = []
-            
-            # Step 10: Extract and save tables if needed
-            if not exists or overwrite_choices.get('tables', False):
-                print("\n📊 Step 10: Extracting tables using AI...")
-                tables = self.table_extractor.extract_tables(paper_content, paper_metadata.id)
-                
-                if tables:
-                    print("\n💾 Step 11: Saving tables to database...")
-                    tables_success = self._save_all_tables(tables)
-                    if not tables_success:
-                        print("⚠️  Warning: Failed to save some tables")
-                else:
-                    print("⚠️  Warning: No tables found or extracted")
+                logger.info("\n⏭️  Step 8-9: Skipping text sections (keeping existing)")
+            
+            # Steps 6 and 11: Replace tables if needed
+            if wanted['tables'] and tables is None:
+                logger.warning("⚠️  Warning: Table extraction failed; stored tables left unchanged")
+            elif wanted['tables']:
+                with self.db_connection.transaction(synchronous_commit=self.synchronous_commit):
+                    if exists:
+                        logger.info("\n🔄 Step 6: Deleting existing tables...")
+                        self.table_data_repository.delete_tables_by_paper_id(paper_metadata.id)
+                    if tables:
+                        logger.info("\n💾 Step 11: Saving tables to database...")
+                        tables_success = self._save_all_tables(tables)
+                        if not tables_success:
+                            logger.warning("⚠️  Warning: Failed to save some tables")
+                    else:
+                        logger.warning("⚠️  Warning: No tables found or extracted")
             else:
-                print("\n⏭️  Step 10-11: Skipping tables (keeping existing)")
-                tables = []
-            
-            # Step 12: Extract and save images if needed
-            if not exists or overwrite_choices.get('images', False):
-                print("\n🖼️  Step 12: Extracting images using AI...")
-                images = self.image_extractor.extract_images(paper_content, paper_metadata.id)
-                
-                if images:
-                    print("\n💾 Step 13: Saving images to database...")
-                    images_success = self.image_repository.save_images(images)
-                    if not images_success:
-                        print("⚠️  Warning: Failed to save some images")
-                else:
-                    print("⚠️  Warning: No images found or extracted")
+                logger.info("\n⏭️  Step 10-11: Skipping tables (keeping existing)")
+            
+            # Steps 6 and 13: Replace images if needed
+            if wanted['images'] and images is None:
+                logger.warning("⚠️  Warning: Image extraction failed; stored images left unchanged")
+            elif wanted['images']:
+                with self.db_connection.transaction(synchronous_commit=self.synchronous_commit):
+                    if exists:
+                        logger.info("\n🔄 Step 6: Deleting existing images...")
+                        self.image_repository.delete_by_paper_id(paper_metadata.id)
+                    if images:
+                        logger.info("\n💾 Step 13: Saving images to database...")
+                        images_success = self.image_repository.save_images(images)
+                        if not images_success:
+                            logger.warning("⚠️  Warning: Failed to save some images")
+                    else:
+                        logger.warning("⚠️  Warning: No images found or extracted")
             else:
-                print("\n⏭️  Step 12-13: Skipping images (keeping existing)")
-                images = []
-            
-            # Step 14: Extract and save references if needed
-            if not exists or overwrite_choices.get('references', False):
-                print("\n📚 Step 14: Extracting references using AI...")
-                references = self.references_extractor.extract_references(paper_content, paper_metadata.id)
-                
-                if references:
-                    print("\n💾 Step 15: Saving references to database...")
-                    references_success = self.references_repository.save_references(references)
-                    if not references_success:
-                        print("⚠️  Warning: Failed to save references")
-                else:
-                    print("⚠️  Warning: No references found or extracted")
+                logger.info("\n⏭️  Step 12-13: Skipping images (keeping existing)")
+            
+            # Steps 6 and 15: Replace references if needed
+            if wanted['references'] and references is None:
+                logger.warning("⚠️  Warning: References extraction failed; stored references left unchanged")
+            elif wanted['references']:
+                with self.db_connection.transaction(synchronous_commit=self.synchronous_commit):
+                    if exists:
+                        logger.info("\n🔄 Step 6: Deleting existing references...")
+                        self.references_repository.delete_by_paper_id(paper_metadata.id)
+                    if references.references:
+                        logger.info("\n💾 Step 15: Saving references to database...")
+                        references_success = self.references_repository.save_references(references)
+                        if not references_success:
+                            logger.warning("⚠️  Warning: Failed to save references")
+                    else:
+                        logger.warning("⚠️  Warning: No references found or extracted")
             else:
-                print("\n⏭️  Step 14-15: Skipping references (keeping existing)")
-                references = None
-            
-            # Commit the transaction
-            if self.db_connection.connection:
-                self.db_connection.connection.commit()
-                
-            print("\n" + "=" * 60)
-            print("🎉 Paper processing completed successfully!")
-            print(f"   📄 Paper metadata: {'Updated' if exists else 'Inserted'}")
-            print(f"   📝 Text sections: {len(text_sections)} sections processed")
-            print(f"   📊 Tables: {len(tables)} tables processed")
-            print(f"   🖼️ Images: {len(images)} images processed")
-            print(f"   📚 References: {references.reference_count if references else 0} references processed")
-            print("=" * 60)
+                logger.info("\n⏭️  Step 14-15: Skipping references (keeping existing)")
+            
+            logger.info("\n" + "=" * 60)
+            logger.info("🎉 Paper processing completed successfully!")
+            logger.info("   📄 Paper metadata: %s", 'Updated' if exists else 'Inserted')
+            logger.info("   📝 Text sections: %s sections processed", len(text_sections or ()))
+            logger.info("   📊 Tables: %s tables processed", len(tables or ()))
+            logger.info("   🖼️ Images: %s images processed", len(images or ()))
+            logger.info("   📚 References: %s references processed", references.reference_count if references else 0)
+            logger.info("=" * 60)
+            
+            if not exists:
+                self._remember_paper({
+                    'id': paper_metadata.id,
+                    'title': paper_metadata.title,
+                    'doi': paper_metadata.doi or 'No DOI'
+                })
             
             return True
             
         except Exception as e:
-            print(f"\n✗ Critical error in paper processing pipeline: {e}")
+            logger.error("\n✗ Error storing paper: %s", e)
             # Rollback on error
             if self.db_connection.connection:
                 self.db_connection.connection.rollback()
             return False
-            
-        finally:
-            self.close_connections()
     
+    @batch_timestamp()
     def process_images_only(self, paper_file_path: str) -> bool:
         """
         Process only images from a paper file.
@@ -228,88 +850,82 @@ class PaperProcessor:
         Returns:
             True if successful, False otherwise
         """
-        print("🚀 Starting image-only processing pipeline...")
-        print("=" * 60)
+        logger.info("🚀 Starting image-only processing pipeline...")
+        logger.info("=" * 60)
         
         try:
-            # Step 1: Validate and load paper content
-            print("\n📖 Step 1: Loading paper content...")
-            if not FileLoader.validate_file_exists(paper_file_path):
-                print(f"✗ Error: Paper file does not exist: {paper_file_path}")
-                return False
-            
+            # Step 1: Load paper content
+            logger.info("\n📖 Step 1: Loading paper content...")
             paper_content = FileLoader.load_paper_content(paper_file_path)
             if not paper_content:
-                print("✗ Failed to load paper content")
+                logger.error("✗ Failed to load paper content")
                 return False
             
             # Step 2: Setup database connection
-            print("\n🗄️  Step 2: Setting up database connection...")
-            self.db_connection.connect()
+            logger.info("\n🗄️  Step 2: Setting up database connection...")
+            self._ensure_connection()
             
-            print("\n📋 Step 3: Ensuring database schema exists...")
-            self.schema_manager.setup_complete_schema(self.schema_name)
+            logger.info("\n📋 Step 3: Ensuring database schema exists...")
+            self._ensure_schema()
             
             # Step 4: Check if paper exists in database
-            print("\n🔍 Step 4: Looking for existing paper in database...")
+            logger.info("\n🔍 Step 4: Looking for existing paper in database...")
             
             # Try to find paper by filename first
             existing_paper = self.repository.find_by_source_file(paper_file_path)
             
             if not existing_paper:
-                print("✗ Paper not found in database. Please process the paper metadata first using the main processor.")
+                logger.error("✗ Paper not found in database. Please process the paper metadata first using the main processor.")
                 return False
             
             paper_id = existing_paper['id']
-            print(f"✓ Found existing paper with ID: {paper_id}")
-            print(f"   Title: {existing_paper['title']}")
+            logger.info("✓ Found existing paper with ID: %s", paper_id)
+            logger.info("   Title: %s", existing_paper['title'])
             
             # Step 5: Check for existing images
             existing_images_count = len(self.image_repository.find_by_paper_id(paper_id))
             if existing_images_count > 0:
-                print(f"\n⚠️  Found {existing_images_count} existing images for this paper.")
+                logger.warning("\n⚠️  Found %s existing images for this paper.", existing_images_count)
                 overwrite = input("Do you want to overwrite existing images? (y/N): ").strip().lower()
                 if overwrite in ['y', 'yes']:
-                    print("   Deleting existing images...")
+                    logger.info("   Deleting existing images...")
                     self.image_repository.delete_by_paper_id(paper_id)
                 else:
-                    print("   Skipping image processing to preserve existing data.")
+                    logger.info("   Skipping image processing to preserve existing data.")
                     return True
             
             # Step 6: Extract and save images
-            print("\n🖼️  Step 6: Extracting images using AI...")
+            logger.info("\n🖼️  Step 6: Extracting images using AI...")
             images = self.image_extractor.extract_images(paper_content, paper_id)
             
             if images:
-                print("\n💾 Step 7: Saving images to database...")
+                logger.info("\n💾 Step 7: Saving images to database...")
                 images_success = self.image_repository.save_images(images)
                 if not images_success:
-                    print("⚠️  Warning: Failed to save some images")
+                    logger.warning("⚠️  Warning: Failed to save some images")
                     return False
             else:
-                print("⚠️  Warning: No images found or extracted")
+                logger.warning("⚠️  Warning: No images found or extracted")
             
             # Commit the transaction
             if self.db_connection.connection:
                 self.db_connection.connection.commit()
                 
-            print("\n" + "=" * 60)
-            print("🎉 Image processing completed successfully!")
-            print(f"   🖼️  Images: {len(images)} images processed")
-            print("=" * 60)
+            logger.info("\n" + "=" * 60)
+            logger.info("🎉 Image processing completed successfully!")
+            logger.info("   🖼️  Images: %s images processed", len(images or ()))
+            logger.info("=" * 60)
             
             return True
             
         except Exception as e:
-            print(f"\n✗ Critical error in image processing pipeline: {e}")
+            logger.error("\n✗ Critical error in image processing pipeline: %s", e)
             # Rollback on error
             if self.db_connection.connection:
                 self.db_connection.connection.rollback()
             return False
-            
-        finally:
-            self.close_connections()
     
+    @batch_timestamp()
     def process_references_only(self, paper_file_path: str) -> bool:
         """
         Process only references from a paper file.
@@ -320,144 +936,219 @@ class PaperProcessor:
         Returns:
             True if successful, False otherwise
         """
-        print("🚀 Starting references-only processing pipeline...")
-        print("=" * 60)
+        logger.info("🚀 Starting references-only processing pipeline...")
+        logger.info("=" * 60)
         
         try:
-            # Step 1: Validate and load paper content
-            print("\n📖 Step 1: Loading paper content...")
-            if not FileLoader.validate_file_exists(paper_file_path):
-                print(f"✗ Error: Paper file does not exist: {paper_file_path}")
-                return False
-            
+            # Step 1: Load paper content
+            logger.info("\n📖 Step 1: Loading paper content...")
             paper_content = FileLoader.load_paper_content(paper_file_path)
             if not paper_content:
-                print("✗ Failed to load paper content")
+                logger.error("✗ Failed to load paper content")
                 return False
             
             # Step 2: Setup database connection
-            print("\n🗄️  Step 2: Setting up database connection...")
-            self.db_connection.connect()
+            logger.info("\n🗄️  Step 2: Setting up database connection...")
+            self._ensure_connection()
             
-            print("\n📋 Step 3: Ensuring database schema exists...")
-            self.schema_manager.setup_complete_schema(self.schema_name)
+            logger.info("\n📋 Step 3: Ensuring database schema exists...")
+            self._ensure_schema()
             
             # Step 4: Check if paper exists in database
-            print("\n🔍 Step 4: Looking for existing paper in database...")
+            logger.info("\n🔍 Step 4: Looking for existing paper in database...")
             
             # Try to find paper by filename first
             existing_paper = self.repository.find_by_source_file(paper_file_path)
             
             if not existing_paper:
-                print("✗ Paper not found in database. Please process the paper metadata first using the main processor.")
+                logger.error("✗ Paper not found in database. Please process the paper metadata first using the main processor.")
                 return False
             
             paper_id = existing_paper['id']
-            print(f"✓ Found existing paper with ID: {paper_id}")
-            print(f"   Title: {existing_paper['title']}")
+            logger.info("✓ Found existing paper with ID: %s", paper_id)
+            logger.info("   Title: %s", existing_paper['title'])
             
             # Step 5: Check for existing references
             existing_references = self.references_repository.find_by_paper_id(paper_id)
             if existing_references:
-                print(f"\n⚠️  Found existing references for this paper.")
+                logger.warning("\n⚠️  Found existing references for this paper.")
                 overwrite = input("Do you want to overwrite existing references? (y/N): ").strip().lower()
                 if overwrite in ['y', 'yes']:
-                    print("   Deleting existing references...")
+                    logger.info("   Deleting existing references...")
                     self.references_repository.delete_by_paper_id(paper_id)
                 else:
-                    print("   Skipping references processing to preserve existing data.")
+                    logger.info("   Skipping references processing to preserve existing data.")
                     return True
             
             # Step 6: Extract and save references
-            print("\n📚 Step 6: Extracting references using AI...")
+            logger.info("\n📚 Step 6: Extracting references using AI...")
             references_data = self.references_extractor.extract_references(paper_content, paper_id)
             
-            if references_data:
-                print("\n💾 Step 7: Saving references to database...")
+            if references_data and references_data.references:
+                logger.info("\n💾 Step 7: Saving references to database...")
                 references_success = self.references_repository.save_references(references_data)
                 if not references_success:
-                    print("⚠️  Warning: Failed to save references")
+                    logger.warning("⚠️  Warning: Failed to save references")
                     return False
                 
-                print(f"✓ Saved references with {len(references_data.references)} items")
+                logger.info("✓ Saved references with %s items", len(references_data.references))
             else:
-                print("⚠️  Warning: No references found or extracted")
+                logger.warning("⚠️  Warning: No references found or extracted")
             
             # Commit the transaction
             if self.db_connection.connection:
                 self.db_connection.connection.commit()
                 
-            print("\n" + "=" * 60)
-            print("🎉 References processing completed successfully!")
-            if references_data:
-                print(f"   📚 References: {len(references_data.references)} references processed")
-            print("=" * 60)
+            logger.info("\n" + "=" * 60)
+            logger.info("🎉 References processing completed successfully!")
+            if references_data and references_data.references:
+                logger.info("   📚 References: %s references processed", len(references_data.references))
+            logger.info("=" * 60)
             
             return True
             
         except Exception as e:
-            print(f"\n✗ Critical error in references processing pipeline: {e}")
+            logger.error("\n✗ Critical error in references processing pipeline: %s", e)
             # Rollback on error
             if self.db_connection.connection:
                 self.db_connection.connection.rollback()
             return False
-            
-        finally:
-            self.close_connections()
 
-    def _check_paper_exists(self, paper_metadata: PaperMetadata) -> Tuple[bool, Dict[str, bool]]:
+    def _lookup_doi(self, doi: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a DOI found in the paper file before any AI call.
+        
+        Args:
+            doi: DOI sniffed from the paper file
+            
+        Returns:
+            Paper data ({'id', 'title', 'doi'}) or None if no stored paper has this DOI
+        """
+        logger.info("\n🔍 Step 5: Checking for duplicate papers (DOI %s found in file)...", doi)
+        if doi in self._known_dois:
+            # Answered once only, since this processor may store the paper afterwards
+            existing_paper = self._known_dois.pop(doi)
+        else:
+            existing_paper = self._seen_dois.get(doi) or self.repository.find_by_doi(doi)
+        if existing_paper:
+            self._remember_paper(existing_paper)
+        return existing_paper
+    
+    def _find_existing_paper(self, paper_metadata: PaperMetadata, check_doi: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored paper matching the metadata by DOI, then by exact title.
+        
+        Args:
+            paper_metadata: Paper metadata to check
+            check_doi: False if the DOI is already known not to be stored
+            
+        Returns:
+            Paper data ({'id', 'title', 'doi'}) or None if the paper is new
+        """
+        existing_paper = self._find_seen_paper(paper_metadata)
+        if existing_paper:
+            return existing_paper
+        
+        if check_doi and paper_metadata.doi:
+            if paper_metadata.title:
+                # DOI (most reliable) and exact title checked in one round trip
+                existing_paper = self.repository.find_by_doi_or_title(paper_metadata.doi, paper_metadata.title)
+            else:
+                existing_paper = self.repository.find_by_doi(paper_metadata.doi)
+        elif paper_metadata.title:
+            # Check by exact title match
+            existing_paper = self.repository.find_by_title(paper_metadata.title)
+        
+        if existing_paper:
+            self._remember_paper(existing_paper)
+        return existing_paper
+    
+    def _find_seen_paper(self, paper_metadata: PaperMetadata) -> Optional[Dict[str, Any]]:
         """
-        Check if paper already exists in database and ask user preference with modular choices.
+        Look up a paper already found or stored by this processor, by DOI then title.
         
         Args:
             paper_metadata: Paper metadata to check
             
         Returns:
-            Tuple of (exists, overwrite_choices_dict)
-            where overwrite_choices_dict contains:
+            Paper data ({'id', 'title', 'doi'}) or None if not seen in this run
+        """
+        existing_paper = None
+        if paper_metadata.doi:
+            existing_paper = self._seen_dois.get(paper_metadata.doi)
+        if not existing_paper and paper_metadata.title:
+            existing_paper = self._seen_titles.get(paper_metadata.title)
+        return existing_paper
+    
+    def _remember_paper(self, existing_paper: Dict[str, Any]) -> None:
+        """
+        Record a stored paper so later duplicate checks in this run skip the database.
+        
+        Only positive matches are remembered; a paper that was not found is
+        always looked up again, so newly stored papers are never missed.
+        
+        Args:
+            existing_paper: Paper data ({'id', 'title', 'doi'})
+        """
+        doi = existing_paper.get('doi')
+        if doi and doi != 'No DOI':
+            self._seen_dois[doi] = existing_paper
+        if existing_paper.get('title'):
+            self._seen_titles[existing_paper['title']] = existing_paper
+    
+    def _check_paper_exists(self, paper_doi: Optional[str],
+                            existing_paper: Optional[Dict[str, Any]]) -> Tuple[Optional[int], Mapping[str, bool]]:
+        """
+        Report an already stored paper and ask user preference with modular choices.
+        
+        In non-interactive mode the parts with nothing stored are chosen
+        without asking.
+        
+        Args:
+            paper_doi: DOI of the paper being processed, if known
+            existing_paper: Matching stored paper ({'id', 'title', 'doi'}) or None if new
+            
+        Returns:
+            Tuple of (existing_paper_id, overwrite_choices_dict)
+            where existing_paper_id is None if the paper is new and overwrite_choices_dict contains:
             - 'metadata': whether to overwrite paper metadata
             - 'text_sections': whether to overwrite text sections  
             - 'tables': whether to overwrite tables
             - 'images': whether to overwrite images
             - 'references': whether to overwrite references
         """
-        doi = paper_metadata.doi
-        title = paper_metadata.title
-        existing_paper = None
-        
-        if doi:
-            # Check by DOI first (most reliable)
-            existing_paper = self.repository.find_by_doi(doi)
-            if existing_paper:
+        if existing_paper:
+            if paper_doi and existing_paper['doi'] == paper_doi:
                 print(f"📄 Paper already exists in database:")
-                print(f"   ID: {existing_paper['id']}")
-                print(f"   Title: {existing_paper['title']}")
-                print(f"   DOI: {existing_paper['doi']}")
-        
-        if not existing_paper and title:
-            # If no DOI match, check by exact title match
-            existing_paper = self.repository.find_by_title(title)
-            if existing_paper:
+            else:
                 print(f"📄 Paper with same title already exists in database:")
-                print(f"   ID: {existing_paper['id']}")
-                print(f"   Title: {existing_paper['title']}")
-                print(f"   DOI: {existing_paper['doi']}")
-        
-        if existing_paper:
-            # Store paper ID for potential updates
-            paper_metadata.id = existing_paper['id']
+            print(f"   ID: {existing_paper['id']}")
+            print(f"   Title: {existing_paper['title']}")
+            print(f"   DOI: {existing_paper['doi']}")
             
-            # Get existing data counts for informed decision
-            text_sections_count = self.text_sections_repository.count_sections_by_paper_id(existing_paper['id'])
-            tables_count = self.table_data_repository.count_tables_by_paper_id(existing_paper['id'])
-            images_count = len(self.image_repository.find_by_paper_id(existing_paper['id']))
-            references_exist = self.references_repository.exists_for_paper(existing_paper['id'])
+            existing_id = existing_paper['id']
+            
+            # Get existing data counts for informed decision, in one round trip
+            existing_data = self.repository.get_existing_data_summary(existing_paper['id'])
             
             print(f"\n📊 Existing data:")
-            print(f"   Text sections: {text_sections_count}")
-            print(f"   Tables: {tables_count}")
-            print(f"   Images: {images_count}")
-            print(f"   References: {'Yes' if references_exist else 'No'}")
+            print(f"   Text sections: {existing_data['text_sections']}")
+            print(f"   Tables: {existing_data['tables']}")
+            print(f"   Images: {existing_data['images']}")
+            print(f"   References: {'Yes' if existing_data['references'] else 'No'}")
+            
+            if self.non_interactive:
+                # Keep stored parts and fill in those with nothing stored. Parts an earlier
+                # run found to be empty come from the extraction cache, so only parts never
+                # extracted successfully are sent to the LLM again
+                missing = [part for part in ('text_sections', 'tables', 'images', 'references')
+                           if not existing_data[part]]
+                if not missing:
+                    logger.info("\n⏭️  Non-interactive mode: skipping paper processing.")
+                    return existing_id, _SKIP_ALL
+                logger.info("\n🔄 Non-interactive mode: filling in missing %s.",
+                            ', '.join(part.replace('_', ' ') for part in missing))
+                return existing_id, _overwrite(*missing)
             
             # Ask user what to overwrite with modular choices
             print("\n❓ What would you like to overwrite?")
@@ -478,57 +1169,31 @@ class PaperProcessor:
                 try:
                     choice = input("Enter choice (1-12): ").strip()
                     
-                    if choice == "1":
-                        return True, {"metadata": False, "text_sections": False, "tables": False, "images": False, "references": False}
-                    elif choice == "2":
-                        return True, {"metadata": False, "text_sections": True, "tables": False, "images": False, "references": False}
-                    elif choice == "3":
-                        return True, {"metadata": False, "text_sections": False, "tables": True, "images": False, "references": False}
-                    elif choice == "4":
-                        return True, {"metadata": False, "text_sections": False, "tables": False, "images": True, "references": False}
-                    elif choice == "5":
-                        return True, {"metadata": False, "text_sections": False, "tables": False, "images": False, "references": True}
-                    elif choice == "6":
-                        return True, {"metadata": False, "text_sections": True, "tables": True, "images": False, "references": False}
-                    elif choice == "7":
-                        return True, {"metadata": False, "text_sections": True, "tables": False, "images": True, "references": False}
-                    elif choice == "8":
-                        return True, {"metadata": False, "text_sections": True, "tables": False, "images": False, "references": True}
-                    elif choice == "9":
-                        return True, {"metadata": False, "text_sections": False, "tables": True, "images": True, "references": False}
-                    elif choice == "10":
-                        return True, {"metadata": False, "text_sections": False, "tables": True, "images": False, "references": True}
-                    elif choice == "11":
-                        return True, {"metadata": False, "text_sections": False, "tables": False, "images": True, "references": True}
-                    elif choice == "12":
-                        return True, {"metadata": True, "text_sections": True, "tables": True, "images": True, "references": True}
-                    else:
-                        print("Invalid choice. Please enter a number between 1-12.")
+                    overwrite_choices = _OVERWRITE_CHOICES.get(choice)
+                    if overwrite_choices is not None:
+                        return existing_id, overwrite_choices
+                    print("Invalid choice. Please enter a number between 1-12.")
                         
                 except KeyboardInterrupt:
                     print("\n⏭️  Operation cancelled. Skipping paper processing.")
-                    return True, {"metadata": False, "text_sections": False, "tables": False, "images": False, "references": False}
+                    return existing_id, _SKIP_ALL
         
-        return False, {"metadata": True, "text_sections": True, "tables": True, "images": True, "references": True}  # doesn't exist, process everything
+        return None, _OVERWRITE_ALL  # doesn't exist, process everything
     
-    def _save_paper_metadata(self, paper_metadata: PaperMetadata, update_existing: bool = False) -> bool:
+    def _save_paper_metadata(self, paper_metadata: PaperMetadata) -> bool:
         """
-        Save paper metadata to database.
+        Save paper metadata to database, overwriting a stored record with the same ID.
         
         Args:
             paper_metadata: Paper metadata to save
-            update_existing: If True, update existing record; if False, insert new record
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            if update_existing:
-                return self.repository.update(paper_metadata)
-            else:
-                return self.repository.save(paper_metadata)
+            return self.repository.save(paper_metadata)
         except Exception as e:
-            print(f"✗ Error saving paper metadata: {e}")
+            logger.error("✗ Error saving paper metadata: %s", e)
             return False
     
     def _save_all_tables(self, tables: List[TableData]) -> bool:
@@ -542,48 +1207,59 @@ class PaperProcessor:
             True if all tables saved successfully, False otherwise
         """
         try:
-            success_count = 0
-            for table in tables:
-                if self.table_data_repository.save_table(table):
-                    print(f"✓ Table '{table.title}' saved successfully")
-                    success_count += 1
-                else:
-                    print(f"✗ Failed to save table '{table.title}'")
+            if not self.table_data_repository.save_tables(tables):
+                logger.error("✗ Failed to save %s tables", len(tables))
+                return False
             
-            print(f"✓ Successfully saved {success_count} of {len(tables)} tables")
-            return success_count == len(tables)
+            logger.info("✓ Successfully saved %s of %s tables", len(tables), len(tables))
+            return True
             
         except Exception as e:
-            print(f"✗ Error saving tables: {e}")
+            logger.error("✗ Error saving tables: %s", e)
             return False
     
     def list_papers(self) -> None:
         """List all papers in the database."""
         try:
             # Ensure connection
-            if not self.db_connection.connection:
-                self.db_connection.connect()
-            
-            papers = self.repository.find_all()
-            
-            if not papers:
+            self._ensure_connection()
+            
+            # Papers are streamed from the database and written a page at a time,
+            # so the listing never holds the whole table in memory
+            page_size = 500
+            lines: List[str] = []
+            count = 0
+            
+            separator = "-" * 100
+            for i, paper in enumerate(self.repository.iter_all_summary(page_size), 1):
+                if i == 1:
+                    lines.append("\n📚 Papers in the database:")
+                    lines.append("=" * 100)
+                count = i
+                authors = ', '.join(paper['first_authors']) if paper['first_authors'] else 'N/A'
+                if paper['total_authors'] and paper['total_authors'] > 3:
+                    authors += f"\n            ... and {paper['total_authors'] - 3} more authors"
+                # One formatted block per paper rather than one append per line
+                lines.append(
+                    f"\n{i}. Paper ID: {paper['id']}\n"
+                    f"   Title: {paper['title']}\n"
+                    f"   Authors: {authors}\n"
+                    f"   Journal: {paper['journal'] or 'N/A'}\n"
+                    f"   Publication Date: {paper['publication_date'] or 'N/A'}\n"
+                    f"   DOI: {paper['doi'] or 'N/A'}\n"
+                    f"   Extracted: {paper['extracted_at']}\n"
+                    f"{separator}"
+                )
+                if len(lines) >= page_size:
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    lines.clear()
+            
+            if not count:
                 print("No papers found in the database.")
                 return
             
-            print(f"\n📚 Found {len(papers)} paper(s) in the database:")
-            print("=" * 100)
-            
-            for i, paper in enumerate(papers, 1):
-                print(f"\n{i}. Paper ID: {paper['id']}")
-                print(f"   Title: {paper['title']}")
-                print(f"   Authors: {', '.join(paper['first_authors']) if paper['first_authors'] else 'N/A'}")
-                if paper['total_authors'] and paper['total_authors'] > 3:
-                    print(f"            ... and {paper['total_authors'] - 3} more authors")
-                print(f"   Journal: {paper['journal'] or 'N/A'}")
-                print(f"   Publication Date: {paper['publication_date'] or 'N/A'}")
-                print(f"   DOI: {paper['doi'] or 'N/A'}")
-                print(f"   Extracted: {paper['extracted_at']}")
-                print("-" * 100)
+            lines.append(f"\n📚 Found {count} paper(s) in the database")
+            sys.stdout.write("\n".join(lines) + "\n")
                 
         except Exception as e:
             print(f"Error listing papers: {e}")
@@ -597,8 +1273,7 @@ class PaperProcessor:
         """
         try:
             # Ensure connection
-            if not self.db_connection.connection:
-                self.db_connection.connect()
+            self._ensure_connection()
             
             paper = self.repository.find_by_id(paper_id)
             
@@ -606,57 +1281,158 @@ class PaperProcessor:
                 print(f"No paper found with ID: {paper_id}")
                 return
             
-            print(f"\n📄 Paper Details:")
-            print("=" * 80)
-            print(f"ID: {paper['id']}")
-            print(f"Title: {paper['title']}")
-            print(f"Authors: {', '.join(paper['authors']) if paper['authors'] else 'N/A'}")
-            print(f"Journal: {paper['journal'] or 'N/A'}")
-            print(f"Publication Date: {paper['publication_date'] or 'N/A'}")
-            print(f"DOI: {paper['doi'] or 'N/A'}")
-            print(f"Volume: {paper['volume'] or 'N/A'}")
-            print(f"Issue: {paper['issue'] or 'N/A'}")
-            print(f"Pages: {paper['pages'] or 'N/A'}")
-            print(f"Keywords: {', '.join(paper['keywords']) if paper['keywords'] else 'N/A'}")
-            print(f"Source File: {paper['source_file']}")
-            print(f"Extracted At: {paper['extracted_at']}")
-            print(f"Created At: {paper['created_at']}")
-            print(f"Updated At: {paper['updated_at']}")
+            # Build the whole report and write it once instead of one print per line
+            lines: List[str] = []
+            lines.append(f"\n📄 Paper Details:")
+            lines.append("=" * 80)
+            lines.append(f"ID: {paper['id']}")
+            lines.append(f"Title: {paper['title']}")
+            lines.append(f"Authors: {', '.join(paper['authors']) if paper['authors'] else 'N/A'}")
+            lines.append(f"Journal: {paper['journal'] or 'N/A'}")
+            lines.append(f"Publication Date: {paper['publication_date'] or 'N/A'}")
+            lines.append(f"DOI: {paper['doi'] or 'N/A'}")
+            lines.append(f"Volume: {paper['volume'] or 'N/A'}")
+            lines.append(f"Issue: {paper['issue'] or 'N/A'}")
+            lines.append(f"Pages: {paper['pages'] or 'N/A'}")
+            lines.append(f"Keywords: {', '.join(paper['keywords']) if paper['keywords'] else 'N/A'}")
+            lines.append(f"Source File: {paper['source_file']}")
+            lines.append(f"Extracted At: {paper['extracted_at']}")
+            lines.append(f"Created At: {paper['created_at']}")
+            lines.append(f"Updated At: {paper['updated_at']}")
             
             if paper['abstract']:
-                print(f"\nAbstract:\n{paper['abstract']}")
+                lines.append(f"\nAbstract:\n{paper['abstract']}")
             
             if paper['funding_sources']:
-                print(f"\nFunding Sources:\n{', '.join(paper['funding_sources'])}")
+                lines.append(f"\nFunding Sources:\n{', '.join(paper['funding_sources'])}")
             
             if paper['conflict_of_interest']:
-                print(f"\nConflict of Interest:\n{paper['conflict_of_interest']}")
+                lines.append(f"\nConflict of Interest:\n{paper['conflict_of_interest']}")
             
             if paper['data_availability']:
-                print(f"\nData Availability:\n{paper['data_availability']}")
+                lines.append(f"\nData Availability:\n{paper['data_availability']}")
             
             if paper['ethics_approval']:
-                print(f"\nEthics Approval:\n{paper['ethics_approval']}")
+                lines.append(f"\nEthics Approval:\n{paper['ethics_approval']}")
             
             if paper['registration_number']:
-                print(f"\nRegistration Number: {paper['registration_number']}")
+                lines.append(f"\nRegistration Number: {paper['registration_number']}")
             
             if paper['supplemental_materials']:
-                print(f"\nSupplemental Materials:")
+                lines.append(f"\nSupplemental Materials:")
                 for i, material in enumerate(paper['supplemental_materials'], 1):
-                    print(f"  {i}. {material}")
+                    lines.append(f"  {i}. {material}")
             
-            print("=" * 80)
+            lines.append("=" * 80)
+            sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
             print(f"Error getting paper details: {e}")
     
+    def shutdown(self) -> None:
+        """
+        Release the processor's database connection back to the pool.
+        
+        The connection otherwise stays open across process_* calls for the
+        lifetime of the processor; prefer using the processor as a context manager.
+        """
+        self.close_connections()
+    
     def close_connections(self) -> None:
         """Close database connections."""
         try:
             self.db_connection.disconnect()
         except Exception as e:
-            print(f"Warning: Error closing database connections: {e}")
+            logger.warning("Warning: Error closing database connections: %s", e)
+
+
+def _prepare_one(paper_file_path: str, schema_name: str, timestamp: datetime,
+                 known_dois: Dict[str, Optional[Dict[str, Any]]]) -> Optional[_PreparedPaper]:
+    """
+    Load, check and extract a single paper in a process_batch worker process.
+    
+    Args:
+        paper_file_path: Path to the paper file
+        schema_name: Name of the database schema to use
+        timestamp: Batch timestamp of the dispatching process
+        known_dois: Batched lookup result for the DOI found in the file, if any
+        
+    Returns:
+        The paper ready for the dispatching process's writers, or None if loading
+        or metadata extraction failed
+    """
+    with PaperProcessor(schema_name, non_interactive=True) as processor:
+        # The parent process set up the schema and looked up the file's DOI
+        # before starting any worker
+        processor._schema_ready = True
+        processor._known_dois.update(known_dois)
+        with batch_timestamp(timestamp):
+            return processor._prepare_paper(paper_file_path)
+
+
+def _find_first_copies(paper_file_paths: List[str]) -> Tuple[Dict[str, str], Dict[str, Optional[str]]]:
+    """
+    Match each paper file to the first file in a batch holding the same paper.
+    
+    Files are the same paper if the DOI in their front matter or their
+    content is the same. Unreadable files only match themselves.
+    
+    Args:
+        paper_file_paths: Paths to the paper files of the batch
+        
+    Returns:
+        Tuple of (first_copies, sniffed_dois): first_copies maps each path to
+        the first path with the same paper, which is the path itself for the
+        first copy; sniffed_dois maps each path to the DOI found in the file
+    """
+    first_by_doi: Dict[str, str] = {}
+    first_by_digest: Dict[str, str] = {}
+    first_copies: Dict[str, str] = {}
+    sniffed_dois: Dict[str, Optional[str]] = {}
+    
+    for paper_file_path in paper_file_paths:
+        if paper_file_path in first_copies:
+            continue
+        sniffed_dois[paper_file_path] = FileLoader.sniff_doi(paper_file_path)
+        doi = sniffed_dois[paper_file_path]
+        if doi:
+            doi = doi.lower()  # DOIs are case-insensitive
+        try:
+            digest = hashlib.sha256()
+            for block in FileLoader.iter_blocks(paper_file_path):
+                digest.update(block)
+            content_digest = digest.hexdigest()
+        except OSError:
+            content_digest = None
+        
+        first_copy = (first_by_doi.get(doi) if doi else None) or \
+            (first_by_digest.get(content_digest) if content_digest else None) or paper_file_path
+        first_copies[paper_file_path] = first_copy
+        if doi:
+            first_by_doi.setdefault(doi, first_copy)
+        if content_digest:
+            first_by_digest.setdefault(content_digest, first_copy)
+    
+    return first_copies, sniffed_dois
+
+
+def _expand_paper_paths(arguments: List[str]) -> List[str]:
+    """
+    Expand command line arguments into paper file paths.
+    
+    Args:
+        arguments: File paths, directories (all .md files inside) or glob patterns
+        
+    Returns:
+        Paper file paths; arguments matching nothing are kept so they are reported as missing
+    """
+    paper_file_paths: List[str] = []
+    for argument in arguments:
+        if os.path.isdir(argument):
+            paper_file_paths.extend(sorted(glob.glob(os.path.join(argument, '*.md'))))
+        else:
+            paper_file_paths.extend(sorted(glob.glob(argument)) or [argument])
+    return paper_file_paths
 
 
 def main():
@@ -664,18 +1440,30 @@ def main():
     # Default paper file path
     default_paper_path = "/home/gusmmm/Desktop/pgsql_train/docs/zanella_2025-with-images.md"
     
-    # Get paper file path from command line argument or use default
-    if len(sys.argv) > 1:
-        paper_file_path = sys.argv[1]
-    else:
-        paper_file_path = default_paper_path
+    # Get paper file paths, directories or glob patterns from the command line, or use default
+    paper_file_paths = _expand_paper_paths(sys.argv[1:]) if len(sys.argv) > 1 else [default_paper_path]
+    if not paper_file_paths:
+        print("✗ Error: No paper files found")
+        sys.exit(1)
     
-    print(f"📄 Processing paper: {paper_file_path}")
+    # Show step-by-step progress for a single paper; batches only report problems
+    if len(paper_file_paths) == 1:
+        configure_logging(logging.INFO)
+    else:
+        configure_logging(logging.WARNING, background=True)
     
     try:
-        # Create and run processor
-        processor = PaperProcessor()
-        success = processor.process_paper(paper_file_path)
+        if len(paper_file_paths) == 1:
+            print(f"📄 Processing paper: {paper_file_paths[0]}")
+            
+            # Create and run processor
+            with PaperProcessor() as processor:
+                success = processor.process_paper(paper_file_paths[0])
+        else:
+            # Several papers: process them in worker processes, skipping ones already stored
+            with PaperProcessor(non_interactive=True) as processor:
+                results = processor.process_batch(paper_file_paths)
+            success = all(results.values())
         
         if success:
             sys.exit(0)
@@ -3,5 +3,11 @@ Utility functions for the paper extraction system.
 """
 
 from .file_utils import FileLoader
+from .text_utils import build_context_preview, CONTEXT_PREVIEW_CHARS
+from .logger import configure_logging, get_logger
+from . import json_fast
+from .extraction_cache import ExtractionCache, DEFAULT_CACHE_DIR
+from .retry import with_retry
 
-__all__ = ['FileLoader']
+__all__ = ['FileLoader', 'build_context_preview', 'CONTEXT_PREVIEW_CHARS', 'configure_logging', 'get_logger', 'json_fast',
+           'ExtractionCache', 'DEFAULT_CACHE_DIR', 'with_retry']
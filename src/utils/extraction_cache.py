@@ -0,0 +1,133 @@
+"""
+On-disk cache for AI extraction results.
+
+This module provides the ExtractionCache class that stores validated extraction
+results as JSON files, so re-running the pipeline on an unchanged paper skips
+its LLM calls.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from . import json_fast
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Used when PAPER_CACHE_DIR is not set
+DEFAULT_CACHE_DIR = '~/.cache/pgsql_train'
+
+# Bump when an extraction prompt or output model changes so older results are not reused
+PROMPT_VERSION = 1
+
+
+class ExtractionCache:
+    """
+    Content-addressed store of AI extraction results.
+
+    Each entry is a JSON file named after its key; keys combine the paper
+    content, the extraction step, the model and the prompt version, so a change
+    to any of them is a cache miss rather than a stale hit.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries; created on first write
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """
+        Compute the SHA-256 digest of paper content.
+
+        Args:
+            content: Paper content
+
+        Returns:
+            Hex digest of the UTF-8 encoded content
+        """
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def make_key(content_hash: str, step: str, model_name: str,
+                 prompt_version: int = PROMPT_VERSION) -> str:
+        """
+        Build the cache key of one extraction step for one paper.
+
+        Args:
+            content_hash: Result of hash_content for the paper
+            step: Extraction step, such as 'metadata' or 'tables'
+            model_name: Model used for the step
+            prompt_version: Version of the step's prompt and output model
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        key_input = f"{content_hash}\0{step}\0{model_name}\0{prompt_version}"
+        return hashlib.sha256(key_input.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Read a cache entry.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached JSON value, or None if there is no readable entry
+        """
+        try:
+            return json_fast.loads(self._path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("⚠️  Ignoring unreadable extraction cache entry %s: %s", key, e)
+            self.invalidate(key)
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Write a cache entry atomically, so readers never see a partial file.
+
+        Args:
+            key: Key from make_key
+            value: JSON-serializable value
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{path.name}.")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(json_fast.dumps(value))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning("⚠️  Could not write extraction cache entry %s: %s", key, e)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a cache entry, for example one that no longer validates.
+
+        Args:
+            key: Key from make_key
+        """
+        try:
+            self._path(key).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("⚠️  Could not remove extraction cache entry %s: %s", key, e)
+
+    def _path(self, key: str) -> Path:
+        """Return the file holding a cache entry."""
+        return self.cache_dir / f"{key}.json"
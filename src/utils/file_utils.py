@@ -4,10 +4,62 @@ File utility functions for paper processing.
 This module provides file loading and handling utilities.
 """
 
+import codecs
+import mmap
 import os
-from typing import Optional
+import re
+import stat
+from functools import lru_cache
+from typing import Iterator, Optional
 from pathlib import Path
 
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# DOI as printed in paper front matter (Crossref recommended pattern)
+_DOI_RE = re.compile(r'10\.\d{4,9}/[-._;()/:A-Z0-9]+', re.IGNORECASE)
+
+# Paper files at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 10 * 1024 * 1024
+
+# Number of recently loaded papers kept in memory by load_paper_content
+CONTENT_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=CONTENT_CACHE_SIZE)
+def _read_paper_content(file_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read and decode a paper file, caching the result per file version.
+    
+    The modification time and size only serve as part of the cache key, so a
+    file changed on disk is read again instead of served from the cache.
+    
+    Args:
+        file_path: Path to the paper file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Paper content with universal newlines
+    """
+    # Decode the whole file at once rather than through the text layer's
+    # chunked reads; large files are decoded straight from a memory map so
+    # no separate bytes copy of the file is held next to the string
+    with open(file_path, 'rb') as f:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, 'utf-8')
+        else:
+            content = f.read().decode('utf-8')
+    
+    # Match text mode's universal newlines
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
 
 class FileLoader:
     """
@@ -19,6 +71,10 @@ class FileLoader:
         """
         Load the content of a paper file.
         
+        The last CONTENT_CACHE_SIZE papers loaded are kept in memory, so loading
+        an unchanged file again, for example for a later image-only run, does
+        not read it from disk.
+        
         Args:
             file_path: Path to the paper file
             
@@ -26,20 +82,95 @@ class FileLoader:
             Paper content if successful, None otherwise
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            print(f"✓ Successfully loaded paper content from: {file_path}")
+            file_stat = os.stat(file_path)
+            content = _read_paper_content(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+            logger.info("✓ Successfully loaded paper content from: %s", file_path)
             return content
         except FileNotFoundError:
-            print(f"✗ Error: Paper file not found at {file_path}")
+            logger.error("✗ Error: Paper file not found at %s", file_path)
+            return None
+        except UnicodeDecodeError:
+            logger.error("✗ Error: Unable to decode file at %s with UTF-8 encoding", file_path)
+            return None
+        except Exception as e:
+            logger.error("✗ Error reading paper file '%s': %s", file_path, e)
+            return None
+    
+    @staticmethod
+    def iter_blocks(file_path: str, block_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Read a file as a stream of fixed-size binary blocks.
+        
+        Args:
+            file_path: Path to the file
+            block_size: Maximum number of bytes per block
+            
+        Yields:
+            Consecutive blocks of the file; the last one may be shorter
+        """
+        with open(file_path, 'rb') as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    return
+                yield block
+    
+    @staticmethod
+    def load_head(file_path: str, max_bytes: int = 128 * 1024) -> Optional[str]:
+        """
+        Load only the beginning of a paper file.
+        
+        Stops reading once max_bytes have been read, so front matter (title,
+        DOI, authors) can be inspected without loading a large paper in full.
+        
+        Args:
+            file_path: Path to the paper file
+            max_bytes: Maximum number of bytes to read
+            
+        Returns:
+            Decoded head of the file if successful, None otherwise
+        """
+        try:
+            # The incremental decoder holds back a multi-byte character cut at the limit
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            parts = []
+            remaining = max_bytes
+            for block in FileLoader.iter_blocks(file_path, min(max_bytes, 64 * 1024)):
+                parts.append(decoder.decode(block[:remaining]))
+                remaining -= len(block)
+                if remaining <= 0:
+                    break
+            return ''.join(parts)
+        except FileNotFoundError:
+            logger.error("✗ Error: Paper file not found at %s", file_path)
             return None
         except UnicodeDecodeError:
-            print(f"✗ Error: Unable to decode file at {file_path} with UTF-8 encoding")
+            logger.error("✗ Error: Unable to decode file at %s with UTF-8 encoding", file_path)
             return None
         except Exception as e:
-            print(f"✗ Error reading paper file '{file_path}': {e}")
+            logger.error("✗ Error reading paper file '%s': %s", file_path, e)
             return None
     
+    @staticmethod
+    def sniff_doi(file_path: str, max_bytes: int = 8 * 1024) -> Optional[str]:
+        """
+        Find the first DOI in the beginning of a paper file without using AI.
+        
+        Args:
+            file_path: Path to the paper file
+            max_bytes: Number of bytes from the start of the file to search
+            
+        Returns:
+            The DOI if one was found, None otherwise
+        """
+        head = FileLoader.load_head(file_path, max_bytes)
+        if not head:
+            return None
+        
+        match = _DOI_RE.search(head)
+        # Sentence punctuation directly after a DOI is matched by the pattern too
+        return match.group(0).rstrip('.,;:') if match else None
+    
     @staticmethod
     def validate_file_exists(file_path: str) -> bool:
         """
@@ -51,7 +182,11 @@ class FileLoader:
         Returns:
             True if file exists, False otherwise
         """
-        return os.path.exists(file_path) and os.path.isfile(file_path)
+        # One stat call instead of exists() followed by isfile()
+        try:
+            return stat.S_ISREG(os.stat(file_path).st_mode)
+        except OSError:
+            return False
     
     @staticmethod
     def get_file_info(file_path: str) -> dict:
@@ -64,16 +199,19 @@ class FileLoader:
         Returns:
             Dictionary with file information
         """
-        if not FileLoader.validate_file_exists(file_path):
-            return {"exists": False}
-        
+        # Existence, type, size and mtime all come from a single stat call
         path_obj = Path(file_path)
-        stat = path_obj.stat()
+        try:
+            file_stat = path_obj.stat()
+        except OSError:
+            return {"exists": False}
+        if not stat.S_ISREG(file_stat.st_mode):
+            return {"exists": False}
         
         return {
             "exists": True,
             "name": path_obj.name,
-            "size": stat.st_size,
-            "modified": stat.st_mtime,
+            "size": file_stat.st_size,
+            "modified": file_stat.st_mtime,
             "absolute_path": str(path_obj.absolute())
         }
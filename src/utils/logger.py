@@ -0,0 +1,87 @@
+"""
+Logging setup for the paper processing system.
+
+This module configures the console output used for pipeline progress messages
+and hands out the module loggers that emit them.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+# Listener draining the log queue while background logging is active
+_listener: Optional[QueueListener] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves message formatting to the listener thread.
+    
+    The default QueueHandler formats every record before queueing it so the
+    record can be pickled; records here never leave the process.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get the logger a module uses for its progress messages.
+    
+    Messages are formatted lazily, so arguments passed as logger.info('%s', x)
+    cost nothing when the level is disabled; nothing is shown until
+    configure_logging() installs a handler.
+    
+    Args:
+        name: Logger name, normally the module's __name__
+        
+    Returns:
+        Logger for the module
+    """
+    return logging.getLogger(name)
+
+
+def configure_logging(level: int = logging.INFO, background: bool = False) -> None:
+    """
+    Send log messages to stdout, next to the pipeline's interactive prompts.
+    
+    Args:
+        level: Minimum level to show; WARNING hides per-step progress
+        background: Format and write messages on a listener thread so workers
+            never block on the console. Ordering relative to print() output is
+            then not guaranteed, so only use it for non-interactive runs.
+    """
+    global _listener
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    if background:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root.handlers = [_DeferredQueueHandler(log_queue)]
+        _listener = QueueListener(log_queue, handler)
+        _listener.start()
+        # Flush whatever is still queued when the interpreter exits
+        atexit.register(_stop_listener)
+    else:
+        root.handlers = [handler]
+
+
+def _stop_listener() -> None:
+    """Stop the background listener after writing all queued messages."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,57 @@
+"""
+Retry helper for transient failures.
+
+This module provides with_retry, which calls a function again after a short
+linear backoff when it fails with an error the caller considers transient.
+"""
+
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+# Retries after the first attempt, and seconds added to the wait per attempt
+DEFAULT_MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 1.0
+
+
+def with_retry(fn: Callable[..., T], *args: Any, max_retries: int = DEFAULT_MAX_RETRIES,
+               should_retry: Optional[Callable[[Exception], bool]] = None, **kwargs: Any) -> T:
+    """
+    Call a function, retrying it when it raises a transient error.
+
+    The n-th retry waits n * RETRY_BACKOFF_SECONDS first.
+
+    Args:
+        fn: Function to call
+        *args: Positional arguments for fn
+        max_retries: Number of retries after the first attempt
+        should_retry: Decides whether an error is worth retrying; every
+            Exception is retried when not given
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Result of the first successful call
+
+    Raises:
+        Exception: The last error, once retries are exhausted or the error is
+            not retryable
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_retries or (should_retry is not None and not should_retry(e)):
+                raise
+            delay = RETRY_BACKOFF_SECONDS * (attempt + 1)
+            logger.warning("⚠️  %s failed (%s), retrying in %gs (%s/%s)...",
+                           getattr(fn, '__qualname__', fn), e, delay, attempt + 1, max_retries)
+            time.sleep(delay)
+    
+    # This should never be reached, but added for type safety
+    raise Exception("Unexpected error in retry loop")
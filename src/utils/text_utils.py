@@ -0,0 +1,22 @@
+"""
+Text utility functions for paper processing.
+
+This module provides helpers for preparing paper content for AI prompts.
+"""
+
+# Number of leading characters of the paper given to the AI as context
+CONTEXT_PREVIEW_CHARS = 3000
+
+
+def build_context_preview(paper_content: str, max_chars: int = CONTEXT_PREVIEW_CHARS) -> str:
+    """
+    Truncate paper content to the context preview shared by the AI prompts.
+    
+    Args:
+        paper_content: Full paper content
+        max_chars: Maximum number of characters to keep
+        
+    Returns:
+        The first max_chars characters, with "..." appended if content was cut
+    """
+    return paper_content[:max_chars] + "..." if len(paper_content) > max_chars else paper_content
@@ -0,0 +1,19 @@
+"""Tests for markdown table detection in the table extractor."""
+
+from src.extraction.table_extractor import _TABLE_RE
+
+
+def test_table_with_trailing_space_after_row():
+    content = '| a | b |\n|---|---|\n| 1 | 2 | \n| 3 | 4 |\n'
+
+    assert _TABLE_RE.findall(content) == [content]
+
+
+def test_separator_row_with_tab():
+    content = 'Intro\n\n| a | b |\n|---|\t---|\n| 1 | 2 |\n| 3 | 4 |'
+
+    assert _TABLE_RE.findall(content) == ['| a | b |\n|---|\t---|\n| 1 | 2 |\n| 3 | 4 |']
+
+
+def test_table_without_data_rows_is_ignored():
+    assert _TABLE_RE.findall('| a | b |\n|---|---|\n\ntext') == []